@@ -1,19 +1,40 @@
 """Art service - orchestrates cache and LLM layers."""
 
 import logging
-from typing import Optional
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 
-from cache import cache_layer
-from llm_providers import query_all_providers
+from cache import CachedResponse, cache_layer
+from config import get_settings
+from llm_providers import FactCheckResponse, load_stored_answers, query_all_providers, store_answers
 from consensus import synthesize_with_claude
-from met_api import search_artwork_images
-from youtube_search import search_music_videos
-from record_sales import lookup_sales_for_tracks
+from hedging import hedging_stats
+from jobs import job_queue
+from lookup_cache import lookup_cache_stats
+from deadline import Deadline, is_timeout
+from enrichment import StageCallback, emit_entries, enrich_entries
 from blog_search import start_background_blog_search
-from models import ArtData, ArtEntry, ArtImage, YouTubeVideo
+from models import ArtData, backfill_sides, blogs_pending
+from single_flight import SingleFlight
+from supervisor import task_supervisor
 
 logger = logging.getLogger(__name__)
 
+# Seconds before an outdated key that is still outdated may be queued again
+REGENERATION_REQUEUE_AFTER = 600.0
+
+
+def _provider_summary(response: FactCheckResponse) -> dict:
+    """Public view of a provider answer for stage events (errors omitted)."""
+    return {
+        "provider": response.provider,
+        "success": response.success,
+        "genre": response.genre,
+        "artists": response.artists,
+        "exampleWork": response.example_work,
+    }
+
 
 class ArtService:
     """
@@ -23,161 +44,153 @@ class ArtService:
     1. Check cache for existing data
     2. If not cached, query 3 LLM providers in parallel
     3. Send responses to Claude for consensus and final writing
-    4. Fetch artwork images from Met API (for Visual Arts)
-    5. Fetch YouTube videos (for Music)
-    6. Cache the result
-    7. Return to user
+    4. Fetch media concurrently: Met images (Visual Arts) or
+       YouTube videos and record sales (Music)
+    5. Cache the result
+    6. Return to user
+
+    Concurrent cache misses for the same key are coalesced so that
+    only one pipeline run happens per key at a time.
     """
+
+    def __init__(self):
+        self._generations = SingleFlight("art-generation", supervisor=task_supervisor)
+        self._backfills = SingleFlight("media-backfill", supervisor=task_supervisor)
+        self._blog_backfills = SingleFlight("blog-backfill", supervisor=task_supervisor)
+        # Enqueue times of recent regenerations, for the per-minute cap
+        self._regenerations: Deque[float] = deque()
+        # When each outdated key was last queued, so repeat hits don't re-queue it
+        self._regenerating: Dict[Tuple[str, str, str], float] = {}
+        self.regenerations_queued = 0
+        self.regenerations_deferred = 0
     
-    async def get_art(self, decade: str, region: str, art_form: str) -> Optional[ArtData]:
+    async def get_cached_response(
+        self, decade: str, region: str, art_form: str
+    ) -> Optional[CachedResponse]:
+        """
+        Fast path for /api/art: a cache hit as the ready-to-send response body.
+
+        Only entries with nothing left to do qualify, i.e. current generation
+        version and no media or blog links still to backfill. Returns None
+        otherwise (including on a miss); get_art then handles the request.
+        """
+        hit = await cache_layer.get_response(decade, region, art_form)
+        if hit is None or hit.pending or hit.generation_version < get_settings().generation_version:
+            return None
+        return hit
+
+    async def get_art(
+        self,
+        decade: str,
+        region: str,
+        art_form: str,
+        on_stage: Optional[StageCallback] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[ArtData]:
         """
         Get art data for the given parameters.
         
         Uses cache if available, otherwise queries LLMs.
-        If cached but media is missing, fetches and updates cache.
+        If cached but media is missing, fetches it and updates the cache -
+        in the background by default, so the cached entry is returned at once.
+
+        on_stage, if given, is called as cache-miss pipeline stages finish
+        ("providers", "entries", "media", "sales"). A request that joins a
+        run already in flight for the same key only sees the final result.
+
+        Every stage runs within the request deadline (`art_request_deadline`
+        unless one is passed in); optional enrichments that could not run in
+        time are listed in the result's `skipped` field.
         """
+        if deadline is None:
+            deadline = Deadline(get_settings().art_request_deadline)
+        
         # Step 1: Check cache
         logger.info(f"Checking cache for {decade}/{region}/{art_form}")
         cached = await cache_layer.get(decade, region, art_form)
         
         if cached:
             logger.info(f"Cache hit for {decade}/{region}/{art_form}")
+
+            if cached.generationVersion < get_settings().generation_version:
+                # Serve the outdated entry now; regenerate it in the background
+                self._schedule_regeneration(cached)
             
-            # Check if we need to fetch media for Visual Arts or Music
-            updated = False
-            popular_entry = cached.popular
-            timeless_entry = cached.timeless
-            
-            if art_form == "Visual Arts":
-                needs_popular_image = cached.popular.image is None
-                needs_timeless_image = cached.timeless.image is None
-                
-                if needs_popular_image or needs_timeless_image:
-                    logger.info(f"Cache hit but missing images, fetching from Met API...")
-                    try:
-                        popular_image, timeless_image = await search_artwork_images(
-                            cached.popular.exampleWork,
-                            cached.timeless.exampleWork,
-                            art_form
-                        )
-                        
-                        if needs_popular_image and popular_image:
-                            popular_entry = ArtEntry(
-                                genre=cached.popular.genre,
-                                artists=cached.popular.artists,
-                                exampleWork=cached.popular.exampleWork,
-                                description=cached.popular.description,
-                                image=ArtImage(
-                                    url=popular_image.thumbnail_url,
-                                    sourceUrl=popular_image.source_url,
-                                ),
-                                youtube=cached.popular.youtube,
-                            )
-                            updated = True
-                        
-                        if needs_timeless_image and timeless_image:
-                            timeless_entry = ArtEntry(
-                                genre=cached.timeless.genre,
-                                artists=cached.timeless.artists,
-                                exampleWork=cached.timeless.exampleWork,
-                                description=cached.timeless.description,
-                                image=ArtImage(
-                                    url=timeless_image.thumbnail_url,
-                                    sourceUrl=timeless_image.source_url,
-                                ),
-                                youtube=cached.timeless.youtube,
-                            )
-                            updated = True
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch images for cached entry: {e}")
-            
-            elif art_form == "Music":
-                needs_popular_youtube = cached.popular.youtube is None
-                needs_timeless_youtube = cached.timeless.youtube is None
-                
-                if needs_popular_youtube or needs_timeless_youtube:
-                    logger.info(f"Cache hit but missing YouTube data, fetching...")
-                    try:
-                        popular_video, timeless_video = await search_music_videos(
-                            cached.popular.exampleWork,
-                            cached.timeless.exampleWork,
-                            decade,
-                            art_form
-                        )
-                        
-                        # Also lookup record sales
-                        popular_sales, timeless_sales = None, None
-                        try:
-                            popular_sales, timeless_sales = await lookup_sales_for_tracks(
-                                cached.popular.exampleWork,
-                                cached.popular.artists,
-                                cached.timeless.exampleWork,
-                                cached.timeless.artists,
-                            )
-                        except Exception as e:
-                            logger.warning(f"Record sales lookup failed: {e}")
-                        
-                        if needs_popular_youtube and popular_video:
-                            popular_entry = ArtEntry(
-                                genre=cached.popular.genre,
-                                artists=cached.popular.artists,
-                                exampleWork=cached.popular.exampleWork,
-                                description=cached.popular.description,
-                                image=cached.popular.image,
-                                youtube=YouTubeVideo(
-                                    videoId=popular_video.video_id,
-                                    title=popular_video.title,
-                                    url=popular_video.url,
-                                    embedUrl=popular_video.embed_url,
-                                    recordSales=popular_sales,
-                                ),
-                            )
-                            updated = True
-                        
-                        if needs_timeless_youtube and timeless_video:
-                            timeless_entry = ArtEntry(
-                                genre=cached.timeless.genre,
-                                artists=cached.timeless.artists,
-                                exampleWork=cached.timeless.exampleWork,
-                                description=cached.timeless.description,
-                                image=cached.timeless.image,
-                                youtube=YouTubeVideo(
-                                    videoId=timeless_video.video_id,
-                                    title=timeless_video.title,
-                                    url=timeless_video.url,
-                                    embedUrl=timeless_video.embed_url,
-                                    recordSales=timeless_sales,
-                                ),
-                            )
-                            updated = True
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch YouTube data for cached entry: {e}")
+            needs_popular, needs_timeless = backfill_sides(cached)
             
-            if updated:
-                # Build updated result and re-cache
-                cached = ArtData(
-                    decade=cached.decade,
-                    region=cached.region,
-                    artForm=cached.artForm,
-                    popular=popular_entry,
-                    timeless=timeless_entry,
-                )
-                await cache_layer.set(cached)
-                logger.info(f"Updated cache with media for {decade}/{region}/{art_form}")
+            if needs_popular or needs_timeless:
+                if get_settings().media_backfill_in_background:
+                    # Stale-while-revalidate: respond now, fill in media later
+                    self._schedule_media_backfill(cached, needs_popular, needs_timeless)
+                else:
+                    logger.info(f"Cache hit but missing media or skipped enrichments, fetching...")
+                    cached = await self._backfill_media(
+                        cached, needs_popular, needs_timeless, deadline
+                    )
+
+            if blogs_pending(cached):
+                # The blog search never ran (or failed) for this entry
+                self._schedule_blog_backfill(cached)
             
             return cached
-        
-        logger.info(f"Cache miss for {decade}/{region}/{art_form}, querying LLMs...")
-        
-        # Step 2: Query all providers in parallel
-        try:
-            popular_responses, timeless_responses = await query_all_providers(
-                decade, region, art_form
+
+        # Step 1b: Don't retry keys that failed recently
+        failure = cache_layer.get_failure(decade, region, art_form)
+        if failure is not None:
+            logger.info(
+                f"Negative cache hit for {decade}/{region}/{art_form}: {failure['reason']} "
+                f"(failure #{failure['failures']})"
             )
-        except Exception as e:
-            logger.error(f"Error querying LLM providers: {e}")
             return None
         
+        # A miss (including after DELETE) always queries the providers;
+        # stored answers are only reused by regenerations and refreshes
+        return await self._generations.do(
+            (decade, region, art_form),
+            lambda: self._generate(decade, region, art_form, deadline, on_stage),
+        )
+
+    async def _generate(
+        self,
+        decade: str,
+        region: str,
+        art_form: str,
+        deadline: Deadline,
+        on_stage: Optional[StageCallback] = None,
+        reuse_answers: bool = False,
+    ) -> Optional[ArtData]:
+        """
+        Run the full LLM + media pipeline for a cache miss and cache the result.
+
+        With reuse_answers, the answers of the latest stored provider run
+        replace the provider queries when they are fresh and cover both
+        query types; otherwise all providers are queried.
+        """
+        stored = None
+        if reuse_answers:
+            stored = await load_stored_answers(decade, region, art_form)
+
+        # Step 2: Query all providers in parallel (or reuse stored answers)
+        if stored is not None:
+            logger.info(f"Reusing stored provider answers for {decade}/{region}/{art_form}")
+            popular_responses, timeless_responses = stored
+        else:
+            logger.info(f"Cache miss for {decade}/{region}/{art_form}, querying LLMs...")
+            try:
+                popular_responses, timeless_responses = await query_all_providers(
+                    decade, region, art_form, deadline=deadline
+                )
+            except Exception as e:
+                logger.error(f"Error querying LLM providers: {e}")
+                if not (deadline.expired or is_timeout(e)):
+                    cache_layer.record_failure(decade, region, art_form, f"providers_error: {e}")
+                return None
+            # Keep the answers so a later refresh can re-run synthesis alone
+            task_supervisor.spawn(
+                store_answers(decade, region, art_form, popular_responses + timeless_responses),
+                name=f"store-answers:{decade}/{region}/{art_form}",
+            )
+        
         # Step 3: Check if we have minimum successful responses (1/3)
         popular_success = sum(1 for r in popular_responses if r.success)
         timeless_success = sum(1 for r in timeless_responses if r.success)
@@ -187,111 +200,49 @@ class ArtService:
         if popular_success < 1 or timeless_success < 1:
             logger.error("Not enough successful provider responses")
             # Log the errors
-            for r in popular_responses + timeless_responses:
-                if not r.success:
-                    logger.error(f"  {r.provider} ({r.query_type}): {r.error}")
+            failed = [r for r in popular_responses + timeless_responses if not r.success]
+            for r in failed:
+                logger.error(f"  {r.provider} ({r.query_type}): {r.error}")
+            # Providers that only ran out of time may well answer on the next try
+            if not (deadline.expired or all(r.timed_out for r in failed)):
+                cache_layer.record_failure(
+                    decade, region, art_form,
+                    f"insufficient_providers: popular {popular_success}/3, timeless {timeless_success}/3",
+                )
             return None
+
+        if on_stage is not None:
+            await on_stage("providers", {
+                "popular": [_provider_summary(r) for r in popular_responses],
+                "timeless": [_provider_summary(r) for r in timeless_responses],
+            })
         
         # Step 4: Synthesize with Claude
+        if deadline.expired:
+            logger.error("Request deadline reached before synthesis")
+            return None
         try:
             logger.info("Synthesizing with Claude...")
             popular_entry, timeless_entry = await synthesize_with_claude(
-                decade, region, art_form, popular_responses, timeless_responses
+                decade, region, art_form, popular_responses, timeless_responses,
+                timeout=deadline.remaining(),
             )
         except Exception as e:
             logger.error(f"Error synthesizing with Claude: {e}")
+            if not (deadline.expired or is_timeout(e)):
+                cache_layer.record_failure(decade, region, art_form, f"synthesis_error: {e}")
             return None
+
+        await emit_entries(on_stage, "entries", popular_entry, timeless_entry)
         
-        # Step 5: Fetch media (images for Visual Arts, YouTube for Music)
-        if art_form == "Visual Arts":
-            try:
-                logger.info("Fetching artwork images from Met API...")
-                popular_image, timeless_image = await search_artwork_images(
-                    popular_entry.exampleWork,
-                    timeless_entry.exampleWork,
-                    art_form
-                )
-                
-                if popular_image:
-                    popular_entry = ArtEntry(
-                        genre=popular_entry.genre,
-                        artists=popular_entry.artists,
-                        exampleWork=popular_entry.exampleWork,
-                        description=popular_entry.description,
-                        image=ArtImage(
-                            url=popular_image.thumbnail_url,
-                            sourceUrl=popular_image.source_url,
-                        )
-                    )
-                
-                if timeless_image:
-                    timeless_entry = ArtEntry(
-                        genre=timeless_entry.genre,
-                        artists=timeless_entry.artists,
-                        exampleWork=timeless_entry.exampleWork,
-                        description=timeless_entry.description,
-                        image=ArtImage(
-                            url=timeless_image.thumbnail_url,
-                            sourceUrl=timeless_image.source_url,
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to fetch artwork images: {e}")
-        
-        elif art_form == "Music":
-            try:
-                logger.info("Fetching YouTube videos...")
-                popular_video, timeless_video = await search_music_videos(
-                    popular_entry.exampleWork,
-                    timeless_entry.exampleWork,
-                    decade,
-                    art_form
-                )
-                
-                # Look up record sales via Perplexity
-                popular_sales, timeless_sales = None, None
-                try:
-                    logger.info("Looking up record sales via Perplexity...")
-                    popular_sales, timeless_sales = await lookup_sales_for_tracks(
-                        popular_entry.exampleWork,
-                        popular_entry.artists,
-                        timeless_entry.exampleWork,
-                        timeless_entry.artists,
-                    )
-                except Exception as e:
-                    logger.warning(f"Record sales lookup failed: {e}")
-                
-                if popular_video:
-                    popular_entry = ArtEntry(
-                        genre=popular_entry.genre,
-                        artists=popular_entry.artists,
-                        exampleWork=popular_entry.exampleWork,
-                        description=popular_entry.description,
-                        youtube=YouTubeVideo(
-                            videoId=popular_video.video_id,
-                            title=popular_video.title,
-                            url=popular_video.url,
-                            embedUrl=popular_video.embed_url,
-                            recordSales=popular_sales,
-                        )
-                    )
-                
-                if timeless_video:
-                    timeless_entry = ArtEntry(
-                        genre=timeless_entry.genre,
-                        artists=timeless_entry.artists,
-                        exampleWork=timeless_entry.exampleWork,
-                        description=timeless_entry.description,
-                        youtube=YouTubeVideo(
-                            videoId=timeless_video.video_id,
-                            title=timeless_video.title,
-                            url=timeless_video.url,
-                            embedUrl=timeless_video.embed_url,
-                            recordSales=timeless_sales,
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to fetch YouTube videos: {e}")
+        # Step 5: Fetch media (images for Visual Arts, YouTube + sales for Music)
+        enriched = await enrich_entries(
+            decade, art_form, popular_entry, timeless_entry,
+            on_stage=on_stage, deadline=deadline,
+        )
+        popular_entry, timeless_entry = enriched.popular, enriched.timeless
+        if enriched.skipped:
+            logger.info(f"Skipped enrichments for {decade}/{region}/{art_form}: {enriched.skipped}")
         
         # Step 6: Build result
         result = ArtData(
@@ -300,20 +251,19 @@ class ArtService:
             artForm=art_form,
             popular=popular_entry,
             timeless=timeless_entry,
+            skipped=enriched.skipped,
+            mediaSearched=True,
+            generationVersion=get_settings().generation_version,
         )
         
-        # Step 7: Cache the result
-        try:
-            await cache_layer.set(result)
+        # Step 7: Cache the result (a failed write is logged; the request still succeeds)
+        if await cache_layer.set(result):
             logger.info(f"Cached result for {decade}/{region}/{art_form}")
-        except Exception as e:
-            logger.warning(f"Failed to cache result: {e}")
-            # Don't fail the request if caching fails
         
-        # Step 8: Start background blog search (fire-and-forget)
+        # Step 8: Queue background blog search
         # This will search for personal blogs and update the cache later
         try:
-            start_background_blog_search(
+            await start_background_blog_search(
                 popular_genre=popular_entry.genre,
                 popular_artists=popular_entry.artists,
                 timeless_genre=timeless_entry.genre,
@@ -329,14 +279,212 @@ class ArtService:
         
         return result
     
+    def _schedule_media_backfill(
+        self, cached: ArtData, needs_popular: bool, needs_timeless: bool
+    ) -> None:
+        """Backfill missing media for a cache entry in the background, once per key."""
+        key = (cached.decade, cached.region, cached.artForm)
+        self._backfills.spawn(
+            key, lambda: self._queue_media_backfill(cached, needs_popular, needs_timeless)
+        )
+
+    async def _queue_media_backfill(
+        self, cached: ArtData, needs_popular: bool, needs_timeless: bool
+    ) -> None:
+        """Enqueue a media backfill job, or run it here if the queue is unavailable."""
+        key = (cached.decade, cached.region, cached.artForm)
+        try:
+            queued = await job_queue.enqueue(
+                "media_backfill",
+                {"decade": key[0], "region": key[1], "art_form": key[2]},
+                dedupe_key=f"media_backfill:{'/'.join(key)}",
+            )
+            if queued:
+                logger.info(f"Queued media backfill for {'/'.join(key)}")
+            return
+        except Exception as e:
+            logger.warning(f"Job queue unavailable, backfilling media in-process: {e}")
+        await self._backfill_media(cached, needs_popular, needs_timeless)
+
+    def _schedule_blog_backfill(self, cached: ArtData) -> None:
+        """Queue the blog search for a cache entry in the background, once per key."""
+        key = (cached.decade, cached.region, cached.artForm)
+        self._blog_backfills.spawn(key, lambda: self._queue_blog_backfill(cached))
+
+    async def _queue_blog_backfill(self, cached: ArtData) -> None:
+        try:
+            await start_background_blog_search(
+                popular_genre=cached.popular.genre,
+                popular_artists=cached.popular.artists,
+                timeless_genre=cached.timeless.genre,
+                timeless_artists=cached.timeless.artists,
+                art_form=cached.artForm,
+                decade=cached.decade,
+                region=cached.region,
+                cache_key=(cached.decade, cached.region, cached.artForm),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to start background blog search: {e}")
+
+    def _schedule_regeneration(self, cached: ArtData) -> None:
+        """
+        Queue an outdated entry for regeneration, within the per-minute cap.
+
+        Entries over the cap are skipped for now and picked up on a later
+        hit, so a version bump rolls out gradually instead of all at once.
+        """
+        settings = get_settings()
+        now = time.monotonic()
+        key = (cached.decade, cached.region, cached.artForm)
+        if now - self._regenerating.get(key, float("-inf")) < REGENERATION_REQUEUE_AFTER:
+            return
+        while self._regenerations and self._regenerations[0] < now - 60.0:
+            self._regenerations.popleft()
+        if len(self._regenerations) >= settings.regeneration_per_minute:
+            self.regenerations_deferred += 1
+            return
+        self._regenerations.append(now)
+        self._regenerating = {
+            k: t for k, t in self._regenerating.items() if now - t < REGENERATION_REQUEUE_AFTER
+        }
+        self._regenerating[key] = now
+        task_supervisor.spawn(
+            self._queue_regeneration(cached, settings.regeneration_reuse_provider_answers),
+            name=f"regenerate:{cached.decade}/{cached.region}/{cached.artForm}",
+        )
+
+    async def _queue_regeneration(self, cached: ArtData, reuse_answers: bool) -> None:
+        key = f"{cached.decade}/{cached.region}/{cached.artForm}"
+        try:
+            if await self.queue_refresh(
+                cached.decade, cached.region, cached.artForm, reuse_answers=reuse_answers
+            ):
+                self.regenerations_queued += 1
+                logger.info(
+                    f"Queued regeneration of {key} "
+                    f"(version {cached.generationVersion} -> {get_settings().generation_version})"
+                )
+        except Exception as e:
+            logger.warning(f"Could not queue regeneration of {key}: {e}")
+
+    async def _run_media_backfill_job(self, payload: dict) -> None:
+        """Job handler: fill in whatever media or skipped enrichments the entry still lacks."""
+        cached = await cache_layer.get(payload["decade"], payload["region"], payload["art_form"])
+        if cached is None:
+            return
+        needs_popular, needs_timeless = backfill_sides(cached)
+        if needs_popular or needs_timeless:
+            await self._backfill_media(cached, needs_popular, needs_timeless)
+
+    async def refresh(
+        self, decade: str, region: str, art_form: str, reuse_answers: Optional[bool] = None
+    ) -> Optional[ArtData]:
+        """
+        Regenerate an entry through the pipeline, replacing the cached one.
+
+        With reuse_answers (default: `refresh_reuse_provider_answers`), stored
+        provider answers are used when available, so only synthesis and
+        enrichment run again.
+        """
+        if reuse_answers is None:
+            reuse_answers = get_settings().refresh_reuse_provider_answers
+        deadline = Deadline(get_settings().art_request_deadline)
+        return await self._generations.do(
+            (decade, region, art_form),
+            lambda: self._generate(decade, region, art_form, deadline, reuse_answers=reuse_answers),
+        )
+
+    async def _run_cache_refresh_job(self, payload: dict) -> None:
+        """Job handler: regenerate a cache entry (retried with backoff on failure)."""
+        result = await self.refresh(
+            payload["decade"], payload["region"], payload["art_form"],
+            reuse_answers=payload.get("reuse_answers"),
+        )
+        if result is None:
+            raise RuntimeError("Pipeline produced no result")
+
+    async def queue_refresh(
+        self, decade: str, region: str, art_form: str, reuse_answers: Optional[bool] = None
+    ) -> bool:
+        """Enqueue a cache refresh. Returns False if one is already queued."""
+        return await job_queue.enqueue(
+            "cache_refresh",
+            {"decade": decade, "region": region, "art_form": art_form, "reuse_answers": reuse_answers},
+            dedupe_key=f"cache_refresh:{decade}/{region}/{art_form}",
+        )
+
+    async def _backfill_media(
+        self,
+        cached: ArtData,
+        needs_popular: bool,
+        needs_timeless: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> ArtData:
+        """Fetch missing media and skipped enrichments for a cached entry and write them back."""
+        enriched = await enrich_entries(
+            cached.decade,
+            cached.artForm,
+            cached.popular,
+            cached.timeless,
+            fetch_popular=needs_popular,
+            fetch_timeless=needs_timeless,
+            deadline=deadline,
+        )
+        
+        if (
+            enriched.popular == cached.popular
+            and enriched.timeless == cached.timeless
+            and enriched.skipped == cached.skipped
+            and cached.mediaSearched
+        ):
+            return cached
+        
+        # Build updated result and re-cache
+        updated = ArtData(
+            decade=cached.decade,
+            region=cached.region,
+            artForm=cached.artForm,
+            popular=enriched.popular,
+            timeless=enriched.timeless,
+            skipped=enriched.skipped,
+            mediaSearched=True,
+            blogsSearched=cached.blogsSearched,
+            generationVersion=cached.generationVersion,
+        )
+        if await cache_layer.set(updated):
+            logger.info(f"Updated cache with media for {cached.decade}/{cached.region}/{cached.artForm}")
+        return updated
+    
     async def invalidate_cache(self, decade: str, region: str, art_form: str) -> bool:
         """Invalidate a specific cache entry."""
         return await cache_layer.delete(decade, region, art_form)
     
+    def failed_keys(self) -> list[dict]:
+        """Keys whose generation failed recently (negative cache)."""
+        return cache_layer.failures()
+
     async def clear_cache(self) -> int:
         """Clear all cached data. Returns count of deleted entries."""
         return await cache_layer.clear_all()
 
+    def stats(self) -> dict:
+        """Pipeline counters for monitoring."""
+        return {
+            "generations": self._generations.stats(),
+            "media_backfills": self._backfills.stats(),
+            "blog_backfills": self._blog_backfills.stats(),
+            "regenerations": {
+                "queued": self.regenerations_queued,
+                "deferred": self.regenerations_deferred,
+            },
+            "cache": cache_layer.stats(),
+            "lookups": lookup_cache_stats(),
+            "providers": hedging_stats(),
+        }
+
 
 # Singleton instance
 art_service = ArtService()
+
+job_queue.register("media_backfill", art_service._run_media_backfill_job, concurrency=4)
+job_queue.register("cache_refresh", art_service._run_cache_refresh_job, concurrency=1)
@@ -0,0 +1,111 @@
+"""Per-hit CPU time of /api/art cache hits, before and after pre-serialization.
+
+Measures only the work done in this process (no database round trip):
+
+- before, L1 hit: parse the L1 bytes into ArtData, wrap in ArtDataResponse,
+  serialize it again and hash the body for the ETag
+- before, DB hit: build ArtData from the ORM row's columns, then the same
+  serialization and hashing
+- after, L1 hit: return the stored body and ETag as they are
+- after, DB hit: parse the stored response_json once to derive version
+  and backfill state, hash it, and keep it in L1
+
+Usage:
+    python benchmarks/bench_cache_hit.py
+    python benchmarks/bench_cache_hit.py --iterations 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cache import CachedResponse, L1Cache, etag_for
+from cache_backends.base import render_response, serialize
+from cache_backends.postgres import _to_art_data
+from database import ArtCache
+from models import ArtData, ArtDataResponse, awaiting_backfill
+
+KEY = ("1960", "North America", "Music")
+
+
+def _row() -> ArtCache:
+    """A fully populated Music entry, as loaded from chrono_art_cache."""
+    columns = {}
+    for side in ("popular", "timeless"):
+        columns.update({
+            f"{side}_genre": "Psychedelic Rock",
+            f"{side}_artists": "The Jimi Hendrix Experience, Jefferson Airplane, The Doors",
+            f"{side}_example_work": "Are You Experienced",
+            f"{side}_description": "Amplified blues, studio experimentation and feedback. " * 8,
+            f"{side}_image_url": None,
+            f"{side}_image_source_url": None,
+            f"{side}_youtube_video_id": "dQw4w9WgXcQ",
+            f"{side}_youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            f"{side}_youtube_embed_url": "https://www.youtube.com/embed/dQw4w9WgXcQ",
+            f"{side}_record_sales": "5 million copies sold",
+            f"{side}_blog_url": "https://example.com/blog/psychedelic-rock",
+        })
+    return ArtCache(decade=KEY[0], region=KEY[1], art_form=KEY[2], generation_version=1, **columns)
+
+
+def _before_l1_hit(raw: bytes) -> tuple:
+    data = ArtData.model_validate_json(raw)
+    body = ArtDataResponse(data=data, found=True).model_dump_json().encode()
+    return body, etag_for(body), awaiting_backfill(data)
+
+
+def _before_db_hit(row: ArtCache) -> tuple:
+    data = _to_art_data(row)
+    body = ArtDataResponse(data=data, found=True).model_dump_json().encode()
+    return body, etag_for(body), awaiting_backfill(data)
+
+
+def _after_l1_hit(l1: L1Cache) -> CachedResponse:
+    return l1.get(KEY)
+
+
+def _after_db_hit(response_json: str) -> CachedResponse:
+    body = response_json.encode()
+    return CachedResponse.build(ArtDataResponse.model_validate_json(body).data, body)
+
+
+def _measure(fn, arg, iterations: int) -> float:
+    """Mean CPU microseconds per call."""
+    for _ in range(min(iterations, 1000)):
+        fn(arg)
+    start = time.process_time()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark /api/art cache-hit CPU time.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    row = _row()
+    data = _to_art_data(row)
+    response_json = render_response(data).decode()
+    l1 = L1Cache(max_bytes=1 << 20, ttl=3600)
+    l1.put(KEY, CachedResponse.build(data))
+
+    results = [
+        ("L1 hit", _measure(_before_l1_hit, serialize(data), args.iterations),
+         _measure(_after_l1_hit, l1, args.iterations)),
+        ("DB hit", _measure(_before_db_hit, row, args.iterations),
+         _measure(_after_db_hit, response_json, args.iterations)),
+    ]
+
+    print(f"Body: {len(response_json)} bytes, {args.iterations} iterations (CPU us per hit)")
+    print(f"{'':8} {'before':>10} {'after':>10} {'speedup':>8}")
+    for name, before, after in results:
+        print(f"{name:8} {before:10.2f} {after:10.2f} {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Peak Python memory of bulk repository operations as tables grow.
+
+For each table size, seeds rows, then measures (with tracemalloc) the peak
+memory allocated by:
+
+- ArtCacheRepository.delete_all (one DELETE statement)
+- EmotionRepository.count (SELECT COUNT(*))
+- EmotionRepository.delete_by_ids (one DELETE ... WHERE id IN)
+
+next to the row-by-row versions they replaced, which load every row into
+the session first. The set-based versions stay flat as the table grows
+(delete_by_ids grows only with the id list it is given).
+
+delete_all clears chrono_art_cache, so this refuses to run without --yes:
+point DATABASE_URL at a scratch database. Seeded emotions use a "bench-"
+id prefix and are removed afterwards.
+
+Usage:
+    python benchmarks/bench_repositories.py --yes
+    python benchmarks/bench_repositories.py --yes --sizes 1000 10000 50000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from database import ArtCache, Emotion, close_db, get_session, init_db
+from repositories import art_cache_repository, emotion_repository
+
+BENCH_PREFIX = "bench-"
+
+
+async def _seed(size: int) -> list[str]:
+    """Fill chrono_art_cache with size rows and add size bench emotions."""
+    entry = {
+        "genre": "Genre", "artists": "Artists", "example_work": "Work",
+        "description": "Description " * 40,
+    }
+    rows = [
+        {
+            "decade": str(1000 + i // 100), "region": f"Region {i % 100}", "art_form": "Bench",
+            **{f"popular_{k}": v for k, v in entry.items()},
+            **{f"timeless_{k}": v for k, v in entry.items()},
+        }
+        for i in range(size)
+    ]
+    await art_cache_repository.upsert_many(rows)
+
+    ids = [f"{BENCH_PREFIX}{i}" for i in range(size)]
+    await emotion_repository.save_many([Emotion(id=i, name=i) for i in ids])
+    return ids
+
+
+async def _delete_all_row_by_row() -> int:
+    """The previous ArtCacheRepository.delete_all."""
+    async for session in get_session():
+        result = await session.execute(select(ArtCache))
+        entries = result.scalars().all()
+        for entry in entries:
+            await session.delete(entry)
+        await session.commit()
+        return len(entries)
+
+
+async def _count_by_loading() -> int:
+    """The previous EmotionRepository.count."""
+    async for session in get_session():
+        result = await session.execute(select(Emotion))
+        return len(result.scalars().all())
+
+
+async def _delete_by_ids_row_by_row(ids: list[str]) -> None:
+    """The previous EmotionRepository.delete_by_ids."""
+    async for session in get_session():
+        result = await session.execute(select(Emotion).where(Emotion.id.in_(ids)))
+        for emotion in result.scalars().all():
+            await session.delete(emotion)
+        await session.commit()
+
+
+async def _measure(coro) -> tuple[float, float]:
+    """(peak MiB allocated, seconds) while awaiting coro."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, elapsed
+
+
+async def run(sizes: list[int]) -> None:
+    await init_db()
+
+    operations = [
+        ("delete_all", lambda ids: art_cache_repository.delete_all(),
+         lambda ids: _delete_all_row_by_row()),
+        ("count", lambda ids: emotion_repository.count(),
+         lambda ids: _count_by_loading()),
+        ("delete_by_ids", lambda ids: emotion_repository.delete_by_ids(ids),
+         lambda ids: _delete_by_ids_row_by_row(ids)),
+    ]
+
+    print(f"{'rows':>8} {'operation':14} {'set-based':>20} {'row-by-row':>20}")
+    for size in sizes:
+        for name, set_based, row_by_row in operations:
+            results = []
+            for fn in (set_based, row_by_row):
+                await art_cache_repository.delete_all()
+                ids = await _seed(size)
+                results.append(await _measure(fn(ids)))
+                await emotion_repository.delete_by_ids(ids)
+            cells = [f"{mib:8.2f} MiB {secs:6.2f}s" for mib, secs in results]
+            print(f"{size:8} {name:14} {cells[0]:>20} {cells[1]:>20}")
+
+    await art_cache_repository.delete_all()
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk repository operations.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--yes", action="store_true",
+                        help="Confirm that chrono_art_cache may be cleared")
+    args = parser.parse_args()
+    if not args.yes:
+        parser.error("this clears chrono_art_cache; run against a scratch database with --yes")
+    asyncio.run(run(args.sizes))
+
+
+if __name__ == "__main__":
+    main()
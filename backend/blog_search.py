@@ -5,10 +5,17 @@ import logging
 from typing import Optional, Tuple
 import httpx
 
+import rate_limit
 from config import get_settings
+from jobs import job_queue
+from lookup_cache import cached_lookup
+from supervisor import task_supervisor
 
 logger = logging.getLogger(__name__)
 
+# Default timeout for the Perplexity request (seconds)
+DEFAULT_TIMEOUT = 30.0
+
 
 async def search_personal_blog(
     genre: str,
@@ -16,21 +23,47 @@ async def search_personal_blog(
     art_form: str,
     decade: str,
     region: str,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> Optional[str]:
     """
     Search for a personal, heartfelt blog post about this genre.
     
     Uses Perplexity (which has web search) to find genuine personal blogs,
-    not Wikipedia, not marketing sites, not databases.
+    not Wikipedia, not marketing sites, not databases. Results (including
+    "none found") are served from the lookup cache when available.
     
     Returns blog URL if found, None otherwise.
     """
+    try:
+        return await _find_personal_blog(genre, artists, art_form, decade, region, timeout)
+    except Exception as e:
+        logger.warning(f"Blog search failed for {genre}: {e}")
+        return None
+
+
+async def _find_personal_blog(
+    genre: str, artists: str, art_form: str, decade: str, region: str, timeout: float
+) -> Optional[str]:
+    """search_personal_blog, but raising on request failure."""
     settings = get_settings()
     
     if not settings.perplexity_api_key:
         logger.warning("Perplexity API key not configured for blog search")
         return None
     
+    return await cached_lookup(
+        "blog",
+        (genre, artists, art_form, decade, region),
+        lambda: _search_personal_blog(genre, artists, art_form, decade, region, timeout),
+    )
+
+
+async def _search_personal_blog(
+    genre: str, artists: str, art_form: str, decade: str, region: str, timeout: float
+) -> Optional[str]:
+    """Ask Perplexity for a blog URL. Raises on request failure."""
+    settings = get_settings()
+    
     # Build search query for personal blogs
     search_query = f"""Find me ONE personal blog post (not Wikipedia, not marketing, not a database or catalog) 
 where someone writes from their heart about {genre} {art_form.lower()} from {region} in the {decade}s.
@@ -47,46 +80,42 @@ Requirements:
 
 Return ONLY the URL of the best matching blog post, nothing else. If you can't find a good personal blog, return "NONE"."""
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.perplexity_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "sonar",  # Has web search
-                    "messages": [
-                        {
-                            "role": "system", 
-                            "content": "You are a helpful assistant that finds personal blog posts. Return only URLs, no explanations."
-                        },
-                        {"role": "user", "content": search_query},
-                    ],
-                    "max_tokens": 200,
-                    "temperature": 0.3,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data["choices"][0]["message"]["content"].strip()
-            
-            # Check if we got a valid URL
-            if result == "NONE" or not result.startswith("http"):
-                logger.info(f"No personal blog found for {genre}")
-                return None
-            
-            # Extract just the URL if there's extra text
-            url = result.split()[0].strip()
-            if url.startswith("http"):
-                logger.info(f"Found personal blog for {genre}: {url}")
-                return url
-            
+    await rate_limit.acquire("perplexity")
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.post(
+            "https://api.perplexity.ai/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.perplexity_api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": "sonar",  # Has web search
+                "messages": [
+                    {
+                        "role": "system", 
+                        "content": "You are a helpful assistant that finds personal blog posts. Return only URLs, no explanations."
+                    },
+                    {"role": "user", "content": search_query},
+                ],
+                "max_tokens": 200,
+                "temperature": 0.3,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data["choices"][0]["message"]["content"].strip()
+        
+        # Check if we got a valid URL
+        if result == "NONE" or not result.startswith("http"):
+            logger.info(f"No personal blog found for {genre}")
             return None
-            
-    except Exception as e:
-        logger.warning(f"Blog search failed for {genre}: {e}")
+        
+        # Extract just the URL if there's extra text
+        url = result.split()[0].strip()
+        if url.startswith("http"):
+            logger.info(f"Found personal blog for {genre}: {url}")
+            return url
+        
         return None
 
 
@@ -103,40 +132,71 @@ async def search_blogs_background(
     """
     Search for blogs for both popular and timeless entries.
     
-    This is meant to be run in the background (fire-and-forget).
-    Results are saved directly to the cache.
+    This is meant to be run in the background (as a queued job).
+    Results are saved directly to the cache, and the entry is marked as
+    searched even if no blog was found. Raises if both searches failed
+    without finding anything, so the job is retried.
     
     Returns (popular_blog_url, timeless_blog_url) for logging purposes.
     """
     logger.info(f"Background blog search starting for {decade}/{region}/{art_form}")
     
     # Search for both in parallel
-    popular_task = search_personal_blog(popular_genre, popular_artists, art_form, decade, region)
-    timeless_task = search_personal_blog(timeless_genre, timeless_artists, art_form, decade, region)
+    popular_task = _find_personal_blog(
+        popular_genre, popular_artists, art_form, decade, region, DEFAULT_TIMEOUT
+    )
+    timeless_task = _find_personal_blog(
+        timeless_genre, timeless_artists, art_form, decade, region, DEFAULT_TIMEOUT
+    )
     
-    popular_url, timeless_url = await asyncio.gather(popular_task, timeless_task)
+    results = await asyncio.gather(popular_task, timeless_task, return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    for error in errors:
+        logger.warning(f"Blog search failed for {decade}/{region}/{art_form}: {error}")
+    popular_url, timeless_url = (None if isinstance(r, Exception) else r for r in results)
+    if errors and not (popular_url or timeless_url):
+        # Nothing to save, and the search did not really run: fail the job so
+        # it is retried, rather than recording the entry as having no blogs
+        raise errors[0]
     
-    # Update cache with blog URLs if found
-    if popular_url or timeless_url:
-        try:
-            from repositories import art_cache_repository
-
-            decade_key, region_key, art_form_key = cache_key
-            updated = await art_cache_repository.update_blog_urls(
-                decade_key, region_key, art_form_key,
-                popular_blog_url=popular_url,
-                timeless_blog_url=timeless_url,
-            )
-            if updated:
-                logger.info(f"Updated cache with blog URLs for {decade}/{region}/{art_form}")
-        except Exception as e:
-            logger.warning(f"Failed to update cache with blog URLs: {e}")
+    # Update cache with any blog URLs found; also records that the search
+    # ran, so an entry without blogs is not searched again on every hit
+    try:
+        from cache import cache_layer
+
+        decade_key, region_key, art_form_key = cache_key
+        updated = await cache_layer.update_blog_urls(
+            decade_key, region_key, art_form_key,
+            popular_blog_url=popular_url,
+            timeless_blog_url=timeless_url,
+        )
+        if updated and (popular_url or timeless_url):
+            logger.info(f"Updated cache with blog URLs for {decade}/{region}/{art_form}")
+    except Exception as e:
+        logger.warning(f"Failed to update cache with blog URLs: {e}")
     
     logger.info(f"Background blog search complete: popular={popular_url is not None}, timeless={timeless_url is not None}")
     return popular_url, timeless_url
 
 
-def start_background_blog_search(
+async def _run_blog_search_job(payload: dict) -> None:
+    """Job handler: run a queued blog search."""
+    await search_blogs_background(
+        payload["popular_genre"],
+        payload["popular_artists"],
+        payload["timeless_genre"],
+        payload["timeless_artists"],
+        payload["art_form"],
+        payload["decade"],
+        payload["region"],
+        tuple(payload["cache_key"]),
+    )
+
+
+job_queue.register("blog_search", _run_blog_search_job, concurrency=4)
+
+
+async def start_background_blog_search(
     popular_genre: str,
     popular_artists: str,
     timeless_genre: str,
@@ -147,12 +207,32 @@ def start_background_blog_search(
     cache_key: Tuple[str, str, str],
 ) -> None:
     """
-    Fire-and-forget blog search.
-    
-    Starts a background task to search for personal blogs.
-    Does not block the main response.
+    Queue a blog search without blocking the main response.
+
+    The search is enqueued as a durable job so it survives restarts and can
+    run on any instance. If the job queue is unavailable (no database), it
+    falls back to an in-process background task.
     """
-    asyncio.create_task(
+    payload = {
+        "popular_genre": popular_genre,
+        "popular_artists": popular_artists,
+        "timeless_genre": timeless_genre,
+        "timeless_artists": timeless_artists,
+        "art_form": art_form,
+        "decade": decade,
+        "region": region,
+        "cache_key": list(cache_key),
+    }
+    try:
+        await job_queue.enqueue(
+            "blog_search", payload, dedupe_key=f"blog_search:{'/'.join(cache_key)}"
+        )
+        logger.info(f"Queued background blog search for {decade}/{region}/{art_form}")
+        return
+    except Exception as e:
+        logger.warning(f"Job queue unavailable, running blog search in-process: {e}")
+
+    task_supervisor.spawn(
         search_blogs_background(
             popular_genre,
             popular_artists,
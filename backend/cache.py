@@ -1,175 +1,346 @@
-"""Cache layer for art data using PostgreSQL."""
+"""Cache layer for art data: an in-process L1 tier over a pluggable backend."""
 
+import hashlib
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Set, Tuple
 
-from database import ArtCache
-from models import ArtData, ArtEntry, ArtImage, YouTubeVideo
-from repositories import art_cache_repository
+from cache_backends import CacheBackend, CacheKey, create_backend
+from cache_backends.base import render_response
+from config import get_settings
+from models import ArtData, ArtDataResponse, awaiting_backfill
 
 logger = logging.getLogger(__name__)
 
 
+def etag_for(body: bytes) -> str:
+    """Strong ETag from a response body's content hash."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cache hit, pre-serialized as the /api/art response body."""
+
+    body: bytes
+    etag: str
+    generation_version: int
+    # Media or blog links may still be backfilled into the entry
+    pending: bool
+    # The parsed entry, shared by every L1 hit (callers must not mutate it)
+    data: ArtData
+
+    @classmethod
+    def build(cls, data: ArtData, body: Optional[bytes] = None) -> "CachedResponse":
+        """Wrap data, rendering its body unless already serialized."""
+        body = body if body is not None else render_response(data)
+        return cls(body, etag_for(body), data.generationVersion, awaiting_backfill(data), data)
+
+
+class L1Cache:
+    """
+    Memory-bounded LRU of pre-serialized responses, in front of the database.
+
+    Entries hold the compact JSON body plus the parsed entry, so hits need
+    no parsing either way. The budget counts body bytes; the parsed entry
+    costs a roughly constant multiple of that on top.
+    Least recently used entries are evicted once max_bytes is exceeded, and
+    entries older than ttl seconds are treated as misses so that writes from
+    other instances become visible.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Return the stored response for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: CacheKey, value: CachedResponse) -> None:
+        """Store value for key, evicting least recently used entries to fit."""
+        if len(value.body) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._bytes += len(value.body)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Drop key if present."""
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].body)
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class NegativeCache:
+    """
+    Short-lived memory of keys whose generation failed, with a reason.
+
+    Each consecutive failure of a key doubles how long it is remembered
+    (base_ttl, 2 * base_ttl, ... up to max_ttl), so a key that keeps failing,
+    e.g. a nonsense region, stops costing provider calls on every request.
+    A success clears the key. At most max_entries keys are tracked.
+    """
+
+    def __init__(self, base_ttl: float, max_ttl: float, max_entries: int = 10000):
+        self.base_ttl = base_ttl
+        self.max_ttl = max_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, dict]" = OrderedDict()
+        self.hits = 0
+
+    def get(self, key: CacheKey) -> Optional[dict]:
+        """The active failure entry for key, or None if it may be retried."""
+        entry = self._entries.get(key)
+        if entry is None or entry["expires_at"] < time.time():
+            return None
+        self.hits += 1
+        return entry
+
+    def record(self, key: CacheKey, reason: str) -> dict:
+        """Remember a failure for key, backing off further on each repeat."""
+        previous = self._entries.pop(key, None)
+        failures = previous["failures"] + 1 if previous else 1
+        ttl = min(self.base_ttl * 2 ** (failures - 1), self.max_ttl)
+        now = time.time()
+        entry = {"reason": reason, "failures": failures, "failed_at": now, "expires_at": now + ttl}
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def discard(self, key: CacheKey) -> bool:
+        """Forget key. Returns True if it was tracked."""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> int:
+        """Forget everything. Returns the number of keys dropped."""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def entries(self) -> list[dict]:
+        """All tracked keys, including ones whose back-off has already expired."""
+        now = time.time()
+        return [
+            {
+                "decade": decade,
+                "region": region,
+                "artForm": art_form,
+                "reason": entry["reason"],
+                "failures": entry["failures"],
+                "retryIn": max(0.0, round(entry["expires_at"] - now, 1)),
+            }
+            for (decade, region, art_form), entry in self._entries.items()
+        ]
+
+
 class CacheLayer:
-    """Cache layer that stores and retrieves art data from PostgreSQL."""
-    
+    """
+    Cache layer that stores and retrieves art data.
+
+    Entries live in a backend chosen by `cache_backend` (PostgreSQL by
+    default; see cache_backends), fronted by the L1 tier.
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.backend: CacheBackend = create_backend(settings.cache_backend)
+        self.l1 = L1Cache(settings.l1_cache_max_bytes, settings.l1_cache_ttl)
+        self.negative = NegativeCache(settings.negative_cache_ttl, settings.negative_cache_max_ttl)
+
+    def _remember(self, data: ArtData, body: Optional[bytes] = None) -> CachedResponse:
+        """Put data in the L1 tier."""
+        hit = CachedResponse.build(data, body)
+        self.l1.put((data.decade, data.region, data.artForm), hit)
+        return hit
+
     async def get(self, decade: str, region: str, art_form: str) -> Optional[ArtData]:
         """
-        Retrieve art data from cache.
+        Retrieve art data from cache, checking the in-process L1 tier first.
 
-        Returns None if not found or if database is unavailable.
+        Returns None if not found or if the backend is unavailable.
         """
-        try:
-            cached = await art_cache_repository.find_by_key(decade, region, art_form)
-
-            if cached:
-                # Build image objects if URLs exist
-                popular_image = None
-                if cached.popular_image_url:
-                    popular_image = ArtImage(
-                        url=cached.popular_image_url,
-                        sourceUrl=cached.popular_image_source_url,
-                    )
-
-                timeless_image = None
-                if cached.timeless_image_url:
-                    timeless_image = ArtImage(
-                        url=cached.timeless_image_url,
-                        sourceUrl=cached.timeless_image_source_url,
-                    )
-
-                # Build YouTube objects if video IDs exist
-                popular_youtube = None
-                if getattr(cached, 'popular_youtube_video_id', None):
-                    popular_youtube = YouTubeVideo(
-                        videoId=cached.popular_youtube_video_id,
-                        title=cached.popular_example_work,
-                        url=cached.popular_youtube_url or "",
-                        embedUrl=cached.popular_youtube_embed_url or "",
-                        recordSales=getattr(cached, 'popular_record_sales', None),
-                    )
-
-                timeless_youtube = None
-                if getattr(cached, 'timeless_youtube_video_id', None):
-                    timeless_youtube = YouTubeVideo(
-                        videoId=cached.timeless_youtube_video_id,
-                        title=cached.timeless_example_work,
-                        url=cached.timeless_youtube_url or "",
-                        embedUrl=cached.timeless_youtube_embed_url or "",
-                        recordSales=getattr(cached, 'timeless_record_sales', None),
-                    )
-
-                return ArtData(
-                    decade=cached.decade,
-                    region=cached.region,
-                    artForm=cached.art_form,
-                    popular=ArtEntry(
-                        genre=cached.popular_genre,
-                        artists=cached.popular_artists,
-                        exampleWork=cached.popular_example_work,
-                        description=cached.popular_description,
-                        image=popular_image,
-                        youtube=popular_youtube,
-                        blogUrl=getattr(cached, 'popular_blog_url', None),
-                    ),
-                    timeless=ArtEntry(
-                        genre=cached.timeless_genre,
-                        artists=cached.timeless_artists,
-                        exampleWork=cached.timeless_example_work,
-                        description=cached.timeless_description,
-                        image=timeless_image,
-                        youtube=timeless_youtube,
-                        blogUrl=getattr(cached, 'timeless_blog_url', None),
-                    ),
-                )
+        hit = self.l1.get((decade, region, art_form))
+        if hit is not None:
+            return hit.data
 
+        try:
+            data = await self.backend.get((decade, region, art_form))
+        except Exception as e:
+            logger.warning(f"Cache get failed ({self.backend.name} unavailable?): {e}")
             return None
+        if data is not None:
+            self._remember(data)
+        return data
+
+    async def get_response(
+        self, decade: str, region: str, art_form: str
+    ) -> Optional[CachedResponse]:
+        """
+        A hit as its pre-serialized /api/art body, without building ArtData.
+
+        L1 hits cost a dict lookup. Backend hits read only the stored body,
+        parsed once to derive the entry's version and backfill state.
+        Returns None if not found or if the backend is unavailable.
+        """
+        key = (decade, region, art_form)
+        hit = self.l1.get(key)
+        if hit is not None:
+            return hit
+
+        try:
+            body = await self.backend.get_response(key)
         except Exception as e:
-            logger.warning(f"Cache get failed (database unavailable?): {e}")
+            logger.warning(f"Cache get_response failed ({self.backend.name} unavailable?): {e}")
             return None
-    
-    async def set(self, data: ArtData) -> None:
-        """Store art data in cache. Silently fails if database unavailable."""
+        if body is None:
+            return None
+        return self._remember(ArtDataResponse.model_validate_json(body).data, body)
+
+    async def contains(self, decade: str, region: str, art_form: str) -> bool:
+        """Whether an entry is cached. Unlike get(), raises if the backend is unavailable."""
+        key = (decade, region, art_form)
+        if self.l1.get(key) is not None:
+            return True
+        return await self.backend.get_response(key) is not None
+
+    async def use_backend(self, backend: CacheBackend) -> None:
+        """Switch to another backend (e.g. a local fallback when the database is down)."""
+        previous, self.backend = self.backend, backend
+        self.l1.clear()
+        await previous.close()
+        logger.info(f"Cache backend: {backend.name}")
+
+    async def close(self) -> None:
+        """Release the backend's connections."""
+        await self.backend.close()
+
+    async def set(self, data: ArtData) -> bool:
+        """
+        Store art data in cache. Returns False if the backend is unavailable.
+
+        The L1 tier is only filled once the backend write succeeded, so an
+        entry that was never stored is not served as if it were.
+        """
+        self.negative.discard((data.decade, data.region, data.artForm))
         try:
-            existing = await art_cache_repository.find_by_key(
-                data.decade, data.region, data.artForm
-            )
-
-            # Extract image data
-            popular_image_url = data.popular.image.url if data.popular.image else None
-            popular_image_source = data.popular.image.sourceUrl if data.popular.image else None
-            timeless_image_url = data.timeless.image.url if data.timeless.image else None
-            timeless_image_source = data.timeless.image.sourceUrl if data.timeless.image else None
-
-            # Extract YouTube data
-            pop_youtube = data.popular.youtube
-            time_youtube = data.timeless.youtube
-
-            if existing:
-                # Update existing
-                existing.popular_genre = data.popular.genre
-                existing.popular_artists = data.popular.artists
-                existing.popular_example_work = data.popular.exampleWork
-                existing.popular_description = data.popular.description
-                existing.popular_image_url = popular_image_url
-                existing.popular_image_source_url = popular_image_source
-                existing.popular_youtube_video_id = pop_youtube.videoId if pop_youtube else None
-                existing.popular_youtube_url = pop_youtube.url if pop_youtube else None
-                existing.popular_youtube_embed_url = pop_youtube.embedUrl if pop_youtube else None
-                existing.popular_record_sales = pop_youtube.recordSales if pop_youtube else None
-                existing.popular_blog_url = data.popular.blogUrl
-                existing.timeless_genre = data.timeless.genre
-                existing.timeless_artists = data.timeless.artists
-                existing.timeless_example_work = data.timeless.exampleWork
-                existing.timeless_description = data.timeless.description
-                existing.timeless_image_url = timeless_image_url
-                existing.timeless_image_source_url = timeless_image_source
-                existing.timeless_youtube_video_id = time_youtube.videoId if time_youtube else None
-                existing.timeless_youtube_url = time_youtube.url if time_youtube else None
-                existing.timeless_youtube_embed_url = time_youtube.embedUrl if time_youtube else None
-                existing.timeless_record_sales = time_youtube.recordSales if time_youtube else None
-                existing.timeless_blog_url = data.timeless.blogUrl
-                await art_cache_repository.save(existing)
-            else:
-                # Insert new
-                cache_entry = ArtCache(
-                    decade=data.decade,
-                    region=data.region,
-                    art_form=data.artForm,
-                    popular_genre=data.popular.genre,
-                    popular_artists=data.popular.artists,
-                    popular_example_work=data.popular.exampleWork,
-                    popular_description=data.popular.description,
-                    popular_image_url=popular_image_url,
-                    popular_image_source_url=popular_image_source,
-                    popular_youtube_video_id=pop_youtube.videoId if pop_youtube else None,
-                    popular_youtube_url=pop_youtube.url if pop_youtube else None,
-                    popular_youtube_embed_url=pop_youtube.embedUrl if pop_youtube else None,
-                    popular_record_sales=pop_youtube.recordSales if pop_youtube else None,
-                    popular_blog_url=data.popular.blogUrl,
-                    timeless_genre=data.timeless.genre,
-                    timeless_artists=data.timeless.artists,
-                    timeless_example_work=data.timeless.exampleWork,
-                    timeless_description=data.timeless.description,
-                    timeless_image_url=timeless_image_url,
-                    timeless_image_source_url=timeless_image_source,
-                    timeless_youtube_video_id=time_youtube.videoId if time_youtube else None,
-                    timeless_youtube_url=time_youtube.url if time_youtube else None,
-                    timeless_youtube_embed_url=time_youtube.embedUrl if time_youtube else None,
-                    timeless_record_sales=time_youtube.recordSales if time_youtube else None,
-                    timeless_blog_url=data.timeless.blogUrl,
-                )
-                await art_cache_repository.save(cache_entry)
+            await self.backend.set(data)
         except Exception as e:
-            logger.warning(f"Cache set failed (database unavailable?): {e}")
+            logger.warning(f"Cache set failed ({self.backend.name} unavailable?): {e}")
+            return False
+        self._remember(data)
+        return True
     
+    async def update_blog_urls(
+        self,
+        decade: str,
+        region: str,
+        art_form: str,
+        popular_blog_url: Optional[str] = None,
+        timeless_blog_url: Optional[str] = None,
+    ) -> bool:
+        """
+        Attach blog URLs to a cached entry. Returns True if it was updated.
+
+        The backend updates only the blog links, atomically, so a concurrent
+        regeneration or backfill is never overwritten with an older entry.
+        """
+        key = (decade, region, art_form)
+        try:
+            return await self.backend.update_blog_urls(key, popular_blog_url, timeless_blog_url)
+        except Exception as e:
+            logger.warning(f"Cache update_blog_urls failed ({self.backend.name} unavailable?): {e}")
+            return False
+        finally:
+            # After the write, so a concurrent read cannot re-cache the old entry
+            self.l1.invalidate(key)
+
+    def get_failure(self, decade: str, region: str, art_form: str) -> Optional[dict]:
+        """The remembered failure for a key, if it is still backing off."""
+        return self.negative.get((decade, region, art_form))
+
+    def record_failure(self, decade: str, region: str, art_form: str, reason: str) -> None:
+        """Remember that generating a key failed, so it is not retried right away."""
+        entry = self.negative.record((decade, region, art_form), reason)
+        logger.info(
+            f"Negative-cached {decade}/{region}/{art_form} ({reason}), "
+            f"failure #{entry['failures']}, retry in {entry['expires_at'] - time.time():.0f}s"
+        )
+
+    def failures(self) -> list[dict]:
+        """All remembered failures, for the admin endpoint."""
+        return self.negative.entries()
+
     async def delete(self, decade: str, region: str, art_form: str) -> bool:
-        """Delete art data from cache. Returns True if deleted."""
-        return await art_cache_repository.delete_by_key(decade, region, art_form)
+        """Delete art data (and any remembered failure) from cache. Returns True if deleted."""
+        self.negative.discard((decade, region, art_form))
+        deleted = await self.backend.delete((decade, region, art_form))
+        self.l1.invalidate((decade, region, art_form))
+        return deleted
+
+    async def keys(self) -> Set[CacheKey]:
+        """All cached (decade, region, art_form) keys. Raises if the backend cannot be read."""
+        return await self.backend.scan()
 
     async def clear_all(self) -> int:
-        """Clear all cached data. Returns count of deleted entries."""
-        return await art_cache_repository.delete_all()
+        """Clear all cached data, including remembered failures. Returns count of deleted entries."""
+        self.negative.clear()
+        count = await self.backend.clear()
+        self.l1.clear()
+        return count
+
+    def stats(self) -> dict:
+        """L1 tier and negative cache counters for monitoring."""
+        return {
+            **self.l1.stats(),
+            "negative_entries": len(self.negative),
+            "negative_hits": self.negative.hits,
+        }
 
 
 # Singleton instance
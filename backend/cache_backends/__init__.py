@@ -0,0 +1,33 @@
+"""Interchangeable storage backends for the art cache."""
+
+from cache_backends.base import CacheBackend, CacheKey
+from cache_backends.memory import MemoryBackend
+from cache_backends.postgres import PostgresBackend
+from cache_backends.redis import RedisBackend
+from cache_backends.sqlite import SQLiteBackend
+from config import get_settings
+
+
+def create_backend(name: str) -> CacheBackend:
+    """Build the backend called name ("postgres", "sqlite", "redis" or "memory")."""
+    settings = get_settings()
+    if name == "postgres":
+        return PostgresBackend()
+    if name == "sqlite":
+        return SQLiteBackend(settings.sqlite_cache_path)
+    if name == "redis":
+        return RedisBackend(settings.redis_url, max_connections=settings.redis_max_connections)
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheKey",
+    "MemoryBackend",
+    "PostgresBackend",
+    "RedisBackend",
+    "SQLiteBackend",
+    "create_backend",
+]
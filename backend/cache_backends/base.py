@@ -0,0 +1,95 @@
+"""Interface shared by all cache backends."""
+
+from typing import Optional, Protocol, Set, Tuple
+
+from models import ArtData
+
+# (decade, region, art_form)
+CacheKey = Tuple[str, str, str]
+
+
+class CacheBackend(Protocol):
+    """
+    Durable storage for art cache entries, behind CacheLayer.
+
+    Methods may raise on storage errors; CacheLayer logs them and treats
+    the cache as unavailable for that call.
+    """
+
+    name: str
+
+    async def get(self, key: CacheKey) -> Optional[ArtData]:
+        """The entry for key, or None if absent."""
+        ...
+
+    async def get_response(self, key: CacheKey) -> Optional[bytes]:
+        """The entry as a pre-serialized /api/art body (see render_response), or None."""
+        ...
+
+    async def set(self, data: ArtData) -> None:
+        """Insert or replace the entry for data's key."""
+        ...
+
+    async def update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        """
+        Set the given (non-None) blog URLs on an existing entry and mark its
+        blog search done.
+
+        Atomic with respect to concurrent writes of the same entry: the rest
+        of the entry is never replaced with an older copy. Returns False if
+        the entry does not exist.
+        """
+        ...
+
+    async def delete(self, key: CacheKey) -> bool:
+        """Delete an entry. Returns True if it existed."""
+        ...
+
+    async def clear(self) -> int:
+        """Delete all entries. Returns the number deleted."""
+        ...
+
+    async def scan(self) -> Set[CacheKey]:
+        """All stored keys."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections or files."""
+        ...
+
+
+def with_blog_urls(data: ArtData, popular: Optional[str], timeless: Optional[str]) -> ArtData:
+    """data with the given (non-None) blog URLs set and its blog search marked done."""
+    data = data.model_copy(update={"blogsSearched": True})
+    if popular:
+        data = data.model_copy(update={"popular": data.popular.model_copy(update={"blogUrl": popular})})
+    if timeless:
+        data = data.model_copy(update={"timeless": data.timeless.model_copy(update={"blogUrl": timeless})})
+    return data
+
+
+def serialize(data: ArtData) -> bytes:
+    """Compact JSON for backends that store whole entries."""
+    return data.model_dump_json().encode()
+
+
+def deserialize(raw: bytes) -> ArtData:
+    """Inverse of serialize()."""
+    return ArtData.model_validate_json(raw)
+
+
+def render_response(data: ArtData) -> bytes:
+    """
+    The /api/art body for a cached entry: ArtDataResponse(data, found=True).
+
+    Built from serialize() so every backend produces byte-identical bodies
+    (and so identical ETags) for the same entry.
+    """
+    return wrap_response(serialize(data))
+
+
+def wrap_response(raw: bytes) -> bytes:
+    """render_response() for an entry already in serialize() form."""
+    return b'{"data":' + raw + b',"found":true}'
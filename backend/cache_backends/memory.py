@@ -0,0 +1,50 @@
+"""In-memory backend: per-process, lost on restart."""
+
+from typing import Dict, Optional, Set
+
+from cache_backends.base import CacheKey, deserialize, serialize, with_blog_urls, wrap_response
+from models import ArtData
+
+
+class MemoryBackend:
+    """Keeps serialized entries in a dict. For tests and single-process dev."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._entries: Dict[CacheKey, bytes] = {}
+
+    async def get(self, key: CacheKey) -> Optional[ArtData]:
+        raw = self._entries.get(key)
+        return deserialize(raw) if raw is not None else None
+
+    async def get_response(self, key: CacheKey) -> Optional[bytes]:
+        raw = self._entries.get(key)
+        return wrap_response(raw) if raw is not None else None
+
+    async def set(self, data: ArtData) -> None:
+        self._entries[(data.decade, data.region, data.artForm)] = serialize(data)
+
+    async def update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        # No await between read and write, so nothing can interleave
+        raw = self._entries.get(key)
+        if raw is None:
+            return False
+        self._entries[key] = serialize(with_blog_urls(deserialize(raw), popular, timeless))
+        return True
+
+    async def delete(self, key: CacheKey) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    async def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    async def scan(self) -> Set[CacheKey]:
+        return set(self._entries)
+
+    async def close(self) -> None:
+        pass
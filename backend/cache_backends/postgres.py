@@ -0,0 +1,168 @@
+"""PostgreSQL backend: the chrono_art_cache table."""
+
+import logging
+from typing import Optional, Set
+
+from cache_backends.base import CacheKey, render_response
+from database import ArtCache
+from models import ArtData, ArtEntry, ArtImage, YouTubeVideo
+from repositories import art_cache_repository
+
+logger = logging.getLogger(__name__)
+
+
+def _to_art_data(row: ArtCache) -> ArtData:
+    """Build the ArtData for a chrono_art_cache row."""
+    # Build image objects if URLs exist
+    popular_image = None
+    if row.popular_image_url:
+        popular_image = ArtImage(
+            url=row.popular_image_url,
+            sourceUrl=row.popular_image_source_url,
+        )
+
+    timeless_image = None
+    if row.timeless_image_url:
+        timeless_image = ArtImage(
+            url=row.timeless_image_url,
+            sourceUrl=row.timeless_image_source_url,
+        )
+
+    # Build YouTube objects if video IDs exist
+    popular_youtube = None
+    if getattr(row, 'popular_youtube_video_id', None):
+        popular_youtube = YouTubeVideo(
+            videoId=row.popular_youtube_video_id,
+            title=row.popular_example_work,
+            url=row.popular_youtube_url or "",
+            embedUrl=row.popular_youtube_embed_url or "",
+            recordSales=getattr(row, 'popular_record_sales', None),
+        )
+
+    timeless_youtube = None
+    if getattr(row, 'timeless_youtube_video_id', None):
+        timeless_youtube = YouTubeVideo(
+            videoId=row.timeless_youtube_video_id,
+            title=row.timeless_example_work,
+            url=row.timeless_youtube_url or "",
+            embedUrl=row.timeless_youtube_embed_url or "",
+            recordSales=getattr(row, 'timeless_record_sales', None),
+        )
+
+    return ArtData(
+        decade=row.decade,
+        region=row.region,
+        artForm=row.art_form,
+        popular=ArtEntry(
+            genre=row.popular_genre,
+            artists=row.popular_artists,
+            exampleWork=row.popular_example_work,
+            description=row.popular_description,
+            image=popular_image,
+            youtube=popular_youtube,
+            blogUrl=getattr(row, 'popular_blog_url', None),
+        ),
+        timeless=ArtEntry(
+            genre=row.timeless_genre,
+            artists=row.timeless_artists,
+            exampleWork=row.timeless_example_work,
+            description=row.timeless_description,
+            image=timeless_image,
+            youtube=timeless_youtube,
+            blogUrl=getattr(row, 'timeless_blog_url', None),
+        ),
+        skipped=row.skipped.split(",") if getattr(row, "skipped", None) else [],
+        mediaSearched=bool(getattr(row, "media_searched", False)),
+        blogsSearched=bool(getattr(row, "blogs_searched", False)),
+        generationVersion=row.generation_version,
+    )
+
+
+def to_columns(data: ArtData) -> dict:
+    """Column values of the chrono_art_cache row for data."""
+    pop_image, time_image = data.popular.image, data.timeless.image
+    pop_youtube, time_youtube = data.popular.youtube, data.timeless.youtube
+    return {
+        "decade": data.decade,
+        "region": data.region,
+        "art_form": data.artForm,
+        "popular_genre": data.popular.genre,
+        "popular_artists": data.popular.artists,
+        "popular_example_work": data.popular.exampleWork,
+        "popular_description": data.popular.description,
+        "popular_image_url": pop_image.url if pop_image else None,
+        "popular_image_source_url": pop_image.sourceUrl if pop_image else None,
+        "popular_youtube_video_id": pop_youtube.videoId if pop_youtube else None,
+        "popular_youtube_url": pop_youtube.url if pop_youtube else None,
+        "popular_youtube_embed_url": pop_youtube.embedUrl if pop_youtube else None,
+        "popular_record_sales": pop_youtube.recordSales if pop_youtube else None,
+        "popular_blog_url": data.popular.blogUrl,
+        "timeless_genre": data.timeless.genre,
+        "timeless_artists": data.timeless.artists,
+        "timeless_example_work": data.timeless.exampleWork,
+        "timeless_description": data.timeless.description,
+        "timeless_image_url": time_image.url if time_image else None,
+        "timeless_image_source_url": time_image.sourceUrl if time_image else None,
+        "timeless_youtube_video_id": time_youtube.videoId if time_youtube else None,
+        "timeless_youtube_url": time_youtube.url if time_youtube else None,
+        "timeless_youtube_embed_url": time_youtube.embedUrl if time_youtube else None,
+        "timeless_record_sales": time_youtube.recordSales if time_youtube else None,
+        "timeless_blog_url": data.timeless.blogUrl,
+        "generation_version": data.generationVersion,
+        "skipped": ",".join(data.skipped) or None,
+        "media_searched": data.mediaSearched,
+        "blogs_searched": data.blogsSearched,
+        "response_json": render_response(data).decode(),
+    }
+
+
+class PostgresBackend:
+    """Stores entries as rows of chrono_art_cache via the repository."""
+
+    name = "postgres"
+
+    async def get(self, key: CacheKey) -> Optional[ArtData]:
+        """Read an entry from the database."""
+        decade, region, art_form = key
+        cached = await art_cache_repository.find_by_key(decade, region, art_form)
+        return _to_art_data(cached) if cached else None
+
+    async def get_response(self, key: CacheKey) -> Optional[bytes]:
+        """Read only the pre-serialized body, rebuilding it from the columns if it was cleared."""
+        found, response_json = await art_cache_repository.find_response(*key)
+        if not found:
+            return None
+        if response_json is not None:
+            return response_json.encode()
+
+        row = await art_cache_repository.find_by_key(*key)
+        if row is None:
+            return None
+        body = render_response(_to_art_data(row))
+        await art_cache_repository.update_response(*key, body.decode(), row.updated_at)
+        return body
+
+    async def set(self, data: ArtData) -> None:
+        """Insert or update an entry (one INSERT ... ON CONFLICT round trip)."""
+        await art_cache_repository.upsert(to_columns(data))
+
+    async def update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        """Set blog URLs and mark the search done with one UPDATE; the body is rebuilt on the next read."""
+        return await art_cache_repository.update_blog_urls(*key, popular, timeless)
+
+    async def delete(self, key: CacheKey) -> bool:
+        """Delete an entry. Returns True if it existed."""
+        return await art_cache_repository.delete_by_key(*key)
+
+    async def clear(self) -> int:
+        """Delete all entries. Returns the number deleted."""
+        return await art_cache_repository.delete_all()
+
+    async def scan(self) -> Set[CacheKey]:
+        """All stored keys."""
+        return await art_cache_repository.find_all_keys()
+
+    async def close(self) -> None:
+        """Nothing to do; the engine is closed by close_db()."""
@@ -0,0 +1,242 @@
+"""Redis backend: entries shared by all replicas.
+
+Speaks the Redis protocol (RESP2) directly over asyncio streams, so it
+needs no client library and works with Redis, Valkey, KeyDB or any other
+server implementing GET/SET/DEL/SCAN and WATCH/MULTI/EXEC.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional, Set
+from urllib.parse import unquote, urlparse
+
+from cache_backends.base import CacheKey, deserialize, serialize, with_blog_urls, wrap_response
+from models import ArtData
+
+KEY_PREFIX = "chrono:art:"
+
+# Seconds to wait for a connection or reply
+DEFAULT_TIMEOUT = 2.0
+
+# Connections per process (see Settings.redis_max_connections)
+DEFAULT_MAX_CONNECTIONS = 8
+
+# Attempts at an optimistic (WATCH) update before giving up
+WATCH_ATTEMPTS = 5
+
+
+class RedisError(Exception):
+    """Error reply from the server."""
+
+
+class RedisConnection:
+    """
+    Minimal RESP2 client over a single connection.
+
+    Commands are serialized by a lock. A command that does not complete for
+    any reason (error, timeout, or the calling task being cancelled) drops
+    the connection, since an unread reply would be taken as the answer to
+    the next command; it is reopened on the next call.
+    """
+
+    def __init__(self, url: str, timeout: float = DEFAULT_TIMEOUT):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def execute(self, *args: Any) -> Any:
+        """Send one command and return its decoded reply."""
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await asyncio.wait_for(self._connect(), self.timeout)
+                return await asyncio.wait_for(self._command(*args), self.timeout)
+            except BaseException:
+                await self._drop()
+                raise
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            auth = (self.username, self.password) if self.username else (self.password,)
+            await self._command("AUTH", *auth)
+        if self.db:
+            await self._command("SELECT", self.db)
+
+    async def _command(self, *args: Any) -> Any:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._writer.write(b"".join(parts))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count == -1:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    async def _drop(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._drop()
+
+
+class RedisPool:
+    """
+    Up to max_connections RedisConnections shared by concurrent callers.
+
+    Each command takes an idle connection for itself, so one slow reply no
+    longer holds up all of the process's cache traffic. Connections are
+    opened on first use; waiting for a free one is bounded by timeout.
+    """
+
+    def __init__(
+        self, url: str, timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        self.timeout = timeout
+        self._connections = [RedisConnection(url, timeout) for _ in range(max_connections)]
+        # Created on first use, inside the event loop
+        self._idle: Optional[asyncio.LifoQueue] = None
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[RedisConnection]:
+        """Hold one connection for a sequence of commands."""
+        if self._idle is None:
+            self._idle = asyncio.LifoQueue()
+            for connection in self._connections:
+                self._idle.put_nowait(connection)
+        connection = await asyncio.wait_for(self._idle.get(), self.timeout)
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
+
+    async def execute(self, *args: Any) -> Any:
+        """Send one command on an idle connection and return its decoded reply."""
+        async with self.connection() as connection:
+            return await connection.execute(*args)
+
+    async def close(self) -> None:
+        for connection in self._connections:
+            await connection.close()
+
+
+def _redis_key(key: CacheKey) -> str:
+    return KEY_PREFIX + json.dumps(list(key), ensure_ascii=False)
+
+
+def _cache_key(redis_key: bytes) -> CacheKey:
+    return tuple(json.loads(redis_key.decode()[len(KEY_PREFIX):]))
+
+
+class RedisBackend:
+    """Stores serialized entries under chrono:art:<json key>."""
+
+    name = "redis"
+
+    def __init__(
+        self, url: str, timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        self._redis = RedisPool(url, timeout, max_connections)
+
+    async def get(self, key: CacheKey) -> Optional[ArtData]:
+        raw = await self._redis.execute("GET", _redis_key(key))
+        return deserialize(raw) if raw is not None else None
+
+    async def get_response(self, key: CacheKey) -> Optional[bytes]:
+        raw = await self._redis.execute("GET", _redis_key(key))
+        return wrap_response(raw) if raw is not None else None
+
+    async def set(self, data: ArtData) -> None:
+        key = (data.decade, data.region, data.artForm)
+        await self._redis.execute("SET", _redis_key(key), serialize(data))
+
+    async def update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        """Read-modify-write under WATCH, retried if the entry changes in between."""
+        redis_key = _redis_key(key)
+        async with self._redis.connection() as connection:
+            try:
+                for _ in range(WATCH_ATTEMPTS):
+                    await connection.execute("WATCH", redis_key)
+                    raw = await connection.execute("GET", redis_key)
+                    if raw is None:
+                        await connection.execute("UNWATCH")
+                        return False
+                    updated = serialize(with_blog_urls(deserialize(raw), popular, timeless))
+                    await connection.execute("MULTI")
+                    await connection.execute("SET", redis_key, updated)
+                    # A nil reply means the entry was written since WATCH
+                    if await connection.execute("EXEC") is not None:
+                        return True
+            except BaseException:
+                # Don't hand back a connection left in WATCH or MULTI state
+                await connection.close()
+                raise
+        raise RedisError(f"{redis_key} kept changing during update_blog_urls")
+
+    async def delete(self, key: CacheKey) -> bool:
+        return await self._redis.execute("DEL", _redis_key(key)) > 0
+
+    async def clear(self) -> int:
+        keys = await self._scan_raw()
+        deleted = 0
+        for i in range(0, len(keys), 500):
+            deleted += await self._redis.execute("DEL", *keys[i:i + 500])
+        return deleted
+
+    async def scan(self) -> Set[CacheKey]:
+        return {_cache_key(k) for k in await self._scan_raw()}
+
+    async def _scan_raw(self) -> List[bytes]:
+        """All keys under KEY_PREFIX, via incremental SCAN (never KEYS)."""
+        keys: List[bytes] = []
+        cursor = b"0"
+        while True:
+            cursor, batch = await self._redis.execute(
+                "SCAN", cursor, "MATCH", KEY_PREFIX + "*", "COUNT", 500
+            )
+            keys.extend(batch)
+            if cursor == b"0":
+                return keys
+
+    async def close(self) -> None:
+        await self._redis.close()
@@ -0,0 +1,129 @@
+"""SQLite backend: an embedded file, for single-node setups or DB-outage fallback."""
+
+import asyncio
+import sqlite3
+import threading
+from typing import Optional, Set, Tuple
+
+from cache_backends.base import CacheKey, deserialize, serialize, with_blog_urls, wrap_response
+from models import ArtData
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS art_cache (
+    decade TEXT NOT NULL,
+    region TEXT NOT NULL,
+    art_form TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL DEFAULT (julianday('now')),
+    PRIMARY KEY (decade, region, art_form)
+)
+"""
+
+
+class SQLiteBackend:
+    """
+    Stores serialized entries in a local SQLite file.
+
+    Uses the stdlib sqlite3 module on a worker thread (asyncio.to_thread),
+    with one connection guarded by a lock.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """The open connection (call with the lock held)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple) -> Tuple[list, int]:
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(sql, params)
+            rows = cursor.fetchall()
+            conn.commit()
+            return rows, cursor.rowcount
+
+    def _update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        """Read, modify and write an entry in one write transaction."""
+        with self._lock:
+            conn = self._connection()
+            # IMMEDIATE takes the write lock up front, so other processes
+            # sharing the file cannot write the entry in between
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT data FROM art_cache WHERE decade = ? AND region = ? AND art_form = ?", key
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE art_cache SET data = ?, updated_at = julianday('now') "
+                        "WHERE decade = ? AND region = ? AND art_form = ?",
+                        (serialize(with_blog_urls(deserialize(row[0]), popular, timeless)), *key),
+                    )
+                conn.commit()
+                return row is not None
+            except BaseException:
+                conn.rollback()
+                raise
+
+    async def _query(self, sql: str, params: tuple = ()) -> list:
+        """Run a SELECT on the worker thread and return its rows."""
+        return (await asyncio.to_thread(self._execute, sql, params))[0]
+
+    async def _modify(self, sql: str, params: tuple = ()) -> int:
+        """Run a write on the worker thread and return the affected row count."""
+        return (await asyncio.to_thread(self._execute, sql, params))[1]
+
+    async def get(self, key: CacheKey) -> Optional[ArtData]:
+        rows = await self._query(
+            "SELECT data FROM art_cache WHERE decade = ? AND region = ? AND art_form = ?", key
+        )
+        return deserialize(rows[0][0]) if rows else None
+
+    async def get_response(self, key: CacheKey) -> Optional[bytes]:
+        rows = await self._query(
+            "SELECT data FROM art_cache WHERE decade = ? AND region = ? AND art_form = ?", key
+        )
+        return wrap_response(rows[0][0]) if rows else None
+
+    async def set(self, data: ArtData) -> None:
+        await self._modify(
+            "INSERT INTO art_cache (decade, region, art_form, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (decade, region, art_form) "
+            "DO UPDATE SET data = excluded.data, updated_at = julianday('now')",
+            (data.decade, data.region, data.artForm, serialize(data)),
+        )
+
+    async def update_blog_urls(
+        self, key: CacheKey, popular: Optional[str], timeless: Optional[str]
+    ) -> bool:
+        return await asyncio.to_thread(self._update_blog_urls, key, popular, timeless)
+
+    async def delete(self, key: CacheKey) -> bool:
+        deleted = await self._modify(
+            "DELETE FROM art_cache WHERE decade = ? AND region = ? AND art_form = ?", key
+        )
+        return deleted > 0
+
+    async def clear(self) -> int:
+        return await self._modify("DELETE FROM art_cache")
+
+    async def scan(self) -> Set[CacheKey]:
+        rows = await self._query("SELECT decade, region, art_form FROM art_cache")
+        return {tuple(row) for row in rows}
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
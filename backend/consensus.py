@@ -4,10 +4,14 @@ from typing import Optional, List, Tuple
 from anthropic import AsyncAnthropic
 from collections import Counter
 
+import rate_limit
 from config import get_settings
 from llm_providers import FactCheckResponse
 from models import ArtEntry
 
+# Default timeout for the Claude synthesis request (seconds)
+DEFAULT_TIMEOUT = 60.0
+
 
 def _find_majority_genre(responses: List[FactCheckResponse]) -> Tuple[Optional[str], List[str]]:
     """
@@ -110,9 +114,12 @@ async def synthesize_with_claude(
     art_form: str,
     popular_responses: List[FactCheckResponse],
     timeless_responses: List[FactCheckResponse],
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> Tuple[ArtEntry, ArtEntry]:
     """
     Use Claude to synthesize responses and write final descriptions.
+
+    timeout bounds the Claude request, in seconds.
     
     Returns (popular_entry, timeless_entry).
     """
@@ -151,9 +158,11 @@ TIMELESS_ARTISTS: [artist names, comma separated]
 TIMELESS_EXAMPLE: [specific work title by artist]
 TIMELESS_DESCRIPTION: [your engaging 2-3 sentence description]"""
 
+    await rate_limit.acquire("anthropic")
     response = await client.messages.create(
         model="claude-3-5-haiku-20241022",  # Fast & cheap: $1/M in, $5/M out
         max_tokens=700,
+        timeout=timeout,
         messages=[
             {
                 "role": "user",
@@ -8,6 +8,38 @@ The backend accepts any values and uses the cache to store/retrieve data.
 import re
 
 
+# Regions the backend generates content for
+CANONICAL_REGIONS = [
+    "Western Europe",
+    "Eastern Europe",
+    "North America",
+    "Latin America",
+    "East Asia",
+    "Middle East",
+    "Africa",
+]
+
+# Granular frontend regions and the backend region they share a cache entry
+# with. Mirrors regionToBackendRegion in src/lib/api.ts.
+REGION_ALIASES = {
+    "Southern Europe & Mediterranean": "Western Europe",
+    "Eastern Europe & Balkans": "Eastern Europe",
+    "Russia & Central Asia": "Eastern Europe",
+    "Middle East & North Africa": "Middle East",
+    "Sub-Saharan Africa — West/Central": "Africa",
+    "Sub-Saharan Africa — East/South": "Africa",
+    "South Asia": "East Asia",
+    "Southeast Asia": "East Asia",
+    "Oceania": "East Asia",
+}
+
+CANONICAL_ART_FORMS = ["Visual Arts", "Music", "Literature"]
+
+ART_FORM_ALIASES = {
+    "Visual Art": "Visual Arts",
+    "Art": "Visual Arts",
+}
+
 # Maximum lengths for input validation (prevents abuse)
 MAX_DECADE_LENGTH = 10
 MAX_REGION_LENGTH = 100
@@ -41,11 +73,54 @@ def sanitize_input(value: str, max_length: int = 100) -> str:
     return value
 
 
+def _fold(value: str) -> str:
+    """Lookup form of a name: lowercase, dashes unified, whitespace collapsed."""
+    value = re.sub(r'\s*[—–-]\s*', ' - ', value.lower())
+    return ' '.join(value.split())
+
+
+def _lookup_table(canonical: list[str], aliases: dict[str, str]) -> dict[str, str]:
+    table = {_fold(name): name for name in canonical}
+    table.update({_fold(alias): target for alias, target in aliases.items()})
+    return table
+
+
+_REGIONS = _lookup_table(CANONICAL_REGIONS, REGION_ALIASES)
+_ART_FORMS = _lookup_table(CANONICAL_ART_FORMS, ART_FORM_ALIASES)
+
+
+def canonical_decade(decade: str) -> str:
+    """"1960s", "1960's" and "1960" all mean the 1960 decade."""
+    match = re.fullmatch(r"(\d{3,4})\s*'?s", decade, flags=re.IGNORECASE)
+    return match.group(1) if match else decade
+
+
+def canonical_region(region: str) -> str:
+    """Map aliases and case/spacing variants to the backend region name."""
+    return _REGIONS.get(_fold(region), ' '.join(region.split()))
+
+
+def canonical_art_form(art_form: str) -> str:
+    """Map aliases and case/spacing variants to the art form name."""
+    return _ART_FORMS.get(_fold(art_form), ' '.join(art_form.split()))
+
+
+def canonicalize(decade: str, region: str, art_form: str) -> tuple[str, str, str]:
+    """
+    The cache key for a request.
+
+    Different spellings of the same thing ("1960s", "western europe", the
+    granular frontend regions) share one cache entry and one pipeline run.
+    Unknown values pass through with only whitespace collapsed.
+    """
+    return canonical_decade(decade), canonical_region(region), canonical_art_form(art_form)
+
+
 def validate_inputs(decade: str, region: str, art_form: str) -> tuple[str, str, str]:
     """
-    Validate and sanitize inputs.
+    Validate, sanitize and canonicalize inputs.
     
-    Returns sanitized values.
+    Returns the canonical cache key.
     Raises ValueError if inputs are empty after sanitization.
     """
     decade = sanitize_input(decade, MAX_DECADE_LENGTH)
@@ -59,4 +134,4 @@ def validate_inputs(decade: str, region: str, art_form: str) -> tuple[str, str,
     if not art_form:
         raise ValueError("Art form is required")
     
-    return decade, region, art_form
+    return canonicalize(decade, region, art_form)
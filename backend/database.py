@@ -1,10 +1,13 @@
 """Database connection and models."""
 
+import time
+from collections import deque
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, String, Text, DateTime, Index, text
+from sqlalchemy import BigInteger, Boolean, Column, Integer, String, Text, DateTime, Index, text
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Deque
 
 from config import get_settings
 
@@ -54,6 +57,18 @@ class ArtCache(Base):
     # Blog URL (personal perspective)
     timeless_blog_url = Column(String(1000), nullable=True)
     
+    # Prompt/pipeline version that generated the entry
+    generation_version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+    
+    # Enrichments still to retry, comma-separated (e.g. "popular_sales,timeless_image")
+    skipped = Column(String(200), nullable=True)
+    # Whether the media lookups / blog search have run (see ArtData)
+    media_searched = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    blogs_searched = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    
+    # The entry pre-serialized as the /api/art response body, served as-is on hits
+    response_json = Column(Text, nullable=True)
+    
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -90,9 +105,146 @@ class EmotionCache(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class Feedback(Base):
+    """Anonymous like/dislike feedback, one row per vote."""
+
+    __tablename__ = "feedback"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    decade = Column(String(10), nullable=False)
+    region = Column(String(100), nullable=False)
+    art_form = Column(String(100), nullable=False)
+    feedback = Column(String(10), nullable=False)  # "like" or "dislike"
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FeedbackCount(Base):
+    """Per-key vote totals, kept in step with feedback so reads are one lookup."""
+
+    __tablename__ = "feedback_counts"
+
+    decade = Column(String(10), primary_key=True)
+    region = Column(String(100), primary_key=True)
+    art_form = Column(String(100), primary_key=True)
+    likes = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    dislikes = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class Job(Base):
+    """Durable background job, claimed by workers with FOR UPDATE SKIP LOCKED."""
+
+    __tablename__ = "chrono_jobs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_type = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON object
+    # Optional key: at most one pending/running job per dedupe key
+    dedupe_key = Column(String(400), nullable=True)
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_chrono_jobs_claim', 'job_type', 'status', 'run_at'),
+        Index(
+            'uq_chrono_jobs_dedupe', 'dedupe_key',
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+
+class ProviderAnswer(Base):
+    """Latest successful answer from one fact-checking provider for a key."""
+
+    __tablename__ = "chrono_provider_answers"
+
+    provider = Column(String(50), primary_key=True)
+    query_type = Column(String(20), primary_key=True)  # popular, timeless
+    decade = Column(String(10), primary_key=True)
+    region = Column(String(100), primary_key=True)
+    art_form = Column(String(100), primary_key=True)
+    genre = Column(String(200), nullable=False)
+    artists = Column(String(500), nullable=False)
+    example_work = Column(String(500), nullable=False)
+    brief_reason = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_chrono_provider_answers_key', 'decade', 'region', 'art_form'),
+    )
+
+
+class MetSearch(Base):
+    """Cached Met Collection API search: normalized query -> object IDs."""
+
+    __tablename__ = "chrono_met_searches"
+
+    query = Column(String(500), primary_key=True)
+    object_ids = Column(Text, nullable=False)  # JSON array, may be empty
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class MetObject(Base):
+    """Cached Met Collection API object lookup, including objects without an image."""
+
+    __tablename__ = "chrono_met_objects"
+
+    object_id = Column(Integer, primary_key=True, autoincrement=False)
+    image_json = Column(Text, nullable=True)  # ArtworkImage fields as JSON; NULL = no image
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class LookupCache(Base):
+    """Cached result of an external lookup (YouTube URL, record sales, blog)."""
+
+    __tablename__ = "chrono_lookup_cache"
+
+    kind = Column(String(50), primary_key=True)  # youtube, record_sales, blog
+    args_hash = Column(String(64), primary_key=True)  # sha256 of the normalized arguments
+    args = Column(Text, nullable=False)  # normalized arguments, for inspection
+    value = Column(Text, nullable=True)  # JSON result; NULL = nothing found
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class PoolMetrics:
+    """Connection checkout waits, for sizing the pool against request concurrency."""
+
+    def __init__(self, window: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._recent.append(wait)
+
+    def stats(self) -> dict:
+        recent = sorted(self._recent)
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.total_wait / self.checkouts * 1000, 2) if self.checkouts else 0.0,
+            "wait_p95_ms": round(recent[int(len(recent) * 0.95)] * 1000, 2) if recent else 0.0,
+            "wait_max_ms": round(self.max_wait * 1000, 2),
+        }
+
+
 # Engine and session factory (initialized lazily)
 _engine = None
 _async_session_factory = None
+pool_metrics = PoolMetrics()
 
 
 async def init_db():
@@ -102,8 +254,13 @@ async def init_db():
     settings = get_settings()
     _engine = create_async_engine(
         settings.database_url,
-        echo=settings.debug,
+        echo=settings.sql_echo,
         pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args={"statement_cache_size": settings.db_statement_cache_size},
     )
     
     _async_session_factory = async_sessionmaker(
@@ -129,7 +286,12 @@ async def init_db():
             ADD COLUMN IF NOT EXISTS popular_youtube_embed_url VARCHAR(500),
             ADD COLUMN IF NOT EXISTS timeless_youtube_video_id VARCHAR(20),
             ADD COLUMN IF NOT EXISTS timeless_youtube_url VARCHAR(500),
-            ADD COLUMN IF NOT EXISTS timeless_youtube_embed_url VARCHAR(500)
+            ADD COLUMN IF NOT EXISTS timeless_youtube_embed_url VARCHAR(500),
+            ADD COLUMN IF NOT EXISTS generation_version INTEGER NOT NULL DEFAULT 1,
+            ADD COLUMN IF NOT EXISTS response_json TEXT,
+            ADD COLUMN IF NOT EXISTS skipped VARCHAR(200),
+            ADD COLUMN IF NOT EXISTS media_searched BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN IF NOT EXISTS blogs_searched BOOLEAN NOT NULL DEFAULT false
         """))
 
     return _engine
@@ -148,14 +310,28 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         await init_db()
 
     async with _async_session_factory() as session:
+        # Check the connection out up front, so the wait for a free one is measured
+        started = time.monotonic()
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.record(time.monotonic() - started)
         yield session
 
 
-async def get_db():
-    """Get raw database connection for direct queries.
-
-    Returns None - feedback features require separate asyncpg connection setup.
-    The API endpoints handle None gracefully by returning default values.
-    """
-    return None
-
+def pool_stats() -> dict:
+    """Connection pool occupancy and checkout waits."""
+    if _engine is None:
+        return {"initialized": False}
+    pool = _engine.pool
+    return {
+        "initialized": True,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": get_settings().db_max_overflow,
+        **pool_metrics.stats(),
+    }
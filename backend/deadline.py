@@ -0,0 +1,46 @@
+"""Request-level time budget shared by the stages of the art pipeline."""
+
+import asyncio
+import time
+
+import anthropic
+import httpx
+import openai
+
+# Exceptions meaning an upstream call ran out of time rather than failed
+TIMEOUT_ERRORS = (
+    asyncio.TimeoutError,
+    httpx.TimeoutException,
+    openai.APITimeoutError,
+    anthropic.APITimeoutError,
+)
+
+
+class Deadline:
+    """
+    A point in time by which a request should be answered.
+
+    Created once per request and passed into every stage, so each stage
+    gets only the budget that is left instead of its own fixed timeout.
+    """
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self._expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def timeout(self, cap: float) -> float:
+        """A stage timeout: its usual cap, shortened to the remaining budget."""
+        return min(cap, self.remaining())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Whether error is a timeout (worth retrying soon) rather than a real failure."""
+    return isinstance(error, TIMEOUT_ERRORS)
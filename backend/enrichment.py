@@ -0,0 +1,200 @@
+"""Media enrichment - fetches images, videos and record sales concurrently."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+from config import get_settings
+from deadline import Deadline
+from met_api import search_artwork
+from models import ArtEntry, ArtImage, YouTubeVideo
+from record_sales import lookup_record_sales
+from youtube_search import search_youtube
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Receives (stage name, JSON-serializable payload) as pipeline stages finish
+StageCallback = Callable[[str, dict], Awaitable[None]]
+
+
+@dataclass
+class EnrichedEntries:
+    """Entries after enrichment, plus the lookups that did not get to run."""
+    popular: ArtEntry
+    timeless: ArtEntry
+    # e.g. ["popular_sales", "timeless_image"]: skipped for lack of time or timed out
+    skipped: List[str] = field(default_factory=list)
+
+
+async def emit_entries(
+    on_stage: Optional[StageCallback], stage: str, popular: ArtEntry, timeless: ArtEntry
+) -> None:
+    """Report the current popular/timeless entries for a stage, if anyone listens."""
+    if on_stage is not None:
+        await on_stage(stage, {"popular": popular.model_dump(), "timeless": timeless.model_dump()})
+
+
+async def _lookup(
+    coro: Awaitable[Optional[T]], timeout: float, label: str, skipped: List[str]
+) -> Optional[T]:
+    """Run a single lookup with its own timeout. Failures resolve to None and are listed in skipped."""
+    try:
+        return await asyncio.wait_for(coro, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Enrichment: {label} timed out after {timeout:.1f}s")
+        skipped.append(label)
+        return None
+    except Exception as e:
+        logger.warning(f"Enrichment: {label} failed: {e}")
+        skipped.append(label)
+        return None
+
+
+async def _none() -> None:
+    return None
+
+
+def _attach_sales(entry: ArtEntry, sales: Optional[str], side: str, skipped: List[str]) -> ArtEntry:
+    """
+    Attach record sales to the entry's video (found now or already stored).
+
+    Sales are shown with the video, so without one they have nowhere to go.
+    If the video lookup failed, sales are listed as skipped too and both
+    are retried together; if no video exists, they are dropped.
+    """
+    if not sales:
+        return entry
+    if entry.youtube is not None:
+        return entry.model_copy(update={
+            "youtube": entry.youtube.model_copy(update={"recordSales": sales}),
+        })
+    if f"{side}_youtube" in skipped and f"{side}_sales" not in skipped:
+        skipped.append(f"{side}_sales")
+    return entry
+
+
+async def enrich_entries(
+    decade: str,
+    art_form: str,
+    popular: ArtEntry,
+    timeless: ArtEntry,
+    fetch_popular: bool = True,
+    fetch_timeless: bool = True,
+    on_stage: Optional[StageCallback] = None,
+    deadline: Optional[Deadline] = None,
+) -> EnrichedEntries:
+    """
+    Attach media to the popular and timeless entries.
+
+    Every independent lookup (both images for Visual Arts; both videos and
+    both sales figures for Music) is started at once, each with its own
+    timeout, so the stage takes as long as the slowest single lookup.
+
+    If a request deadline is given, lookup timeouts are shortened to the
+    remaining budget, and media or sales lookups are skipped entirely when
+    less than `media_min_budget` / `sales_min_budget` seconds are left.
+    Skipped, timed-out and failed lookups are listed in the result so a
+    later refresh can fill them in; lookups that ran and found nothing are
+    not retried.
+
+    If on_stage is given, a "media" event is emitted once images/videos are
+    attached and, for Music, a "sales" event once record sales are attached.
+
+    Entries are returned unchanged when nothing was found or the art form
+    has no media.
+    """
+    settings = get_settings()
+    timeout = settings.enrichment_timeout
+    skipped: List[str] = []
+
+    def wanted(kind: str, min_budget: float) -> tuple[bool, bool]:
+        """Which sides to fetch for a lookup kind, recording budget skips."""
+        fetch = (fetch_popular, fetch_timeless)
+        if deadline is not None and deadline.remaining() < min_budget:
+            for side, requested in zip(("popular", "timeless"), fetch):
+                if requested:
+                    skipped.append(f"{side}_{kind}")
+            logger.info(f"Enrichment: skipping {kind} lookups, {deadline.remaining():.1f}s left")
+            return False, False
+        return fetch
+
+    if deadline is not None:
+        timeout = deadline.timeout(timeout)
+
+    if art_form == "Visual Arts":
+        images_popular, images_timeless = wanted("image", settings.media_min_budget)
+        if images_popular or images_timeless:
+            logger.info("Enrichment: fetching artwork images from Met API...")
+        popular_image, timeless_image = await asyncio.gather(
+            _lookup(search_artwork(popular.exampleWork, timeout), timeout, "popular_image", skipped)
+            if images_popular else _none(),
+            _lookup(search_artwork(timeless.exampleWork, timeout), timeout, "timeless_image", skipped)
+            if images_timeless else _none(),
+        )
+
+        if popular_image:
+            popular = popular.model_copy(update={
+                "image": ArtImage(
+                    url=popular_image.thumbnail_url,
+                    sourceUrl=popular_image.source_url,
+                ),
+            })
+        if timeless_image:
+            timeless = timeless.model_copy(update={
+                "image": ArtImage(
+                    url=timeless_image.thumbnail_url,
+                    sourceUrl=timeless_image.source_url,
+                ),
+            })
+
+        await emit_entries(on_stage, "media", popular, timeless)
+
+    elif art_form == "Music":
+        videos_popular, videos_timeless = wanted("youtube", settings.media_min_budget)
+        sales_popular, sales_timeless = wanted("sales", settings.sales_min_budget)
+        logger.info("Enrichment: fetching YouTube videos and record sales...")
+        # Both groups start immediately; sales are awaited after videos
+        # only so that the media stage can be reported first.
+        videos = asyncio.gather(
+            _lookup(search_youtube(popular.exampleWork, decade, timeout), timeout, "popular_youtube", skipped)
+            if videos_popular else _none(),
+            _lookup(search_youtube(timeless.exampleWork, decade, timeout), timeout, "timeless_youtube", skipped)
+            if videos_timeless else _none(),
+        )
+        sales = asyncio.gather(
+            _lookup(lookup_record_sales(popular.exampleWork, popular.artists, timeout), timeout, "popular_sales", skipped)
+            if sales_popular else _none(),
+            _lookup(lookup_record_sales(timeless.exampleWork, timeless.artists, timeout), timeout, "timeless_sales", skipped)
+            if sales_timeless else _none(),
+        )
+
+        popular_video, timeless_video = await videos
+        if popular_video:
+            popular = popular.model_copy(update={
+                "youtube": YouTubeVideo(
+                    videoId=popular_video.video_id,
+                    title=popular_video.title,
+                    url=popular_video.url,
+                    embedUrl=popular_video.embed_url,
+                ),
+            })
+        if timeless_video:
+            timeless = timeless.model_copy(update={
+                "youtube": YouTubeVideo(
+                    videoId=timeless_video.video_id,
+                    title=timeless_video.title,
+                    url=timeless_video.url,
+                    embedUrl=timeless_video.embed_url,
+                ),
+            })
+        await emit_entries(on_stage, "media", popular, timeless)
+
+        popular_sales, timeless_sales = await sales
+        popular = _attach_sales(popular, popular_sales, "popular", skipped)
+        timeless = _attach_sales(timeless, timeless_sales, "timeless", skipped)
+        await emit_entries(on_stage, "sales", popular, timeless)
+
+    return EnrichedEntries(popular=popular, timeless=timeless, skipped=sorted(skipped))
@@ -0,0 +1,150 @@
+"""Hedged requests for LLM provider calls."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Provider response type; anything with a boolean `success` attribute
+R = TypeVar("R")
+
+# Number of recent latency samples kept per provider
+LATENCY_WINDOW = 200
+
+
+class LatencyTracker:
+    """
+    Rolling window of call latencies per provider.
+
+    Calls that timed out or were cancelled before answering are sampled
+    too, at the time they had run so far: a lower bound on their latency,
+    but without them the slow tail would never be sampled.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._window = window
+        self._samples: dict[str, deque] = {}
+
+    def record(self, provider: str, seconds: float) -> None:
+        """Record the latency of a call (or a lower bound, for unfinished calls)."""
+        self._samples.setdefault(provider, deque(maxlen=self._window)).append(seconds)
+
+    def quantile(self, provider: str, q: float, min_samples: int) -> Optional[float]:
+        """Latency quantile for a provider, or None until enough samples exist."""
+        samples = self._samples.get(provider)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def stats(self) -> dict:
+        """Per-provider sample count and p50/p90 latency."""
+        return {
+            provider: {
+                "samples": len(samples),
+                "p50": self.quantile(provider, 0.5, 1),
+                "p90": self.quantile(provider, 0.9, 1),
+            }
+            for provider, samples in self._samples.items()
+        }
+
+
+class HedgeBudget:
+    """Caps hedged requests to a fraction of primary calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def try_acquire(self, max_ratio: float) -> bool:
+        """Reserve one hedge if it keeps hedges within max_ratio of calls."""
+        if self.hedges + 1 > max_ratio * self.calls:
+            return False
+        self.hedges += 1
+        return True
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "hedges": self.hedges, "hedge_wins": self.hedge_wins}
+
+
+provider_latency = LatencyTracker()
+hedge_budget = HedgeBudget()
+
+
+async def _timed(provider: str, fn: Callable[[], Awaitable[R]]) -> R:
+    """Run a provider call, recording its latency if it succeeds or times out."""
+    started = time.monotonic()
+    response = await fn()
+    if response.success or getattr(response, "timed_out", False):
+        provider_latency.record(provider, time.monotonic() - started)
+    return response
+
+
+async def hedged_call(provider: str, fn: Callable[[], Awaitable[R]]) -> R:
+    """
+    Call a provider, hedging with a duplicate request if it is slow.
+
+    If the call has not answered within the provider's observed latency
+    quantile (p90 by default), a second identical request is fired and the
+    first successful answer wins. Hedging only starts once enough latency
+    samples exist, and the total number of hedges is capped to a fraction
+    of primary calls so it cannot multiply upstream load.
+    """
+    settings = get_settings()
+    hedge_budget.calls += 1
+    started = time.monotonic()
+    primary = asyncio.create_task(_timed(provider, fn))
+    racers = {primary}
+
+    try:
+        threshold = None
+        if settings.provider_hedging:
+            threshold = provider_latency.quantile(
+                provider, settings.provider_hedge_quantile, settings.provider_hedge_min_samples
+            )
+        if threshold is None:
+            return await primary
+
+        done, _ = await asyncio.wait(racers, timeout=threshold)
+        if done:
+            return primary.result()
+
+        if not hedge_budget.try_acquire(settings.provider_hedge_max_ratio):
+            return await primary
+
+        logger.info(f"Hedging {provider}: no answer after {threshold:.2f}s, firing duplicate request")
+        hedge = asyncio.create_task(_timed(provider, fn))
+        racers.add(hedge)
+
+        # First successful answer wins; otherwise fall back to the last one to finish
+        pending = set(racers)
+        response = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response = task.result()
+                if response.success:
+                    if task is hedge:
+                        hedge_budget.hedge_wins += 1
+                    return response
+        return response
+    except asyncio.CancelledError:
+        # Cut off by the caller (quorum met, deadline): the call took at least this long
+        provider_latency.record(provider, time.monotonic() - started)
+        raise
+    finally:
+        for task in racers:
+            if not task.done():
+                task.cancel()
+
+
+def hedging_stats() -> dict:
+    """Latency and hedging counters for monitoring."""
+    return {"latency": provider_latency.stats(), "hedging": hedge_budget.stats()}
@@ -0,0 +1,157 @@
+"""Durable background jobs backed by the chrono_jobs table.
+
+Work that used to be fire-and-forget (blog search, media backfill, cache
+refresh) is enqueued as a row and processed by whichever instance claims
+it first, so it survives restarts and deploys and is spread across replicas.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import Awaitable, Callable, Optional
+
+from config import get_settings
+from repositories import job_repository
+from supervisor import task_supervisor
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict], Awaitable[None]]
+
+
+def parse_concurrency(spec: str) -> dict[str, int]:
+    """Parse "blog_search=4,cache_refresh=1" into {job_type: limit}."""
+    limits = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if part:
+            name, _, value = part.partition("=")
+            limits[name.strip()] = int(value)
+    return limits
+
+
+class JobQueue:
+    """
+    Registry of job handlers plus the worker loops that run them.
+
+    Each job type gets its own worker loop, which claims at most as many
+    jobs as it has free slots (the per-type concurrency cap, per instance).
+    Failed jobs are retried with exponential backoff up to their max attempts.
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, JobHandler] = {}
+        self._concurrency: dict[str, int] = {}
+        self._running: dict[str, set[asyncio.Task]] = {}
+        self._workers: list[asyncio.Task] = []
+        self._stopping = False
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def register(self, job_type: str, handler: JobHandler, concurrency: int = 1) -> None:
+        """Register the handler for a job type. JOB_CONCURRENCY overrides the cap."""
+        self._handlers[job_type] = handler
+        self._concurrency[job_type] = concurrency
+
+    async def enqueue(
+        self, job_type: str, payload: dict, dedupe_key: Optional[str] = None
+    ) -> bool:
+        """
+        Enqueue a job. Returns False if an identical job is already queued.
+
+        Raises if the queue is unavailable (e.g. no database).
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        return await job_repository.enqueue(
+            job_type,
+            payload,
+            dedupe_key=dedupe_key,
+            max_attempts=get_settings().job_max_attempts,
+        )
+
+    async def start(self) -> None:
+        """Start one worker loop per registered job type."""
+        settings = get_settings()
+        overrides = parse_concurrency(settings.job_concurrency)
+        self._concurrency.update({k: v for k, v in overrides.items() if k in self._handlers})
+        self._stopping = False
+        for job_type in self._handlers:
+            self._running[job_type] = set()
+            self._workers.append(asyncio.create_task(self._worker(job_type)))
+        logger.info(f"Job workers started ({self.worker_id}): {self._concurrency}")
+
+    async def stop(self) -> None:
+        """
+        Stop claiming jobs and wait for the worker loops to exit.
+
+        Jobs already running are left to the task supervisor's drain.
+        """
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self, job_type: str) -> None:
+        """Claim and run jobs of one type until stopped."""
+        settings = get_settings()
+        running = self._running[job_type]
+        limit = self._concurrency[job_type]
+
+        while not self._stopping:
+            try:
+                await job_repository.requeue_stale(job_type, settings.job_lock_timeout)
+                jobs = await job_repository.claim(job_type, limit - len(running), self.worker_id)
+                for job in jobs:
+                    # Already bounded by the per-type limit, so never rejected
+                    task = task_supervisor.spawn(self._run(job), name=f"job:{job.id}", force=True)
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                if not jobs:
+                    await asyncio.sleep(settings.job_poll_interval)
+                elif len(running) >= limit:
+                    # Wait for a free slot before claiming more
+                    await asyncio.wait(set(running), return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job worker {job_type} error: {e}")
+                await asyncio.sleep(settings.job_poll_interval)
+
+    async def _run(self, job) -> None:
+        """Run one claimed job and record the outcome."""
+        settings = get_settings()
+        handler = self._handlers[job.job_type]
+        try:
+            await handler(json.loads(job.payload))
+        except asyncio.CancelledError:
+            # Interrupted (shutdown, drain): hand it back instead of leaving it
+            # 'running', where it would block re-enqueueing until requeue_stale
+            logger.info(f"Job {job.id} ({job.job_type}) interrupted, returning it to the queue")
+            await job_repository.release(job)
+            raise
+        except Exception as e:
+            delay = min(
+                settings.job_retry_base_delay * (2 ** (job.attempts - 1)),
+                settings.job_retry_max_delay,
+            )
+            logger.warning(
+                f"Job {job.id} ({job.job_type}) attempt {job.attempts}/{job.max_attempts} "
+                f"failed: {e}"
+            )
+            await job_repository.fail(job, str(e), delay)
+        else:
+            await job_repository.complete(job.id)
+
+    async def stats(self) -> dict:
+        """Queue depth by type/status and jobs running on this instance."""
+        return {
+            "queued": await job_repository.count_by_status(),
+            "running_here": {t: len(tasks) for t, tasks in self._running.items()},
+        }
+
+
+# Singleton instance
+job_queue = JobQueue()
@@ -1,13 +1,24 @@
 """LLM provider classes for fact-checking queries."""
 
 import asyncio
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 import httpx
 from openai import AsyncOpenAI
 
+import rate_limit
 from config import get_settings
+from deadline import Deadline, is_timeout
+from hedging import hedged_call
+from repositories import provider_answer_repository
+
+logger = logging.getLogger(__name__)
+
+# Default timeout for a single provider request (seconds)
+DEFAULT_TIMEOUT = 30.0
 
 
 @dataclass
@@ -21,6 +32,8 @@ class FactCheckResponse:
     brief_reason: str
     success: bool
     error: Optional[str] = None
+    # Failed by running out of time (timeout, quorum cut-off), not a provider error
+    timed_out: bool = False
 
 
 class LLMProvider(ABC):
@@ -123,9 +136,10 @@ def _parse_response(text: str, provider: str, query_type: str) -> FactCheckRespo
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider."""
     
-    def __init__(self):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
         settings = get_settings()
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.timeout = timeout
     
     @property
     def name(self) -> str:
@@ -133,6 +147,7 @@ class OpenAIProvider(LLMProvider):
     
     async def _query(self, prompt: str, query_type: str) -> FactCheckResponse:
         try:
+            await rate_limit.acquire(self.name)
             response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
@@ -141,6 +156,7 @@ class OpenAIProvider(LLMProvider):
                 ],
                 max_tokens=150,
                 temperature=0.3,
+                timeout=self.timeout,
             )
             text = response.choices[0].message.content or ""
             return _parse_response(text, self.name, query_type)
@@ -154,6 +170,7 @@ class OpenAIProvider(LLMProvider):
                 brief_reason="",
                 success=False,
                 error=str(e),
+                timed_out=is_timeout(e),
             )
     
     async def query_popular(self, decade: str, region: str, art_form: str) -> FactCheckResponse:
@@ -168,10 +185,11 @@ class OpenAIProvider(LLMProvider):
 class PerplexityProvider(LLMProvider):
     """Perplexity AI provider (uses OpenAI-compatible API)."""
     
-    def __init__(self):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
         settings = get_settings()
         self.api_key = settings.perplexity_api_key
         self.base_url = "https://api.perplexity.ai"
+        self.timeout = timeout
     
     @property
     def name(self) -> str:
@@ -179,7 +197,8 @@ class PerplexityProvider(LLMProvider):
     
     async def _query(self, prompt: str, query_type: str) -> FactCheckResponse:
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            await rate_limit.acquire(self.name)
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -210,6 +229,7 @@ class PerplexityProvider(LLMProvider):
                 brief_reason="",
                 success=False,
                 error=str(e),
+                timed_out=is_timeout(e),
             )
     
     async def query_popular(self, decade: str, region: str, art_form: str) -> FactCheckResponse:
@@ -224,10 +244,11 @@ class PerplexityProvider(LLMProvider):
 class XAIProvider(LLMProvider):
     """xAI Grok provider (uses OpenAI-compatible API)."""
     
-    def __init__(self):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
         settings = get_settings()
         self.api_key = settings.xai_api_key
         self.base_url = "https://api.x.ai/v1"
+        self.timeout = timeout
     
     @property
     def name(self) -> str:
@@ -235,7 +256,8 @@ class XAIProvider(LLMProvider):
     
     async def _query(self, prompt: str, query_type: str) -> FactCheckResponse:
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            await rate_limit.acquire(self.name)
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -266,6 +288,7 @@ class XAIProvider(LLMProvider):
                 brief_reason="",
                 success=False,
                 error=str(e),
+                timed_out=is_timeout(e),
             )
     
     async def query_popular(self, decade: str, region: str, art_form: str) -> FactCheckResponse:
@@ -277,51 +300,201 @@ class XAIProvider(LLMProvider):
         return await self._query(prompt, "timeless")
 
 
+def _failed_response(
+    provider: str, query_type: str, error: str, timed_out: bool = False
+) -> FactCheckResponse:
+    """Build an unsuccessful response for a provider/query type."""
+    return FactCheckResponse(
+        provider=provider,
+        query_type=query_type,
+        genre="",
+        artists="",
+        example_work="",
+        brief_reason="",
+        success=False,
+        error=error,
+        timed_out=timed_out,
+    )
+
+
+def _task_response(task: asyncio.Task, provider: str, query_type: str) -> FactCheckResponse:
+    """Turn a finished provider task into a response, mapping exceptions to failures."""
+    if task.cancelled():
+        return _failed_response(provider, query_type, "cancelled", timed_out=True)
+    if task.exception() is not None:
+        error = task.exception()
+        return _failed_response(provider, query_type, str(error), timed_out=is_timeout(error))
+    return task.result()
+
+
+def _quorum_met(
+    results: dict[tuple[str, str], FactCheckResponse], quorum: int
+) -> bool:
+    """True once both query types have at least `quorum` successful answers."""
+    for query_type in ("popular", "timeless"):
+        successes = sum(
+            1 for (_, qt), r in results.items() if qt == query_type and r.success
+        )
+        if successes < quorum:
+            return False
+    return True
+
+
+def _log_straggler(task: asyncio.Task, provider: str, query_type: str) -> None:
+    """Log a provider answer that arrived after the pipeline moved on."""
+    response = _task_response(task, provider, query_type)
+    logger.info(
+        f"Provider {provider} ({query_type}) answered after quorum: success={response.success}"
+    )
+
+
 async def query_all_providers(
     decade: str, 
     region: str, 
-    art_form: str
+    art_form: str,
+    deadline: Optional[Deadline] = None,
 ) -> tuple[list[FactCheckResponse], list[FactCheckResponse]]:
     """
     Query all providers in parallel for both popular and timeless.
+
+    Returns as soon as `provider_quorum` providers have answered successfully
+    for both query types, or when `provider_quorum_deadline` passes. Providers
+    that have not answered by then are cancelled (or, if
+    `provider_cancel_stragglers` is off, left to finish for logging only) and
+    reported as unsuccessful.
+
+    If a request deadline is given, both the quorum deadline and each
+    provider's request timeout are shortened to the remaining budget.
     
-    Returns (popular_responses, timeless_responses).
+    Returns (popular_responses, timeless_responses), in provider order.
     """
-    providers = [OpenAIProvider(), PerplexityProvider(), XAIProvider()]
+    settings = get_settings()
+    quorum_deadline = settings.provider_quorum_deadline
+    timeout = DEFAULT_TIMEOUT
+    if deadline is not None:
+        quorum_deadline = deadline.timeout(quorum_deadline)
+        timeout = deadline.timeout(timeout)
+    
+    providers = [OpenAIProvider(timeout), PerplexityProvider(timeout), XAIProvider(timeout)]
+    quorum = min(settings.provider_quorum, len(providers))
     
     # Build all tasks (6 total: 2 queries × 3 providers)
-    popular_tasks = [p.query_popular(decade, region, art_form) for p in providers]
-    timeless_tasks = [p.query_timeless(decade, region, art_form) for p in providers]
+    tasks: dict[asyncio.Task, tuple[str, str]] = {}
+    # Each call is hedged with a duplicate request if it runs unusually long
+    for p in providers:
+        call = hedged_call(p.name, lambda p=p: p.query_popular(decade, region, art_form))
+        tasks[asyncio.create_task(call)] = (p.name, "popular")
+    for p in providers:
+        call = hedged_call(p.name, lambda p=p: p.query_timeless(decade, region, art_form))
+        tasks[asyncio.create_task(call)] = (p.name, "timeless")
+    
+    # Collect answers until the quorum is met, all are done, or the deadline passes
+    loop = asyncio.get_running_loop()
+    quorum_expires_at = loop.time() + quorum_deadline
+    results: dict[tuple[str, str], FactCheckResponse] = {}
+    pending = set(tasks)
     
-    # Run all in parallel
-    all_results = await asyncio.gather(*popular_tasks, *timeless_tasks, return_exceptions=True)
+    try:
+        while pending and not _quorum_met(results, quorum):
+            remaining = quorum_expires_at - loop.time()
+            if remaining <= 0:
+                logger.warning("Provider quorum deadline reached")
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                provider_name, query_type = tasks[task]
+                results[(provider_name, query_type)] = _task_response(task, provider_name, query_type)
+    except BaseException:
+        # Cancelled (client gone, deadline, shutdown): nobody will read the
+        # answers, so stop spending provider quota on them
+        for task in pending:
+            task.cancel()
+        raise
     
-    # Split results
+    # Deal with stragglers
+    for task in pending:
+        provider_name, query_type = tasks[task]
+        if settings.provider_cancel_stragglers:
+            task.cancel()
+        else:
+            task.add_done_callback(
+                lambda t, name=provider_name, qt=query_type: _log_straggler(t, name, qt)
+            )
+    
+    # Split results, keeping provider order
     popular_responses = []
     timeless_responses = []
     
-    for i, result in enumerate(all_results):
-        if isinstance(result, Exception):
-            # Create error response
-            provider_name = providers[i % 3].name
-            query_type = "popular" if i < 3 else "timeless"
-            response = FactCheckResponse(
-                provider=provider_name,
-                query_type=query_type,
-                genre="",
-                artists="",
-                example_work="",
-                brief_reason="",
-                success=False,
-                error=str(result),
-            )
-        else:
-            response = result
+    for query_type, responses in (("popular", popular_responses), ("timeless", timeless_responses)):
+        for p in providers:
+            response = results.get((p.name, query_type))
+            if response is None:
+                response = _failed_response(
+                    p.name, query_type, "no answer before quorum/deadline", timed_out=True
+                )
+            responses.append(response)
         
-        if i < 3:
-            popular_responses.append(response)
-        else:
-            timeless_responses.append(response)
+        made_cut = [r.provider for r in responses if r.success]
+        logger.info(f"Provider quorum ({query_type}): {made_cut or 'none'} made the cut")
     
     return popular_responses, timeless_responses
 
+
+async def store_answers(
+    decade: str, region: str, art_form: str, responses: list[FactCheckResponse]
+) -> None:
+    """Persist successful provider answers so synthesis can be re-run later."""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "provider": r.provider,
+            "query_type": r.query_type,
+            "decade": decade,
+            "region": region,
+            "art_form": art_form,
+            "genre": r.genre,
+            "artists": r.artists,
+            "example_work": r.example_work,
+            "brief_reason": r.brief_reason,
+            "created_at": now,
+        }
+        for r in responses
+        if r.success
+    ]
+    await provider_answer_repository.save_many(rows)
+
+
+async def load_stored_answers(
+    decade: str, region: str, art_form: str
+) -> Optional[tuple[list[FactCheckResponse], list[FactCheckResponse]]]:
+    """
+    Stored answers younger than `provider_answer_ttl`, as (popular, timeless).
+
+    Only the answers of the most recent run are used, so one synthesis never
+    mixes answers of different ages (e.g. an old answer from a provider
+    that failed in the latest run). Returns None unless that run has at
+    least one answer for each query type.
+    """
+    rows = await provider_answer_repository.find_fresh(
+        decade, region, art_form, get_settings().provider_answer_ttl
+    )
+    if rows:
+        # store_answers stamps every answer of a run with the same time
+        latest = max(row.created_at for row in rows)
+        rows = [row for row in rows if row.created_at == latest]
+    answers: dict[str, list[FactCheckResponse]] = {"popular": [], "timeless": []}
+    for row in sorted(rows, key=lambda r: r.provider):
+        answers.setdefault(row.query_type, []).append(FactCheckResponse(
+            provider=row.provider,
+            query_type=row.query_type,
+            genre=row.genre,
+            artists=row.artists,
+            example_work=row.example_work,
+            brief_reason=row.brief_reason,
+            success=True,
+        ))
+    if not answers["popular"] or not answers["timeless"]:
+        return None
+    return answers["popular"], answers["timeless"]
@@ -0,0 +1,60 @@
+"""Persistent cache shared by the Perplexity lookups (YouTube, record sales, blogs)."""
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from config import get_settings
+from repositories import lookup_cache_repository
+
+logger = logging.getLogger(__name__)
+
+# Counters for monitoring
+_stats = {"hits": 0, "misses": 0}
+
+
+def _normalize(args: tuple) -> str:
+    """Case- and whitespace-insensitive form of the lookup arguments."""
+    return json.dumps([" ".join(str(a).lower().split()) for a in args])
+
+
+async def cached_lookup(
+    kind: str,
+    args: tuple,
+    fetch: Callable[[], Awaitable[Optional[Any]]],
+) -> Optional[Any]:
+    """
+    Return the cached result of a lookup, or run fetch() and cache it.
+
+    fetch must return a JSON-serializable value, or None for "nothing
+    found"; found results are kept for `lookup_cache_hit_ttl` seconds and
+    misses for `lookup_cache_miss_ttl`. If fetch raises, nothing is cached
+    and the exception propagates.
+    """
+    normalized = _normalize(args)
+    args_hash = hashlib.sha256(f"{kind}:{normalized}".encode()).hexdigest()
+
+    found, value = await lookup_cache_repository.find(kind, args_hash)
+    if found:
+        _stats["hits"] += 1
+        logger.info(f"Lookup cache hit ({kind}): {normalized}")
+        return json.loads(value) if value is not None else None
+
+    _stats["misses"] += 1
+    result = await fetch()
+    settings = get_settings()
+    if result is not None:
+        await lookup_cache_repository.save(
+            kind, args_hash, normalized, json.dumps(result), settings.lookup_cache_hit_ttl
+        )
+    else:
+        await lookup_cache_repository.save(
+            kind, args_hash, normalized, None, settings.lookup_cache_miss_ttl
+        )
+    return result
+
+
+def lookup_cache_stats() -> dict:
+    """Hit/miss counters since startup."""
+    return dict(_stats)
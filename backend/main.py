@@ -1,19 +1,27 @@
 """ChronoCanvas API - Art through time and regions."""
 
+import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
+from typing import Optional
 from pydantic import BaseModel
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Header, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 
 from config import get_settings
-from database import init_db, close_db, get_db
-from repositories import emotion_repository, emotion_cache_repository
-from models import ArtDataResponse
+from database import init_db, close_db, pool_stats
+from repositories import emotion_repository, emotion_cache_repository, feedback_repository
+from models import ArtDataResponse, awaiting_backfill
 from art_service import art_service
+from cache import cache_layer, etag_for
+from cache_backends import create_backend
 from data import validate_inputs
 from emotion_resolver import emotion_resolver
+from jobs import job_queue
+from supervisor import task_supervisor
 
 
 class FeedbackRequest(BaseModel):
@@ -40,17 +48,30 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("Starting up ChronoCanvas API...")
+    db_ready = False
     try:
         await init_db()
+        db_ready = True
         logger.info("Database initialized")
     except Exception as e:
         logger.warning(f"Database initialization failed: {e}")
-        logger.warning("Running without database - cache will not work")
+        if settings.cache_backend == "postgres" and settings.cache_fallback_backend:
+            logger.warning(f"Falling back to the {settings.cache_fallback_backend} cache backend")
+            await cache_layer.use_backend(create_backend(settings.cache_fallback_backend))
+        else:
+            logger.warning("Running without database - cache will not work")
+    
+    if db_ready and settings.job_workers_enabled:
+        await job_queue.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    await job_queue.stop()
+    # Let background writes finish before the engine is disposed
+    await task_supervisor.drain(settings.shutdown_grace_period)
+    await cache_layer.close()
     await close_db()
 
 
@@ -80,11 +101,33 @@ async def root():
     return {"status": "ok", "message": "ChronoCanvas API is running", "version": "2.1.0"}
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _cache_control(found: bool, pending: bool = False) -> str:
+    """Cache-Control for an /api/art response."""
+    if not found:
+        # Not found is temporary (negative cache, provider outage)
+        return "no-store"
+    if pending:
+        return f"public, max-age={settings.art_cache_pending_max_age}"
+    return (
+        f"public, max-age={settings.art_cache_max_age}, "
+        f"stale-while-revalidate={settings.art_cache_stale_while_revalidate}"
+    )
+
+
 @app.get("/api/art", response_model=ArtDataResponse)
 async def get_art(
     decade: str = Query(..., description="Time period (e.g., '1920', '1960')"),
     region: str = Query(..., description="Geographic region"),
     artForm: str = Query(..., description="Type of art form"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get art data for a specific decade, region, and art form.
@@ -100,6 +143,13 @@ async def get_art(
     The backend accepts any reasonable input and caches the results.
     
     Returns both the 'popular' art of the decade and the 'timeless' work.
+
+    Found responses carry an ETag and Cache-Control; a matching
+    If-None-Match gets an empty 304. Entries still awaiting media or blog
+    backfill get a shorter max-age so clients pick up the additions.
+
+    Complete cache hits are served from the pre-serialized body stored with
+    the entry, without building or validating any models.
     """
     # Sanitize inputs (defense in depth, SQLAlchemy already uses parameterized queries)
     try:
@@ -107,16 +157,116 @@ async def get_art(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
+    hit = await art_service.get_cached_response(decade, region, artForm)
+    if hit is not None:
+        body, etag, pending = hit.body, hit.etag, False
+    else:
+        try:
+            data = await art_service.get_art(decade, region, artForm)
+        except Exception as e:
+            logger.error(f"Error fetching art data: {e}")
+            raise HTTPException(status_code=500, detail="Failed to fetch art data")
+
+        if data is None:
+            body = ArtDataResponse(data=None, found=False).model_dump_json().encode()
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={"Cache-Control": _cache_control(found=False)},
+            )
+        body = ArtDataResponse(data=data, found=True).model_dump_json().encode()
+        etag, pending = etag_for(body), awaiting_backfill(data)
+
+    headers = {"Cache-Control": _cache_control(found=True, pending=pending), "ETag": etag}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format a single Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/api/art/stream")
+async def stream_art(
+    decade: str = Query(..., description="Time period (e.g., '1920', '1960')"),
+    region: str = Query(..., description="Geographic region"),
+    artForm: str = Query(..., description="Type of art form"),
+):
+    """
+    Server-Sent Events variant of /api/art.
+
+    On a cache miss, emits one event per pipeline stage as it finishes:
+    - providers: the fact-checking answers from each LLM provider
+    - entries: the synthesized popular/timeless text (no media yet)
+    - media: entries with images (Visual Arts) or YouTube videos (Music)
+    - sales: entries with record sales attached (Music only)
+
+    Every stream ends with a single "complete" event carrying the same
+    body as /api/art, or an "error" event. A cache hit yields only "complete".
+    """
     try:
-        data = await art_service.get_art(decade, region, artForm)
-        
-        if data:
-            return ArtDataResponse(data=data, found=True)
-        else:
-            return ArtDataResponse(data=None, found=False)
-    except Exception as e:
-        logger.error(f"Error fetching art data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch art data")
+        decade, region, artForm = validate_inputs(decade, region, artForm)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def on_stage(stage: str, payload: dict) -> None:
+        queue.put_nowait((stage, payload))
+
+    async def events():
+        # Supervised so the run is not lost if the client disconnects
+        task = task_supervisor.spawn(
+            art_service.get_art(decade, region, artForm, on_stage=on_stage),
+            name=f"stream:{decade}/{region}/{artForm}",
+            force=True,
+        )
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        while (item := await queue.get()) is not None:
+            stage, payload = item
+            yield _sse(stage, payload)
+
+        try:
+            data = task.result()
+        except asyncio.CancelledError:
+            # The run was cancelled (e.g. shutdown), not this stream
+            logger.warning(f"Art generation cancelled while streaming {decade}/{region}/{artForm}")
+            yield _sse("error", {"detail": "Failed to fetch art data"})
+            return
+        except Exception as e:
+            logger.error(f"Error streaming art data: {e}")
+            yield _sse("error", {"detail": "Failed to fetch art data"})
+            return
+
+        response = ArtDataResponse(data=data, found=data is not None)
+        yield _sse("complete", response.model_dump())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/stats")
+async def get_stats():
+    """
+    Runtime counters for monitoring.
+
+    Reports how many cache-miss pipeline runs were started and how many
+    concurrent requests were coalesced onto an in-flight run, provider
+    latency/hedging, supervised background tasks, job queue depth and
+    database connection pool usage.
+    """
+    return {
+        **art_service.stats(),
+        "background_tasks": task_supervisor.stats(),
+        "jobs": await job_queue.stats(),
+        "pool": pool_stats(),
+    }
 
 
 @app.delete("/api/cache")
@@ -134,6 +284,18 @@ async def clear_cache():
         raise HTTPException(status_code=500, detail="Failed to clear cache")
 
 
+@app.get("/api/cache/negative")
+async def list_negative_cache():
+    """
+    List keys whose generation failed recently, with the reason.
+
+    Admin endpoint. These keys return found=false without querying
+    providers until retryIn reaches 0. DELETE /api/cache (or the per-key
+    DELETE) clears them.
+    """
+    return {"entries": art_service.failed_keys()}
+
+
 @app.delete("/api/cache/{decade}/{region}/{art_form}")
 async def invalidate_cache_entry(decade: str, region: str, art_form: str):
     """
@@ -141,6 +303,11 @@ async def invalidate_cache_entry(decade: str, region: str, art_form: str):
     
     Admin endpoint for refreshing specific data.
     """
+    try:
+        decade, region, art_form = validate_inputs(decade, region, art_form)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         deleted = await art_service.invalidate_cache(decade, region, art_form)
         return {"status": "ok", "deleted": deleted}
@@ -149,6 +316,33 @@ async def invalidate_cache_entry(decade: str, region: str, art_form: str):
         raise HTTPException(status_code=500, detail="Failed to invalidate cache")
 
 
+@app.post("/api/cache/{decade}/{region}/{art_form}/refresh")
+async def refresh_cache_entry(
+    decade: str,
+    region: str,
+    art_form: str,
+    reuseAnswers: Optional[bool] = Query(None, description="Reuse stored provider answers and only re-run synthesis"),
+):
+    """
+    Queue a regeneration of a specific cache entry.
+
+    Admin endpoint. The current entry keeps being served until the
+    background job replaces it. By default stored provider answers are
+    reused (see REFRESH_REUSE_PROVIDER_ANSWERS).
+    """
+    try:
+        decade, region, art_form = validate_inputs(decade, region, art_form)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        queued = await art_service.queue_refresh(decade, region, art_form, reuse_answers=reuseAnswers)
+        return {"status": "ok", "queued": queued}
+    except Exception as e:
+        logger.error(f"Error queueing cache refresh: {e}")
+        raise HTTPException(status_code=503, detail="Job queue unavailable")
+
+
 @app.get("/api/feedback")
 async def get_feedback_counts(
     decade: str = Query(...),
@@ -157,39 +351,10 @@ async def get_feedback_counts(
 ):
     """Get like/dislike counts for a specific configuration."""
     try:
-        db = await get_db()
-        if db:
-            # Ensure feedback table exists
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS feedback (
-                    id SERIAL PRIMARY KEY,
-                    decade VARCHAR(10) NOT NULL,
-                    region VARCHAR(100) NOT NULL,
-                    art_form VARCHAR(50) NOT NULL,
-                    feedback VARCHAR(10) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            result = await db.fetch(
-                """
-                SELECT feedback, COUNT(*) as count 
-                FROM feedback 
-                WHERE decade = $1 AND region = $2 AND art_form = $3
-                GROUP BY feedback
-                """,
-                decade, region, artForm
-            )
-            counts = {"likes": 0, "dislikes": 0}
-            for row in result:
-                if row["feedback"] == "like":
-                    counts["likes"] = row["count"]
-                elif row["feedback"] == "dislike":
-                    counts["dislikes"] = row["count"]
-            return counts
-        return {"likes": 0, "dislikes": 0}
-    except Exception as e:
-        logger.error(f"Error fetching feedback counts: {e}")
-        return {"likes": 0, "dislikes": 0}
+        decade, region, artForm = validate_inputs(decade, region, artForm)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await feedback_repository.get_counts(decade, region, artForm)
 
 
 @app.post("/api/feedback")
@@ -197,53 +362,31 @@ async def submit_feedback(req: FeedbackRequest):
     """
     Track anonymous like/dislike feedback for a configuration.
     Returns updated counts.
+
+    Only configurations with a cached entry (i.e. ones that were shown)
+    accept votes, so the counters cannot grow without bound.
     """
     if req.feedback not in ("like", "dislike"):
         raise HTTPException(status_code=400, detail="Feedback must be 'like' or 'dislike'")
-    
     try:
-        db = await get_db()
-        if db:
-            # Ensure feedback table exists
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS feedback (
-                    id SERIAL PRIMARY KEY,
-                    decade VARCHAR(10) NOT NULL,
-                    region VARCHAR(100) NOT NULL,
-                    art_form VARCHAR(50) NOT NULL,
-                    feedback VARCHAR(10) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            await db.execute(
-                """
-                INSERT INTO feedback (decade, region, art_form, feedback)
-                VALUES ($1, $2, $3, $4)
-                """,
-                req.decade, req.region, req.artForm, req.feedback
-            )
-            # Return updated counts
-            result = await db.fetch(
-                """
-                SELECT feedback, COUNT(*) as count 
-                FROM feedback 
-                WHERE decade = $1 AND region = $2 AND art_form = $3
-                GROUP BY feedback
-                """,
-                req.decade, req.region, req.artForm
-            )
-            counts = {"likes": 0, "dislikes": 0}
-            for row in result:
-                if row["feedback"] == "like":
-                    counts["likes"] = row["count"]
-                elif row["feedback"] == "dislike":
-                    counts["dislikes"] = row["count"]
-            logger.info(f"Feedback recorded: {req.decade}/{req.region}/{req.artForm} = {req.feedback}")
-            return {"status": "ok", **counts}
-        return {"status": "ok", "likes": 0, "dislikes": 0}
+        decade, region, art_form = validate_inputs(req.decade, req.region, req.artForm)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        cached = await cache_layer.contains(decade, region, art_form)
     except Exception as e:
-        logger.error(f"Error recording feedback: {e}")
-        return {"status": "ok", "likes": 0, "dislikes": 0}
+        logger.error(f"Error checking cache for feedback: {e}")
+        raise HTTPException(status_code=503, detail="Failed to record feedback")
+    if not cached:
+        raise HTTPException(status_code=404, detail="No art for this configuration")
+
+    counts = await feedback_repository.record(decade, region, art_form, req.feedback)
+    if counts is None:
+        logger.error(f"Error recording feedback: {decade}/{region}/{art_form}")
+        raise HTTPException(status_code=503, detail="Failed to record feedback")
+    logger.info(f"Feedback recorded: {decade}/{region}/{art_form} = {req.feedback}")
+    return {"status": "ok", **counts}
 
 
 @app.post("/api/emotion")
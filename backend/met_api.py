@@ -3,14 +3,23 @@
 import logging
 import re
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 import httpx
 
+from config import get_settings
+from repositories import met_cache_repository
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://collectionapi.metmuseum.org/public/collection/v1"
 
+# Default timeout for Met API requests (seconds)
+DEFAULT_TIMEOUT = 15.0
+
+# Search results checked for an image (and all that is kept in the search cache)
+MAX_CANDIDATES = 10
+
 # Met API requires a User-Agent header
 HEADERS = {
     "User-Agent": "ChronoCanvas/1.0 (Art History Education App; contact@example.com)"
@@ -46,15 +55,19 @@ def extract_keywords(name: str) -> str:
     return ' '.join(keywords)
 
 
-async def search_artwork(artwork_name: str) -> Optional[ArtworkImage]:
+async def search_artwork(artwork_name: str, timeout: float = DEFAULT_TIMEOUT) -> Optional[ArtworkImage]:
     """
     Search Met API for an artwork image.
     
     Args:
         artwork_name: Name of the artwork to search for
+        timeout: HTTP timeout per request, in seconds
         
     Returns:
         ArtworkImage if found, None otherwise
+
+    Raises httpx.HTTPError on request failure, so a Met outage is not
+    mistaken for "no image" and the lookup can be retried.
     """
     if not artwork_name:
         return None
@@ -62,7 +75,7 @@ async def search_artwork(artwork_name: str) -> Optional[ArtworkImage]:
     clean_name = clean_artwork_name(artwork_name)
     logger.info(f"Met API: Searching for '{clean_name}' (original: '{artwork_name}')")
     
-    async with httpx.AsyncClient(timeout=15.0, headers=HEADERS) as client:
+    async with httpx.AsyncClient(timeout=timeout, headers=HEADERS) as client:
         # Try exact search first
         image = await _search_met(client, clean_name)
         
@@ -78,94 +91,96 @@ async def search_artwork(artwork_name: str) -> Optional[ArtworkImage]:
         return None
 
 
+def _normalize_query(query: str) -> str:
+    """Cache key for a search query (the Met search is case-insensitive)."""
+    return " ".join(query.lower().split())
+
+
+async def _search_object_ids(client: httpx.AsyncClient, query: str) -> list[int]:
+    """
+    The first MAX_CANDIDATES object IDs matching a query, from the search
+    cache or the Met API.
+
+    Raises httpx.HTTPError on request failure; failures are not cached.
+    """
+    cache_key = _normalize_query(query)
+    cached = await met_cache_repository.find_search(cache_key, get_settings().met_search_cache_ttl)
+    if cached is not None:
+        logger.info(f"Met API: Search cache hit for '{query}' ({len(cached)} results)")
+        return cached
+
+    # Search for artwork - only public domain works have images available
+    search_url = f"{BASE_URL}/search"
+    response = await client.get(
+        search_url,
+        params={
+            "hasImages": "true",
+            "isPublicDomain": "true",  # Only public domain works have downloadable images
+            "q": query
+        }
+    )
+    response.raise_for_status()
+    
+    data = response.json()
+    total = data.get("total", 0)
+    object_ids = (data.get("objectIDs") or [])[:MAX_CANDIDATES]
+    
+    logger.info(f"Met API: Found {total} public domain results for '{query}'")
+    
+    await met_cache_repository.save_search(cache_key, object_ids)
+    return object_ids
+
+
 async def _search_met(client: httpx.AsyncClient, query: str) -> Optional[ArtworkImage]:
-    """Perform Met API search."""
-    try:
-        # Search for artwork - only public domain works have images available
-        search_url = f"{BASE_URL}/search"
-        response = await client.get(
-            search_url,
-            params={
-                "hasImages": "true",
-                "isPublicDomain": "true",  # Only public domain works have downloadable images
-                "q": query
-            }
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        total = data.get("total", 0)
-        object_ids = data.get("objectIDs")
-        
-        logger.info(f"Met API: Found {total} public domain results for '{query}'")
-        
-        if not object_ids:
-            return None
-        
-        # Try first 10 results to find one with an image
-        for object_id in object_ids[:10]:
-            image = await _get_object_details(client, object_id)
-            if image:
-                return image
-        
-        return None
-        
-    except httpx.HTTPError as e:
-        logger.warning(f"Met API search error: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Met API unexpected error: {e}")
+    """Perform Met API search. Raises httpx.HTTPError on request failure."""
+    object_ids = await _search_object_ids(client, query)
+    
+    if not object_ids:
         return None
+    
+    # Try the first results to find one with an image
+    for object_id in object_ids[:MAX_CANDIDATES]:
+        image = await _get_object_details(client, object_id)
+        if image:
+            return image
+    
+    return None
 
 
 async def _get_object_details(client: httpx.AsyncClient, object_id: int) -> Optional[ArtworkImage]:
-    """Get artwork details from Met API."""
-    try:
-        response = await client.get(f"{BASE_URL}/objects/{object_id}")
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Only return if there's an image (public domain works should have images)
-        primary_image = data.get("primaryImage", "")
-        primary_image_small = data.get("primaryImageSmall", "")
-        
-        if not primary_image and not primary_image_small:
-            return None
-        
-        logger.info(f"Met API: Found image for '{data.get('title', 'Unknown')}'")
-        
-        return ArtworkImage(
-            url=primary_image or primary_image_small,
-            thumbnail_url=primary_image_small or primary_image,
-            title=data.get("title", ""),
-            artist=data.get("artistDisplayName") or None,
-            source_url=data.get("objectURL", ""),
-        )
-        
-    except httpx.HTTPError:
+    """Get artwork details from the object cache or the Met API. Raises on request failure."""
+    found, cached = await met_cache_repository.find_object(
+        object_id, get_settings().met_object_cache_ttl
+    )
+    if found:
+        return ArtworkImage(**cached) if cached else None
+
+    response = await client.get(f"{BASE_URL}/objects/{object_id}")
+    if response.status_code == 404:
+        # Search results can list objects that no longer exist
+        await met_cache_repository.save_object(object_id, None)
         return None
-    except Exception:
-        return None
-
-
-async def search_artwork_images(popular_name: str, timeless_name: str, art_form: str) -> tuple[Optional[ArtworkImage], Optional[ArtworkImage]]:
-    """
-    Search for images for both popular and timeless artworks.
-    Only searches for Visual Arts.
+    response.raise_for_status()
     
-    Returns:
-        Tuple of (popular_image, timeless_image)
-    """
-    # Only fetch images for Visual Arts
-    if art_form != "Visual Arts":
-        return None, None
+    data = response.json()
     
-    logger.info(f"Met API: Searching images for '{popular_name}' and '{timeless_name}'")
+    # Only return if there's an image (public domain works should have images)
+    primary_image = data.get("primaryImage", "")
+    primary_image_small = data.get("primaryImageSmall", "")
     
-    popular_image = await search_artwork(popular_name)
-    timeless_image = await search_artwork(timeless_name)
+    if not primary_image and not primary_image_small:
+        # Remember that this object has no image, too
+        await met_cache_repository.save_object(object_id, None)
+        return None
     
-    logger.info(f"Met API: Found popular={popular_image is not None}, timeless={timeless_image is not None}")
+    logger.info(f"Met API: Found image for '{data.get('title', 'Unknown')}'")
     
-    return popular_image, timeless_image
+    image = ArtworkImage(
+        url=primary_image or primary_image_small,
+        thumbnail_url=primary_image_small or primary_image,
+        title=data.get("title", ""),
+        artist=data.get("artistDisplayName") or None,
+        source_url=data.get("objectURL", ""),
+    )
+    await met_cache_repository.save_object(object_id, asdict(image))
+    return image
@@ -0,0 +1,29 @@
+"""Create the feedback tables and backfill per-key counters."""
+
+from sqlalchemy import text
+
+from database import Feedback, FeedbackCount
+
+MIGRATION_ID = "002_feedback_counts"
+
+
+async def up(conn):
+    """Apply migration - create feedback tables, backfill counters from existing votes."""
+    await conn.run_sync(Feedback.__table__.create, checkfirst=True)
+    await conn.run_sync(FeedbackCount.__table__.create, checkfirst=True)
+    await conn.execute(text("""
+        INSERT INTO feedback_counts (decade, region, art_form, likes, dislikes, updated_at)
+        SELECT decade, region, art_form,
+               COUNT(*) FILTER (WHERE feedback = 'like'),
+               COUNT(*) FILTER (WHERE feedback = 'dislike'),
+               CURRENT_TIMESTAMP
+        FROM feedback
+        GROUP BY decade, region, art_form
+        ON CONFLICT (decade, region, art_form) DO UPDATE
+        SET likes = EXCLUDED.likes, dislikes = EXCLUDED.dislikes, updated_at = EXCLUDED.updated_at
+    """))
+
+
+async def down(conn):
+    """Rollback migration - drop the counters (votes in feedback are kept)."""
+    await conn.execute(text("DROP TABLE IF EXISTS feedback_counts"))
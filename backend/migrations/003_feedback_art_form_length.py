@@ -0,0 +1,17 @@
+"""Widen feedback art_form columns to the 100 characters the API accepts."""
+
+from sqlalchemy import text
+
+MIGRATION_ID = "003_feedback_art_form_length"
+
+
+async def up(conn):
+    """Apply migration - widen art_form in feedback and feedback_counts."""
+    await conn.execute(text("ALTER TABLE feedback ALTER COLUMN art_form TYPE VARCHAR(100)"))
+    await conn.execute(text("ALTER TABLE feedback_counts ALTER COLUMN art_form TYPE VARCHAR(100)"))
+
+
+async def down(conn):
+    """Rollback migration - narrow art_form back (fails if longer values were stored)."""
+    await conn.execute(text("ALTER TABLE feedback_counts ALTER COLUMN art_form TYPE VARCHAR(50)"))
+    await conn.execute(text("ALTER TABLE feedback ALTER COLUMN art_form TYPE VARCHAR(50)"))
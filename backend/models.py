@@ -1,7 +1,7 @@
 """Pydantic models for ChronoCanvas API."""
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class ArtImage(BaseModel):
@@ -42,6 +42,15 @@ class ArtData(BaseModel):
     artForm: str
     popular: ArtEntry
     timeless: ArtEntry
+    # Enrichments skipped to meet the request deadline (e.g. "popular_sales");
+    # stored with the entry so a later backfill fills them in.
+    skipped: List[str] = []
+    # Whether the media lookups and the blog search have run for this entry,
+    # so media or blog links they did not find are not searched for again
+    mediaSearched: bool = False
+    blogsSearched: bool = False
+    # Prompt/pipeline version that generated this entry (see Settings.generation_version)
+    generationVersion: int = 1
 
 
 class ArtDataResponse(BaseModel):
@@ -49,3 +58,35 @@ class ArtDataResponse(BaseModel):
     data: Optional[ArtData]
     found: bool
 
+
+
+def missing_media(data: ArtData) -> Tuple[bool, bool]:
+    """Return (popular_missing, timeless_missing) for the art form's media type."""
+    if data.artForm == "Visual Arts":
+        return data.popular.image is None, data.timeless.image is None
+    if data.artForm == "Music":
+        return data.popular.youtube is None, data.timeless.youtube is None
+    return False, False
+
+
+def backfill_sides(data: ArtData) -> Tuple[bool, bool]:
+    """Return (popular, timeless): sides with media still to search for or enrichments skipped."""
+    popular_missing, timeless_missing = missing_media(data) if not data.mediaSearched else (False, False)
+    return (
+        popular_missing or any(label.startswith("popular_") for label in data.skipped),
+        timeless_missing or any(label.startswith("timeless_") for label in data.skipped),
+    )
+
+
+def awaiting_backfill(data: ArtData) -> bool:
+    """Whether an entry may still gain media or blog links from background work."""
+    return any(backfill_sides(data)) or blogs_pending(data)
+
+
+def blogs_pending(data: ArtData) -> bool:
+    """Whether the blog search has yet to run for an entry without blog links."""
+    return (
+        not data.blogsSearched
+        and data.popular.blogUrl is None
+        and data.timeless.blogUrl is None
+    )
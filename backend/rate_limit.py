@@ -0,0 +1,59 @@
+"""Per-provider request rate limits for upstream API calls."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most `per_minute` start in any minute."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.interval = 60.0 / per_minute
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_limiters: Optional[dict[str, RateLimiter]] = None
+
+
+def parse_rate_limits(spec: str) -> dict[str, float]:
+    """Parse "openai=60,perplexity=30" into {provider: requests per minute}."""
+    limits = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, value = part.partition("=")
+        limits[name.strip().lower()] = float(value)
+    return limits
+
+
+def set_rate_limits(limits: dict[str, float]) -> None:
+    """Replace the active limits. Providers not listed are unlimited."""
+    global _limiters
+    _limiters = {name: RateLimiter(per_minute) for name, per_minute in limits.items() if per_minute > 0}
+    if _limiters:
+        logger.info(f"Rate limits (requests/min): { {name: limiter.per_minute for name, limiter in _limiters.items()} }")
+
+
+async def acquire(provider: str) -> None:
+    """Wait until a request to provider may start. No-op if it has no limit."""
+    if _limiters is None:
+        set_rate_limits(parse_rate_limits(get_settings().provider_rate_limits))
+    limiter = _limiters.get(provider)
+    if limiter is not None:
+        await limiter.acquire()
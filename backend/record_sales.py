@@ -1,24 +1,32 @@
 """Record sales lookup using Perplexity."""
 
-import asyncio
 import logging
 import re
-from typing import Optional, Tuple
+from typing import Optional
 import httpx
 
+import rate_limit
 from config import get_settings
+from lookup_cache import cached_lookup
 
 logger = logging.getLogger(__name__)
 
+# Default timeout for the Perplexity request (seconds)
+DEFAULT_TIMEOUT = 15.0
+
 
 async def lookup_record_sales(
     album_or_track: str,
     artist: str,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> Optional[str]:
     """
     Look up record sales for an album/track using Perplexity.
     
     Returns a human-readable string like "50 million copies sold" or None.
+    Results (including "unknown") are served from the lookup cache when the
+    same track and artist were looked up before. Raises on request failure,
+    so the lookup can be retried.
     """
     settings = get_settings()
     
@@ -26,6 +34,17 @@ async def lookup_record_sales(
         logger.warning("Perplexity API key not configured for record sales lookup")
         return None
     
+    return await cached_lookup(
+        "record_sales",
+        (album_or_track, artist),
+        lambda: _lookup_record_sales(album_or_track, artist, timeout),
+    )
+
+
+async def _lookup_record_sales(album_or_track: str, artist: str, timeout: float) -> Optional[str]:
+    """Ask Perplexity for the sales figure. Raises on request failure."""
+    settings = get_settings()
+    
     query = f"""How many copies has "{album_or_track}" by {artist} sold worldwide?
 
 Give me just the number in a simple format like "25 million copies" or "500,000 copies".
@@ -33,68 +52,43 @@ If it's an album, give album sales. If it's a single/track, give single sales.
 If you can't find exact sales data, say "UNKNOWN".
 Reply with ONLY the sales figure, nothing else."""
 
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.perplexity_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "sonar",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a music industry data assistant. Give concise sales figures only."
-                        },
-                        {"role": "user", "content": query},
-                    ],
-                    "max_tokens": 50,
-                    "temperature": 0.1,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data["choices"][0]["message"]["content"].strip()
-            
-            # Check if we got valid data
-            if "UNKNOWN" in result.upper() or len(result) > 100:
-                logger.info(f"No sales data found for {album_or_track}")
-                return None
-            
-            # Clean up the response - extract just the number part
-            # Look for patterns like "25 million", "500,000", "10M", etc.
-            result = result.replace("copies sold", "").replace("copies", "").strip()
-            result = re.sub(r'^(approximately|about|over|nearly|around)\s+', '', result, flags=re.IGNORECASE)
-            
-            if result and any(c.isdigit() for c in result):
-                logger.info(f"Found sales for {album_or_track}: {result}")
-                return f"{result} copies sold"
-            
+    await rate_limit.acquire("perplexity")
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.post(
+            "https://api.perplexity.ai/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.perplexity_api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": "sonar",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "You are a music industry data assistant. Give concise sales figures only."
+                    },
+                    {"role": "user", "content": query},
+                ],
+                "max_tokens": 50,
+                "temperature": 0.1,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data["choices"][0]["message"]["content"].strip()
+        
+        # Check if we got valid data
+        if "UNKNOWN" in result.upper() or len(result) > 100:
+            logger.info(f"No sales data found for {album_or_track}")
             return None
-            
-    except Exception as e:
-        logger.warning(f"Record sales lookup failed for {album_or_track}: {e}")
+        
+        # Clean up the response - extract just the number part
+        # Look for patterns like "25 million", "500,000", "10M", etc.
+        result = result.replace("copies sold", "").replace("copies", "").strip()
+        result = re.sub(r'^(approximately|about|over|nearly|around)\s+', '', result, flags=re.IGNORECASE)
+        
+        if result and any(c.isdigit() for c in result):
+            logger.info(f"Found sales for {album_or_track}: {result}")
+            return f"{result} copies sold"
+        
         return None
-
-
-async def lookup_sales_for_tracks(
-    popular_track: str,
-    popular_artist: str,
-    timeless_track: str,
-    timeless_artist: str,
-) -> Tuple[Optional[str], Optional[str]]:
-    """
-    Look up sales for both popular and timeless tracks in parallel.
-    
-    Returns (popular_sales, timeless_sales).
-    """
-    logger.info(f"Looking up record sales for: {popular_track}, {timeless_track}")
-    
-    popular_task = lookup_record_sales(popular_track, popular_artist)
-    timeless_task = lookup_record_sales(timeless_track, timeless_artist)
-    
-    popular_sales, timeless_sales = await asyncio.gather(popular_task, timeless_task)
-    
-    return popular_sales, timeless_sales
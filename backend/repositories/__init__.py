@@ -3,6 +3,11 @@
 from repositories.art_cache import ArtCacheRepository, art_cache_repository
 from repositories.emotion import EmotionRepository, emotion_repository
 from repositories.emotion_cache import EmotionCacheRepository, emotion_cache_repository
+from repositories.feedback import FeedbackRepository, feedback_repository
+from repositories.job import JobRepository, job_repository
+from repositories.lookup_cache import LookupCacheRepository, lookup_cache_repository
+from repositories.met_cache import MetCacheRepository, met_cache_repository
+from repositories.provider_answer import ProviderAnswerRepository, provider_answer_repository
 
 __all__ = [
     "ArtCacheRepository",
@@ -11,4 +16,14 @@ __all__ = [
     "emotion_repository",
     "EmotionCacheRepository",
     "emotion_cache_repository",
+    "FeedbackRepository",
+    "feedback_repository",
+    "JobRepository",
+    "job_repository",
+    "LookupCacheRepository",
+    "lookup_cache_repository",
+    "MetCacheRepository",
+    "met_cache_repository",
+    "ProviderAnswerRepository",
+    "provider_answer_repository",
 ]
@@ -1,14 +1,19 @@
 """Repository for ArtCache database operations."""
 
 import logging
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from database import ArtCache, get_session
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement (asyncpg allows at most 32767 bind parameters)
+UPSERT_BATCH_SIZE = 500
+
 
 class ArtCacheRepository:
     """Repository for art cache database operations."""
@@ -31,97 +36,167 @@ class ArtCacheRepository:
             logger.warning(f"Repository find_by_key failed: {e}")
             return None
 
-    async def save(self, entry: ArtCache) -> bool:
-        """Save or update a cache entry."""
-        try:
-            async for session in get_session():
-                session.add(entry)
-                await session.commit()
-                return True
-        except Exception as e:
-            logger.warning(f"Repository save failed: {e}")
-            return False
+    async def find_response(
+        self, decade: str, region: str, art_form: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        The pre-serialized response body for a key, without loading the row.
 
-    async def update_blog_urls(
-        self,
-        decade: str,
-        region: str,
-        art_form: str,
-        popular_blog_url: Optional[str] = None,
-        timeless_blog_url: Optional[str] = None,
-    ) -> bool:
-        """Update blog URLs for a cache entry."""
+        Returns (found, response_json): response_json is None for rows
+        written before the column existed.
+        """
         try:
             async for session in get_session():
                 result = await session.execute(
-                    select(ArtCache).where(
+                    select(ArtCache.response_json).where(
                         ArtCache.decade == decade,
                         ArtCache.region == region,
                         ArtCache.art_form == art_form,
                     )
                 )
-                cached = result.scalar_one_or_none()
-
-                if cached:
-                    if popular_blog_url:
-                        cached.popular_blog_url = popular_blog_url
-                    if timeless_blog_url:
-                        cached.timeless_blog_url = timeless_blog_url
-                    await session.commit()
-                    return True
-                return False
+                row = result.one_or_none()
+                if row is None:
+                    return False, None
+                return True, row.response_json
         except Exception as e:
-            logger.warning(f"Repository update_blog_urls failed: {e}")
-            return False
+            logger.warning(f"Repository find_response failed: {e}")
+            return False, None
 
-    async def delete_by_key(self, decade: str, region: str, art_form: str) -> bool:
-        """Delete cache entry by composite key."""
+    async def update_response(
+        self, decade: str, region: str, art_form: str, response_json: str, updated_at: datetime
+    ) -> bool:
+        """
+        Fill in the missing pre-serialized response body of an entry.
+
+        Only applies if the row is unchanged since it was read (same
+        updated_at), so a body built from an older copy never overwrites
+        a concurrent write.
+        """
         try:
             async for session in get_session():
                 result = await session.execute(
-                    select(ArtCache).where(
+                    update(ArtCache)
+                    .where(
                         ArtCache.decade == decade,
                         ArtCache.region == region,
                         ArtCache.art_form == art_form,
+                        ArtCache.response_json.is_(None),
+                        ArtCache.updated_at == updated_at,
                     )
+                    .values(response_json=response_json, updated_at=updated_at)
                 )
-                cached = result.scalar_one_or_none()
-
-                if cached:
-                    await session.delete(cached)
-                    await session.commit()
-                    return True
-                return False
+                await session.commit()
+                return result.rowcount > 0
         except Exception as e:
-            logger.warning(f"Repository delete_by_key failed: {e}")
+            logger.warning(f"Repository update_response failed: {e}")
             return False
 
-    async def find_all(self) -> list[ArtCache]:
-        """Find all cache entries."""
-        try:
-            async for session in get_session():
-                result = await session.execute(select(ArtCache))
-                return list(result.scalars().all())
-        except Exception as e:
-            logger.warning(f"Repository find_all failed: {e}")
-            return []
+    async def upsert(self, values: dict) -> None:
+        """
+        Insert or replace one entry in a single statement.
+
+        values maps column names to values and must include the key columns.
+        Raises on database errors.
+        """
+        await self.upsert_many([values])
+
+    async def upsert_many(self, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """
+        Insert or replace many entries with multi-row INSERT ... ON CONFLICT.
+
+        Rows are written batch_size at a time in one transaction. created_at
+        is kept for existing rows; timestamps default to now unless a row
+        provides them (e.g. when loading a snapshot). Returns rows written.
+        Raises on database errors (nothing is written then).
+        """
+        if not rows:
+            return 0
+        now = datetime.utcnow()
+        rows = [{"created_at": now, "updated_at": now, **row} for row in rows]
+        async for session in get_session():
+            for i in range(0, len(rows), batch_size):
+                stmt = insert(ArtCache).values(rows[i:i + batch_size])
+                updates = {
+                    name: stmt.excluded[name]
+                    for name in rows[0]
+                    if name not in ("decade", "region", "art_form", "created_at")
+                }
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["decade", "region", "art_form"], set_=updates
+                    )
+                )
+            await session.commit()
+            return len(rows)
 
-    async def delete_all(self) -> int:
-        """Delete all cache entries. Returns count of deleted entries."""
-        try:
-            async for session in get_session():
-                result = await session.execute(select(ArtCache))
-                entries = result.scalars().all()
-                count = len(entries)
+    async def update_blog_urls(
+        self,
+        decade: str,
+        region: str,
+        art_form: str,
+        popular_blog_url: Optional[str] = None,
+        timeless_blog_url: Optional[str] = None,
+    ) -> bool:
+        """
+        Set the given blog URLs on an entry and mark its blog search done,
+        in a single UPDATE.
+
+        Other columns are left as they are, so a concurrent regeneration or
+        backfill is never overwritten. The stored response body is cleared
+        and rebuilt from the columns on the next read. Returns False if the
+        entry does not exist. Raises on database errors.
+        """
+        values = {"response_json": None, "blogs_searched": True}
+        if popular_blog_url:
+            values["popular_blog_url"] = popular_blog_url
+        if timeless_blog_url:
+            values["timeless_blog_url"] = timeless_blog_url
+        async for session in get_session():
+            result = await session.execute(
+                update(ArtCache)
+                .where(
+                    ArtCache.decade == decade,
+                    ArtCache.region == region,
+                    ArtCache.art_form == art_form,
+                )
+                .values(**values)
+            )
+            await session.commit()
+            return result.rowcount > 0
 
-                for entry in entries:
-                    await session.delete(entry)
+    async def delete_by_key(self, decade: str, region: str, art_form: str) -> bool:
+        """Delete cache entry by composite key. Raises on database errors."""
+        async for session in get_session():
+            result = await session.execute(
+                delete(ArtCache).where(
+                    ArtCache.decade == decade,
+                    ArtCache.region == region,
+                    ArtCache.art_form == art_form,
+                )
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def find_all_keys(self) -> set[tuple[str, str, str]]:
+        """
+        Find the (decade, region, art_form) keys of all cache entries.
+
+        Raises on database errors, so an outage is never mistaken for an
+        empty cache.
+        """
+        async for session in get_session():
+            result = await session.execute(
+                select(ArtCache.decade, ArtCache.region, ArtCache.art_form)
+            )
+            return {tuple(row) for row in result.all()}
 
-                await session.commit()
-                return count
-        except Exception as e:
-            logger.warning(f"Repository delete_all failed: {e}")
-            return 0
+    async def delete_all(self) -> int:
+        """Delete all cache entries. Returns count of deleted entries. Raises on database errors."""
+        async for session in get_session():
+            # One statement; rows are never loaded into the session
+            result = await session.execute(delete(ArtCache))
+            await session.commit()
+            return result.rowcount
 
 
 # Singleton instance
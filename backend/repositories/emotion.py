@@ -1,14 +1,18 @@
 """Repository for Emotion database operations."""
 
 import logging
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select
 
 from database import Emotion, get_session
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement
+INSERT_BATCH_SIZE = 1000
+
 
 class EmotionRepository:
     """Repository for emotion database operations."""
@@ -61,8 +65,8 @@ class EmotionRepository:
         """Count all emotions."""
         try:
             async for session in get_session():
-                result = await session.execute(select(Emotion))
-                return len(result.scalars().all())
+                result = await session.execute(select(func.count()).select_from(Emotion))
+                return result.scalar_one()
         except Exception as e:
             logger.warning(f"Repository count failed: {e}")
             return 0
@@ -79,11 +83,18 @@ class EmotionRepository:
             return False
 
     async def save_many(self, emotions: list[Emotion]) -> bool:
-        """Save multiple emotions."""
+        """Save multiple emotions with multi-row INSERTs."""
+        if not emotions:
+            return True
+        now = datetime.utcnow()
+        rows = [
+            {"id": e.id, "name": e.name, "created_at": e.created_at or now}
+            for e in emotions
+        ]
         try:
             async for session in get_session():
-                for emotion in emotions:
-                    session.add(emotion)
+                for i in range(0, len(rows), INSERT_BATCH_SIZE):
+                    await session.execute(insert(Emotion).values(rows[i:i + INSERT_BATCH_SIZE]))
                 await session.commit()
                 return True
         except Exception as e:
@@ -94,12 +105,7 @@ class EmotionRepository:
         """Delete emotions by IDs."""
         try:
             async for session in get_session():
-                result = await session.execute(
-                    select(Emotion).where(Emotion.id.in_(ids))
-                )
-                emotions = result.scalars().all()
-                for emotion in emotions:
-                    await session.delete(emotion)
+                await session.execute(delete(Emotion).where(Emotion.id.in_(ids)))
                 await session.commit()
                 return True
         except Exception as e:
@@ -4,7 +4,7 @@ import json
 import logging
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 
 from database import EmotionCache, get_session
 
@@ -67,14 +67,10 @@ class EmotionCacheRepository:
             normalized = emotion.strip().lower()
             async for session in get_session():
                 result = await session.execute(
-                    select(EmotionCache).where(EmotionCache.emotion == normalized)
+                    delete(EmotionCache).where(EmotionCache.emotion == normalized)
                 )
-                cached = result.scalar_one_or_none()
-                if cached:
-                    await session.delete(cached)
-                    await session.commit()
-                    return True
-                return False
+                await session.commit()
+                return result.rowcount > 0
         except Exception as e:
             logger.warning(f"Repository delete failed: {e}")
             return False
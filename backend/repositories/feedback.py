@@ -0,0 +1,131 @@
+"""Repository for Feedback database operations."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from database import Feedback, FeedbackCount, get_session
+
+logger = logging.getLogger(__name__)
+
+
+def _counts(likes: int = 0, dislikes: int = 0) -> dict:
+    return {"likes": likes, "dislikes": dislikes}
+
+
+class FeedbackRepository:
+    """Repository for like/dislike feedback and its per-key counters."""
+
+    async def get_counts(self, decade: str, region: str, art_form: str) -> dict:
+        """Like/dislike totals for a key (a primary-key lookup)."""
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(FeedbackCount.likes, FeedbackCount.dislikes).where(
+                        FeedbackCount.decade == decade,
+                        FeedbackCount.region == region,
+                        FeedbackCount.art_form == art_form,
+                    )
+                )
+                row = result.one_or_none()
+                return _counts(row.likes, row.dislikes) if row else _counts()
+        except Exception as e:
+            logger.warning(f"Repository get_counts failed: {e}")
+            return _counts()
+
+    async def record(
+        self, decade: str, region: str, art_form: str, feedback: str
+    ) -> Optional[dict]:
+        """
+        Store one vote and bump its counter in the same transaction.
+
+        The counter is incremented in place with INSERT ... ON CONFLICT DO
+        UPDATE, so concurrent votes never lose updates. Returns the new
+        totals, or None if the vote could not be stored.
+        """
+        like = feedback == "like"
+        try:
+            async for session in get_session():
+                session.add(Feedback(
+                    decade=decade, region=region, art_form=art_form, feedback=feedback
+                ))
+                stmt = insert(FeedbackCount).values(
+                    decade=decade,
+                    region=region,
+                    art_form=art_form,
+                    likes=int(like),
+                    dislikes=int(not like),
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["decade", "region", "art_form"],
+                    set_={
+                        "likes": FeedbackCount.likes + stmt.excluded.likes,
+                        "dislikes": FeedbackCount.dislikes + stmt.excluded.dislikes,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                ).returning(FeedbackCount.likes, FeedbackCount.dislikes)
+                row = (await session.execute(stmt)).one()
+                await session.commit()
+                return _counts(row.likes, row.dislikes)
+        except Exception as e:
+            logger.warning(f"Repository record failed: {e}")
+            return None
+
+    async def find_all_keys(self) -> set[tuple[str, str, str]]:
+        """The distinct (decade, region, art_form) keys with votes. Raises on errors."""
+        async for session in get_session():
+            result = await session.execute(
+                select(Feedback.decade, Feedback.region, Feedback.art_form).distinct()
+            )
+            return {tuple(row) for row in result.all()}
+
+    async def move(self, source: tuple[str, str, str], target: tuple[str, str, str]) -> int:
+        """
+        Re-key a key's votes to another key and add its totals to target's.
+
+        Runs in one transaction. Returns the number of votes moved. Raises
+        on database errors.
+        """
+        async for session in get_session():
+            moved = await session.execute(
+                update(Feedback)
+                .where(
+                    Feedback.decade == source[0],
+                    Feedback.region == source[1],
+                    Feedback.art_form == source[2],
+                )
+                .values(decade=target[0], region=target[1], art_form=target[2])
+            )
+            counts = (await session.execute(
+                delete(FeedbackCount)
+                .where(
+                    FeedbackCount.decade == source[0],
+                    FeedbackCount.region == source[1],
+                    FeedbackCount.art_form == source[2],
+                )
+                .returning(FeedbackCount.likes, FeedbackCount.dislikes)
+            )).one_or_none()
+            if counts is not None:
+                stmt = insert(FeedbackCount).values(
+                    decade=target[0],
+                    region=target[1],
+                    art_form=target[2],
+                    likes=counts.likes,
+                    dislikes=counts.dislikes,
+                )
+                await session.execute(stmt.on_conflict_do_update(
+                    index_elements=["decade", "region", "art_form"],
+                    set_={
+                        "likes": FeedbackCount.likes + stmt.excluded.likes,
+                        "dislikes": FeedbackCount.dislikes + stmt.excluded.dislikes,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                ))
+            await session.commit()
+            return moved.rowcount
+
+
+# Singleton instance
+feedback_repository = FeedbackRepository()
@@ -0,0 +1,187 @@
+"""Repository for Job database operations."""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+from database import Job, get_session
+
+logger = logging.getLogger(__name__)
+
+
+class JobRepository:
+    """Repository for the durable job queue."""
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        dedupe_key: Optional[str] = None,
+        delay: float = 0.0,
+        max_attempts: int = 5,
+    ) -> bool:
+        """
+        Add a job to the queue.
+
+        Returns True if a job was added, False if a pending/running job with
+        the same dedupe key already exists. Raises if the database is down,
+        so callers can fall back to running the work in-process.
+        """
+        stmt = insert(Job).values(
+            job_type=job_type,
+            payload=json.dumps(payload),
+            dedupe_key=dedupe_key,
+            status="pending",
+            attempts=0,
+            max_attempts=max_attempts,
+            run_at=datetime.utcnow() + timedelta(seconds=delay),
+        )
+        if dedupe_key is not None:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[Job.dedupe_key],
+                index_where=text("status IN ('pending', 'running')"),
+            )
+        async for session in get_session():
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount > 0
+        return False
+
+    async def claim(self, job_type: str, limit: int, worker_id: str) -> list[Job]:
+        """
+        Claim up to `limit` due jobs of a type for this worker.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers on any
+        instance never claim the same job.
+        """
+        if limit <= 0:
+            return []
+        try:
+            async for session in get_session():
+                now = datetime.utcnow()
+                due = (
+                    select(Job.id)
+                    .where(
+                        Job.job_type == job_type,
+                        Job.status == "pending",
+                        Job.run_at <= now,
+                    )
+                    .order_by(Job.run_at)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                result = await session.execute(
+                    update(Job)
+                    .where(Job.id.in_(due.scalar_subquery()))
+                    .values(
+                        status="running",
+                        locked_at=now,
+                        locked_by=worker_id,
+                        attempts=Job.attempts + 1,
+                    )
+                    .returning(Job)
+                    .execution_options(synchronize_session=False)
+                )
+                jobs = list(result.scalars().all())
+                await session.commit()
+                return jobs
+        except Exception as e:
+            logger.warning(f"Repository claim failed: {e}")
+            return []
+
+    async def complete(self, job_id: int) -> bool:
+        """Remove a finished job from the queue."""
+        try:
+            async for session in get_session():
+                await session.execute(delete(Job).where(Job.id == job_id))
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository complete failed: {e}")
+            return False
+
+    async def fail(self, job: Job, error: str, retry_delay: float) -> bool:
+        """Record a failed attempt: reschedule after retry_delay, or give up."""
+        try:
+            async for session in get_session():
+                if job.attempts < job.max_attempts:
+                    values = {
+                        "status": "pending",
+                        "run_at": datetime.utcnow() + timedelta(seconds=retry_delay),
+                    }
+                else:
+                    values = {"status": "failed"}
+                await session.execute(
+                    update(Job)
+                    .where(Job.id == job.id)
+                    .values(locked_at=None, locked_by=None, last_error=error[:2000], **values)
+                )
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository fail failed: {e}")
+            return False
+
+    async def release(self, job: Job) -> bool:
+        """Return an interrupted job to the queue at once, without using up an attempt."""
+        try:
+            async for session in get_session():
+                await session.execute(
+                    update(Job)
+                    .where(Job.id == job.id, Job.status == "running")
+                    .values(
+                        status="pending",
+                        run_at=datetime.utcnow(),
+                        locked_at=None,
+                        locked_by=None,
+                        attempts=Job.attempts - 1,
+                    )
+                )
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository release failed: {e}")
+            return False
+
+    async def requeue_stale(self, job_type: str, older_than: float) -> int:
+        """Return jobs stuck in 'running' (e.g. their worker died) to the queue."""
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    update(Job)
+                    .where(
+                        Job.job_type == job_type,
+                        Job.status == "running",
+                        Job.locked_at < datetime.utcnow() - timedelta(seconds=older_than),
+                    )
+                    .values(status="pending", locked_at=None, locked_by=None)
+                )
+                await session.commit()
+                return result.rowcount
+        except Exception as e:
+            logger.warning(f"Repository requeue_stale failed: {e}")
+            return 0
+
+    async def count_by_status(self) -> dict[str, dict[str, int]]:
+        """Job counts as {job_type: {status: count}}."""
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(Job.job_type, Job.status, func.count())
+                    .group_by(Job.job_type, Job.status)
+                )
+                counts: dict[str, dict[str, int]] = {}
+                for job_type, status, count in result.all():
+                    counts.setdefault(job_type, {})[status] = count
+                return counts
+        except Exception as e:
+            logger.warning(f"Repository count_by_status failed: {e}")
+            return {}
+
+
+# Singleton instance
+job_repository = JobRepository()
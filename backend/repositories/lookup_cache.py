@@ -0,0 +1,73 @@
+"""Repository for LookupCache database operations."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from database import LookupCache, get_session
+
+logger = logging.getLogger(__name__)
+
+
+class LookupCacheRepository:
+    """Repository for cached external lookups."""
+
+    async def find(self, kind: str, args_hash: str) -> tuple[bool, Optional[str]]:
+        """
+        Unexpired cached value for a lookup.
+
+        Returns (found, value): value is None for a cached miss.
+        """
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(LookupCache.value).where(
+                        LookupCache.kind == kind,
+                        LookupCache.args_hash == args_hash,
+                        LookupCache.expires_at > datetime.utcnow(),
+                    )
+                )
+                row = result.one_or_none()
+                if row is None:
+                    return False, None
+                return True, row.value
+        except Exception as e:
+            logger.warning(f"Repository find failed: {e}")
+            return False, None
+
+    async def save(
+        self, kind: str, args_hash: str, args: str, value: Optional[str], ttl: float
+    ) -> bool:
+        """Insert or replace a cached value (None = nothing found), valid for ttl seconds."""
+        try:
+            async for session in get_session():
+                now = datetime.utcnow()
+                stmt = insert(LookupCache).values(
+                    kind=kind,
+                    args_hash=args_hash,
+                    args=args,
+                    value=value,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=ttl),
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["kind", "args_hash"],
+                    set_={
+                        "value": stmt.excluded.value,
+                        "created_at": stmt.excluded.created_at,
+                        "expires_at": stmt.excluded.expires_at,
+                    },
+                )
+                await session.execute(stmt)
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository save failed: {e}")
+            return False
+
+
+# Singleton instance
+lookup_cache_repository = LookupCacheRepository()
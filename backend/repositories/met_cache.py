@@ -0,0 +1,98 @@
+"""Repository for cached Met Collection API responses."""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from database import MetObject, MetSearch, get_session
+
+logger = logging.getLogger(__name__)
+
+
+class MetCacheRepository:
+    """Repository for Met search and object caches."""
+
+    async def find_search(self, query: str, max_age: float) -> Optional[list[int]]:
+        """Cached object IDs for a query, or None if not cached (or too old)."""
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(MetSearch.object_ids).where(
+                        MetSearch.query == query,
+                        MetSearch.created_at >= datetime.utcnow() - timedelta(seconds=max_age),
+                    )
+                )
+                row = result.scalar_one_or_none()
+                return json.loads(row) if row is not None else None
+        except Exception as e:
+            logger.warning(f"Repository find_search failed: {e}")
+            return None
+
+    async def save_search(self, query: str, object_ids: list[int]) -> bool:
+        """Insert or replace the cached object IDs for a query."""
+        try:
+            async for session in get_session():
+                stmt = insert(MetSearch).values(
+                    query=query, object_ids=json.dumps(object_ids), created_at=datetime.utcnow()
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["query"],
+                    set_={"object_ids": stmt.excluded.object_ids, "created_at": stmt.excluded.created_at},
+                )
+                await session.execute(stmt)
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository save_search failed: {e}")
+            return False
+
+    async def find_object(self, object_id: int, max_age: float) -> tuple[bool, Optional[dict]]:
+        """
+        Cached image fields for an object.
+
+        Returns (found, image): found is False if the object is not cached;
+        image is None if it is cached as having no image.
+        """
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(MetObject.image_json).where(
+                        MetObject.object_id == object_id,
+                        MetObject.created_at >= datetime.utcnow() - timedelta(seconds=max_age),
+                    )
+                )
+                row = result.one_or_none()
+                if row is None:
+                    return False, None
+                return True, json.loads(row.image_json) if row.image_json else None
+        except Exception as e:
+            logger.warning(f"Repository find_object failed: {e}")
+            return False, None
+
+    async def save_object(self, object_id: int, image: Optional[dict]) -> bool:
+        """Insert or replace an object's image fields (None = no image)."""
+        try:
+            async for session in get_session():
+                stmt = insert(MetObject).values(
+                    object_id=object_id,
+                    image_json=json.dumps(image) if image is not None else None,
+                    created_at=datetime.utcnow(),
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["object_id"],
+                    set_={"image_json": stmt.excluded.image_json, "created_at": stmt.excluded.created_at},
+                )
+                await session.execute(stmt)
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository save_object failed: {e}")
+            return False
+
+
+# Singleton instance
+met_cache_repository = MetCacheRepository()
@@ -0,0 +1,103 @@
+"""Repository for ProviderAnswer database operations."""
+
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
+
+from database import ProviderAnswer, get_session
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderAnswerRepository:
+    """Repository for stored provider answers."""
+
+    async def find_fresh(
+        self, decade: str, region: str, art_form: str, max_age: float
+    ) -> list[ProviderAnswer]:
+        """Stored answers for a key that are at most max_age seconds old."""
+        try:
+            async for session in get_session():
+                result = await session.execute(
+                    select(ProviderAnswer).where(
+                        ProviderAnswer.decade == decade,
+                        ProviderAnswer.region == region,
+                        ProviderAnswer.art_form == art_form,
+                        ProviderAnswer.created_at >= datetime.utcnow() - timedelta(seconds=max_age),
+                    )
+                )
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.warning(f"Repository find_fresh failed: {e}")
+            return []
+
+    async def save_many(self, rows: list[dict]) -> bool:
+        """Insert or replace answers (one dict of column values per answer)."""
+        if not rows:
+            return True
+        try:
+            async for session in get_session():
+                stmt = insert(ProviderAnswer).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["provider", "query_type", "decade", "region", "art_form"],
+                    set_={
+                        "genre": stmt.excluded.genre,
+                        "artists": stmt.excluded.artists,
+                        "example_work": stmt.excluded.example_work,
+                        "brief_reason": stmt.excluded.brief_reason,
+                        "created_at": stmt.excluded.created_at,
+                    },
+                )
+                await session.execute(stmt)
+                await session.commit()
+                return True
+        except Exception as e:
+            logger.warning(f"Repository save_many failed: {e}")
+            return False
+
+    async def find_all_keys(self) -> set[tuple[str, str, str]]:
+        """The distinct (decade, region, art_form) keys with stored answers. Raises on errors."""
+        async for session in get_session():
+            result = await session.execute(
+                select(ProviderAnswer.decade, ProviderAnswer.region, ProviderAnswer.art_form).distinct()
+            )
+            return {tuple(row) for row in result.all()}
+
+    async def move(self, source: tuple[str, str, str], target: tuple[str, str, str]) -> int:
+        """
+        Re-key a key's answers to another key, in one transaction.
+
+        Where both keys have an answer from the same provider and query
+        type, the newer one is kept. Returns the number of answers moved.
+        Raises on database errors.
+        """
+        columns = ["provider", "query_type", "decade", "region", "art_form",
+                   "genre", "artists", "example_work", "brief_reason", "created_at"]
+        where = (
+            ProviderAnswer.decade == source[0],
+            ProviderAnswer.region == source[1],
+            ProviderAnswer.art_form == source[2],
+        )
+        rows = select(
+            ProviderAnswer.provider, ProviderAnswer.query_type,
+            literal(target[0]), literal(target[1]), literal(target[2]),
+            ProviderAnswer.genre, ProviderAnswer.artists, ProviderAnswer.example_work,
+            ProviderAnswer.brief_reason, ProviderAnswer.created_at,
+        ).where(*where)
+        stmt = insert(ProviderAnswer).from_select(columns, rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["provider", "query_type", "decade", "region", "art_form"],
+            set_={name: stmt.excluded[name] for name in columns[5:]},
+            where=ProviderAnswer.created_at < stmt.excluded.created_at,
+        )
+        async for session in get_session():
+            await session.execute(stmt)
+            result = await session.execute(delete(ProviderAnswer).where(*where))
+            await session.commit()
+            return result.rowcount
+
+
+# Singleton instance
+provider_answer_repository = ProviderAnswerRepository()
@@ -0,0 +1,241 @@
+"""Round-trip check of a cache backend, e.g. before switching CACHE_BACKEND.
+
+Writes a throwaway entry (decade "check"), runs each backend operation
+against it and reports the result of every step:
+
+- set, get and get_response round trips
+- scan lists the key
+- concurrent reads all see the same entry
+- a read cancelled mid-command does not leave its reply to the next one
+- concurrent update_blog_urls calls both take effect and mark the blog search done
+- delete, then get and update_blog_urls find nothing
+
+clear() is never called, so it is safe against a shared cache.
+
+--stand-in runs the redis backend against a small in-process server that
+speaks the Redis protocol (GET/SET/DEL/SCAN, WATCH/MULTI/EXEC) with an artificial reply
+delay, so the backend can be checked locally without a Redis server.
+
+Usage:
+    python scripts/check_cache_backend.py redis              # REDIS_URL
+    python scripts/check_cache_backend.py redis --stand-in
+    python scripts/check_cache_backend.py sqlite
+    python scripts/check_cache_backend.py postgres
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cache_backends import CacheBackend, RedisBackend, create_backend
+from cache_backends.base import render_response
+from database import close_db, init_db
+from models import ArtData, ArtEntry
+
+# Seconds the stand-in waits before each reply, so cancellation lands mid-command
+STAND_IN_REPLY_DELAY = 0.05
+
+
+class StandInServer:
+    """In-process server for the subset of the Redis protocol the backend uses."""
+
+    def __init__(self):
+        self.store: Dict[bytes, bytes] = {}
+        # Bumped on every write, for WATCH
+        self.versions: Dict[bytes, int] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> str:
+        """Listen on a free local port. Returns its redis:// URL."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Per-connection WATCH versions and MULTI queue
+        session: dict = {"watched": {}, "queued": None}
+        try:
+            while True:
+                args = await self._read_command(reader)
+                reply = self._reply(session, args[0].upper(), args[1:])
+                await asyncio.sleep(STAND_IN_REPLY_DELAY)
+                writer.write(reply)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> List[bytes]:
+        count = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _reply(self, session: dict, command: bytes, args: List[bytes]) -> bytes:
+        if session["queued"] is not None and command != b"EXEC":
+            session["queued"].append((command, args))
+            return b"+QUEUED\r\n"
+        if command == b"WATCH":
+            session["watched"].update({k: self.versions.get(k, 0) for k in args})
+            return b"+OK\r\n"
+        if command == b"UNWATCH":
+            session["watched"] = {}
+            return b"+OK\r\n"
+        if command == b"MULTI":
+            session["queued"] = []
+            return b"+OK\r\n"
+        if command == b"EXEC":
+            queued, watched = session["queued"] or [], session["watched"]
+            session["queued"], session["watched"] = None, {}
+            if any(self.versions.get(k, 0) != v for k, v in watched.items()):
+                return b"*-1\r\n"
+            replies = [self._run(c, a) for c, a in queued]
+            return b"*%d\r\n" % len(replies) + b"".join(replies)
+        return self._run(command, args)
+
+    def _run(self, command: bytes, args: List[bytes]) -> bytes:
+        if command == b"GET":
+            return _bulk(self.store.get(args[0]))
+        if command == b"SET":
+            self.store[args[0]] = args[1]
+            self.versions[args[0]] = self.versions.get(args[0], 0) + 1
+            return b"+OK\r\n"
+        if command == b"DEL":
+            deleted = [k for k in args if self.store.pop(k, None) is not None]
+            for k in deleted:
+                self.versions[k] = self.versions.get(k, 0) + 1
+            return b":%d\r\n" % len(deleted)
+        if command == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [k for k in self.store if fnmatch.fnmatchcase(k.decode(), pattern)]
+            return b"*2\r\n" + _bulk(b"0") + b"*%d\r\n" % len(keys) + b"".join(map(_bulk, keys))
+        if command in (b"PING", b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        return b"-ERR unknown command '%s'\r\n" % command
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _entry(region: str) -> ArtData:
+    side = ArtEntry(genre="Check", artists="Checker", exampleWork="Check Work", description="Check")
+    return ArtData(decade="check", region=region, artForm="Music", popular=side, timeless=side)
+
+
+async def _checks(backend: CacheBackend) -> int:
+    """Run every check against backend. Returns the number that failed."""
+    data, other = _entry("Region A"), _entry("Region B")
+    key, other_key = ("check", "Region A", "Music"), ("check", "Region B", "Music")
+    failed = 0
+
+    async def step(name: str, check) -> None:
+        nonlocal failed
+        try:
+            ok = await check()
+        except Exception as e:
+            ok = False
+            name = f"{name} ({type(e).__name__}: {e})"
+        failed += not ok
+        print(f"  {'ok' if ok else 'FAILED':6} {name}")
+
+    async def cancelled_read() -> bool:
+        reader = asyncio.create_task(backend.get(key))
+        await asyncio.sleep(STAND_IN_REPLY_DELAY / 2)
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+        return await backend.get(other_key) == other
+
+    async def concurrent_reads() -> bool:
+        results = await asyncio.gather(*(backend.get(key) for _ in range(20)))
+        return all(result == data for result in results)
+
+    async def concurrent_blog_updates() -> bool:
+        await asyncio.gather(
+            backend.update_blog_urls(key, "https://example.com/popular", None),
+            backend.update_blog_urls(key, None, "https://example.com/timeless"),
+        )
+        updated = await backend.get(key)
+        return updated.blogsSearched and (updated.popular.blogUrl, updated.timeless.blogUrl) == (
+            "https://example.com/popular", "https://example.com/timeless"
+        ) and await backend.get_response(key) == render_response(updated)
+
+    async def set_both() -> bool:
+        await backend.set(data)
+        await backend.set(other)
+        return True
+
+    await step("set", set_both)
+    await step("get", lambda: _equal(backend.get(key), data))
+    await step("get_response", lambda: _equal(backend.get_response(key), render_response(data)))
+    await step("scan", lambda: _contains(backend.scan(), key))
+    await step("concurrent reads", concurrent_reads)
+    await step("cancelled read", cancelled_read)
+    await step("concurrent blog updates", concurrent_blog_updates)
+    await step("delete", lambda: _equal(backend.delete(key), True))
+    await step("get after delete", lambda: _equal(backend.get(key), None))
+    await step("update_blog_urls after delete",
+               lambda: _equal(backend.update_blog_urls(key, "https://example.com", None), False))
+    try:
+        await backend.delete(other_key)
+    except Exception as e:
+        print(f"  Could not remove the check entry {'/'.join(other_key)}: {e}")
+    return failed
+
+
+async def _equal(coro, expected) -> bool:
+    return await coro == expected
+
+
+async def _contains(coro, item) -> bool:
+    return item in await coro
+
+
+async def run(args: argparse.Namespace) -> int:
+    stand_in = None
+    if args.stand_in:
+        if args.backend != "redis":
+            raise SystemExit("--stand-in only applies to the redis backend")
+        stand_in = StandInServer()
+        backend = RedisBackend(await stand_in.start())
+    else:
+        if args.backend == "postgres":
+            await init_db()
+        backend = create_backend(args.backend)
+
+    print(f"Checking {backend.name} backend{' (stand-in server)' if stand_in else ''}")
+    failed = await _checks(backend)
+    await backend.close()
+    if stand_in is not None:
+        await stand_in.stop()
+    if args.backend == "postgres":
+        await close_db()
+    print("All checks passed" if not failed else f"{failed} checks failed")
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Round-trip check of a cache backend.")
+    parser.add_argument("backend", choices=["postgres", "sqlite", "redis", "memory"])
+    parser.add_argument("--stand-in", action="store_true",
+                        help="Check the redis backend against an in-process stand-in server")
+    args = parser.parse_args()
+    sys.exit(1 if asyncio.run(run(args)) else 0)
+
+
+if __name__ == "__main__":
+    main()
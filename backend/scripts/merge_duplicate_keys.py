@@ -0,0 +1,142 @@
+"""Merge cache entries stored under non-canonical keys.
+
+Before keys were canonicalized ("1960s" -> "1960", "western europe" ->
+"Western Europe", granular frontend regions -> backend regions), spelling
+variants got their own rows. This folds every variant into its canonical
+key, keeping the most complete entry, and reports how many canonical keys
+became servable from cache. That is key coverage, not request hit rate:
+no request log is kept to weigh keys by traffic.
+
+Stored provider answers (chrono_provider_answers, newest answer per
+provider kept) and feedback votes (feedback, with their feedback_counts
+totals added up) under variant keys are moved to the canonical key too.
+
+Usage:
+    python scripts/merge_duplicate_keys.py            # Merge
+    python scripts/merge_duplicate_keys.py --dry-run  # Only report
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cache import cache_layer
+from data import canonicalize
+from database import close_db, init_db
+from models import ArtData
+from repositories import feedback_repository, provider_answer_repository
+
+Key = tuple[str, str, str]
+
+
+def _completeness(data: ArtData) -> int:
+    """How many optional fields (media, sales, blogs) an entry has filled in."""
+    score = 0
+    for entry in (data.popular, data.timeless):
+        score += entry.image is not None
+        score += entry.youtube is not None
+        score += entry.youtube is not None and entry.youtube.recordSales is not None
+        score += entry.blogUrl is not None
+    return score
+
+
+async def merge(dry_run: bool) -> None:
+    await init_db()
+
+    keys = await cache_layer.keys()
+    groups: dict[Key, list[Key]] = defaultdict(list)
+    for key in keys:
+        groups[canonicalize(*key)].append(key)
+
+    # Canonical keys a request could hit before: only rows stored under
+    # exactly the canonical spelling were reachable.
+    reachable_before = sum(1 for canonical in groups if canonical in keys)
+    to_merge = {c: variants for c, variants in groups.items() if variants != [c]}
+
+    print(f"Rows: {len(keys)}, canonical keys: {len(groups)}, "
+          f"keys with variants to merge: {len(to_merge)}")
+
+    merged_rows = 0
+    newly_servable = 0
+    for canonical, variants in sorted(to_merge.items()):
+        entries = []
+        for key in variants:
+            data = await cache_layer.get(*key)
+            if data is not None:
+                entries.append((key, data))
+        if not entries:
+            print(f"  {'/'.join(canonical)}: no readable entry, skipped")
+            continue
+
+        # Most complete entry wins; on a tie, prefer the canonical row
+        best_key, best = max(entries, key=lambda e: (_completeness(e[1]), e[0] == canonical))
+        print(f"  {'/'.join(canonical)} <- {', '.join('/'.join(k) for k in variants)} "
+              f"(keeping {'/'.join(best_key)})")
+        if dry_run:
+            newly_servable += canonical not in keys
+            continue
+
+        decade, region, art_form = canonical
+        try:
+            # Through the backend, so a failed write raises instead of being logged
+            await cache_layer.backend.set(best.model_copy(update={
+                "decade": decade, "region": region, "artForm": art_form,
+            }))
+        except Exception as e:
+            print(f"  {'/'.join(canonical)}: writing the merged entry failed, variants kept: {e}")
+            continue
+        newly_servable += canonical not in keys
+        for key in variants:
+            if key == canonical:
+                continue
+            try:
+                merged_rows += await cache_layer.delete(*key)
+            except Exception as e:
+                print(f"  {'/'.join(key)}: deleting the variant failed: {e}")
+
+    after = reachable_before + newly_servable
+    total = len(groups) or 1
+    print(f"Canonical keys servable from cache: {reachable_before}/{len(groups)} "
+          f"({reachable_before / total:.0%}) -> {after}/{len(groups)} ({after / total:.0%})"
+          f"{' if merged' if dry_run else ''}, +{newly_servable} keys")
+    if not dry_run:
+        print(f"Removed {merged_rows} duplicate rows")
+
+    for table, repository in (
+        ("chrono_provider_answers", provider_answer_repository),
+        ("feedback", feedback_repository),
+    ):
+        moves = {
+            key: canonicalize(*key)
+            for key in await repository.find_all_keys()
+            if canonicalize(*key) != key
+        }
+        print(f"{table}: {len(moves)} keys stored under variant spellings")
+        for key, canonical in sorted(moves.items()):
+            if dry_run:
+                print(f"  {'/'.join(canonical)} <- {'/'.join(key)}")
+                continue
+            moved = await repository.move(key, canonical)
+            print(f"  {'/'.join(canonical)} <- {'/'.join(key)} ({moved} rows)")
+
+    if dry_run:
+        print("Dry run: nothing changed")
+
+    await cache_layer.close()
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge cache rows stored under non-canonical keys.")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be merged")
+    args = parser.parse_args()
+    asyncio.run(merge(args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Pre-generate cache entries over the decade x region x art form grid.
+
+Keys already present in chrono_art_cache are skipped, so an interrupted run
+can simply be started again and picks up where it stopped.
+
+Usage:
+    python scripts/prewarm.py                          # Full frontend grid
+    python scripts/prewarm.py --art-forms Music --decades 1960,1970
+    python scripts/prewarm.py --grid grid.json --concurrency 4
+    python scripts/prewarm.py --rate openai=60 --rate perplexity=30
+    python scripts/prewarm.py --dry-run                # Only list missing keys
+
+A grid file is JSON: either a list of [decade, region, artForm] keys, or an
+object {"decades": [...], "regions": [...], "artForms": [...]}.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rate_limit
+from art_service import art_service
+from cache import cache_layer
+from config import get_settings
+from data import validate_inputs
+from database import close_db, init_db
+from deadline import Deadline
+from supervisor import task_supervisor
+
+# Mirrors the frontend config (src/hooks/useConfig.ts), which is the source of
+# truth. Regions are the backend regions that regionToBackendRegion maps to.
+DEFAULT_DECADES = [
+    "1500", "1550", "1600", "1650", "1700", "1750", "1800", "1850",
+    "1900", "1910", "1920", "1930", "1940", "1950",
+    "1960", "1970", "1980", "1990", "2000", "2010", "2020",
+]
+DEFAULT_REGIONS = [
+    "Western Europe",
+    "Eastern Europe",
+    "North America",
+    "Latin America",
+    "East Asia",
+    "Middle East",
+    "Africa",
+]
+DEFAULT_ART_FORMS = ["Visual Arts", "Music", "Literature"]
+
+# Grace period for background work (blog search, backfills) before exiting
+BACKGROUND_GRACE_SECONDS = 60.0
+
+Key = tuple[str, str, str]
+
+
+def _split(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def load_grid(args: argparse.Namespace) -> list[Key]:
+    """Build the list of keys to warm from a grid file and/or flags."""
+    decades, regions, art_forms = DEFAULT_DECADES, DEFAULT_REGIONS, DEFAULT_ART_FORMS
+    keys: list[Key] = []
+
+    if args.grid:
+        grid = json.loads(Path(args.grid).read_text())
+        if isinstance(grid, list):
+            keys = [tuple(key) for key in grid]
+        else:
+            decades = grid.get("decades", decades)
+            regions = grid.get("regions", regions)
+            art_forms = grid.get("artForms", art_forms)
+
+    if args.decades:
+        decades = _split(args.decades)
+    if args.regions:
+        regions = _split(args.regions)
+    if args.art_forms:
+        art_forms = _split(args.art_forms)
+
+    if not keys:
+        keys = list(itertools.product(decades, regions, art_forms))
+
+    # Same sanitization as the API, so keys match what requests will look up
+    unique: dict[Key, None] = {}
+    for decade, region, art_form in keys:
+        try:
+            unique[validate_inputs(decade, region, art_form)] = None
+        except ValueError as e:
+            print(f"Skipping invalid key {decade}/{region}/{art_form}: {e}")
+    return list(unique)
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{seconds:02d}s"
+
+
+async def prewarm(args: argparse.Namespace) -> int:
+    """Warm all missing keys. Returns the number of keys that failed."""
+    if args.rate:
+        limits = rate_limit.parse_rate_limits(get_settings().provider_rate_limits)
+        limits.update(rate_limit.parse_rate_limits(",".join(args.rate)))
+        rate_limit.set_rate_limits(limits)
+
+    await init_db()
+    try:
+        return await _warm_missing(args)
+    finally:
+        await cache_layer.close()
+        await close_db()
+
+
+async def _warm_missing(args: argparse.Namespace) -> int:
+    """Generate the grid keys not cached yet. Returns the number that failed."""
+    grid = load_grid(args)
+    try:
+        existing = await cache_layer.keys()
+    except Exception as e:
+        # Without the key list every key would look missing and be regenerated
+        raise SystemExit(f"Could not list cached keys, nothing warmed: {e}")
+    todo = [key for key in grid if key not in existing]
+    print(f"Grid: {len(grid)} keys, {len(grid) - len(todo)} already cached, {len(todo)} to warm")
+
+    if args.dry_run:
+        for key in todo:
+            print("  " + "/".join(key))
+        return 0
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    started_at = time.monotonic()
+    done = 0
+    failed: list[Key] = []
+
+    async def warm(key: Key) -> None:
+        nonlocal done
+        async with semaphore:
+            key_started = time.monotonic()
+            try:
+                data = await art_service.get_art(*key, deadline=Deadline(args.deadline))
+            except Exception as e:
+                print(f"Error warming {'/'.join(key)}: {e}")
+                data = None
+            if data is not None and await cache_layer.get_response(*key) is None:
+                # Generated, but the cache write failed
+                print(f"Error warming {'/'.join(key)}: entry was not stored")
+                data = None
+
+            done += 1
+            if data is None:
+                failed.append(key)
+            elapsed = time.monotonic() - started_at
+            eta = elapsed / done * (len(todo) - done)
+            status = "ok" if data is not None else "FAILED"
+            print(
+                f"[{done}/{len(todo)}] {status} {'/'.join(key)} "
+                f"({time.monotonic() - key_started:.1f}s) | "
+                f"elapsed {_format_duration(elapsed)} | ETA {_format_duration(eta)}"
+            )
+
+    await asyncio.gather(*(warm(key) for key in todo))
+
+    # Let in-process background work started by get_art (backfills, blog
+    # searches when the job queue is unavailable) finish
+    await task_supervisor.drain(BACKGROUND_GRACE_SECONDS)
+
+    print(f"Prewarm complete: {done - len(failed)} warmed, {len(failed)} failed "
+          f"in {_format_duration(time.monotonic() - started_at)}")
+    for key in failed:
+        print(f"  failed: {'/'.join(key)}")
+    return len(failed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-generate art cache entries.")
+    parser.add_argument("--grid", help="JSON grid file (list of keys or decades/regions/artForms)")
+    parser.add_argument("--decades", help="Comma-separated decades (overrides grid)")
+    parser.add_argument("--regions", help="Comma-separated regions (overrides grid)")
+    parser.add_argument("--art-forms", help="Comma-separated art forms (overrides grid)")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="Keys generated at the same time (default: 2)")
+    parser.add_argument("--rate", action="append", default=[],
+                        help="Provider rate limit in requests/min, e.g. openai=60 (repeatable)")
+    parser.add_argument("--deadline", type=float, default=120.0,
+                        help="Time budget per key in seconds (default: 120)")
+    parser.add_argument("--dry-run", action="store_true", help="List missing keys and exit")
+    args = parser.parse_args()
+
+    failed = asyncio.run(prewarm(args))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Export and import cache table snapshots.
+
+A snapshot is gzip-compressed JSONL, one {"table": ..., "row": {...}} object
+per line. Importing upserts rows in batches on each table's primary key, so
+loading the same snapshot twice is harmless.
+
+Usage:
+    python scripts/snapshot.py export cache.jsonl.gz
+    python scripts/snapshot.py export music.jsonl.gz --art-form Music
+    python scripts/snapshot.py import cache.jsonl.gz
+    python scripts/snapshot.py import cache.jsonl.gz --decade 1960 --decade 1970
+    python scripts/snapshot.py import cache.jsonl.gz --tables chrono_art_cache
+
+--art-form / --decade only filter tables that have those columns
+(chrono_art_cache, chrono_provider_answers); other tables are copied whole
+unless excluded with --tables.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import DateTime, select
+from sqlalchemy.dialects.postgresql import insert
+
+from data import canonical_art_form, canonical_decade
+from database import (
+    ArtCache,
+    EmotionCache,
+    LookupCache,
+    MetObject,
+    MetSearch,
+    ProviderAnswer,
+    close_db,
+    get_session,
+    init_db,
+)
+from repositories import art_cache_repository
+
+# Tables that hold cached (regenerable) data, in load order
+CACHE_MODELS = [ArtCache, ProviderAnswer, EmotionCache, MetSearch, MetObject, LookupCache]
+MODELS_BY_TABLE = {model.__tablename__: model for model in CACHE_MODELS}
+
+BATCH_SIZE = 500
+
+
+def _selected_models(tables: list[str]) -> list:
+    if not tables:
+        return CACHE_MODELS
+    unknown = set(tables) - set(MODELS_BY_TABLE)
+    if unknown:
+        raise SystemExit(f"Unknown tables: {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(MODELS_BY_TABLE)})")
+    return [MODELS_BY_TABLE[t] for t in tables]
+
+
+def _matches(row: dict, art_forms: set[str], decades: set[str]) -> bool:
+    """Apply the --art-form / --decade filters to rows that have those columns."""
+    if art_forms and "art_form" in row and row["art_form"] not in art_forms:
+        return False
+    if decades and "decade" in row and row["decade"] not in decades:
+        return False
+    return True
+
+
+def _to_json(model, obj) -> dict:
+    row = {}
+    for column in model.__table__.columns:
+        value = getattr(obj, column.key)
+        row[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    return row
+
+
+def _from_json(model, row: dict) -> dict:
+    values = {}
+    for column in model.__table__.columns:
+        if column.name not in row:
+            continue
+        value = row[column.name]
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.name] = value
+    return values
+
+
+async def export_snapshot(args: argparse.Namespace) -> None:
+    await init_db()
+    started = time.monotonic()
+    art_forms = {canonical_art_form(a) for a in args.art_form}
+    decades = {canonical_decade(d) for d in args.decade}
+
+    with gzip.open(args.path, "wt", encoding="utf-8") as out:
+        for model in _selected_models(args.tables):
+            count = 0
+            async for session in get_session():
+                stmt = select(model)
+                if art_forms and hasattr(model, "art_form"):
+                    stmt = stmt.where(model.art_form.in_(art_forms))
+                if decades and hasattr(model, "decade"):
+                    stmt = stmt.where(model.decade.in_(decades))
+                # Stream rows instead of loading whole tables into memory
+                result = await session.stream(stmt.execution_options(yield_per=BATCH_SIZE))
+                async for obj in result.scalars():
+                    out.write(json.dumps({"table": model.__tablename__, "row": _to_json(model, obj)}))
+                    out.write("\n")
+                    count += 1
+            print(f"  {model.__tablename__}: {count} rows")
+
+    await close_db()
+    print(f"Exported to {args.path} in {time.monotonic() - started:.1f}s")
+
+
+async def _upsert(model, rows: list[dict]) -> None:
+    """Insert a batch, replacing rows that already exist (by primary key)."""
+    if model is ArtCache:
+        await art_cache_repository.upsert_many(rows)
+        return
+
+    stmt = insert(model).values(rows)
+    keys = [column.name for column in model.__table__.primary_key.columns]
+    updates = {
+        column.name: stmt.excluded[column.name]
+        for column in model.__table__.columns
+        if column.name not in keys
+    }
+    stmt = stmt.on_conflict_do_update(index_elements=keys, set_=updates)
+    async for session in get_session():
+        await session.execute(stmt)
+        await session.commit()
+
+
+async def import_snapshot(args: argparse.Namespace) -> None:
+    await init_db()
+    started = time.monotonic()
+    models = {model.__tablename__: model for model in _selected_models(args.tables)}
+    art_forms = {canonical_art_form(a) for a in args.art_form}
+    decades = {canonical_decade(d) for d in args.decade}
+
+    batches: dict[str, list[dict]] = {}
+    counts: dict[str, int] = {}
+
+    async def flush(table: str) -> None:
+        rows = batches.pop(table, [])
+        if rows:
+            await _upsert(models[table], rows)
+            counts[table] = counts.get(table, 0) + len(rows)
+
+    with gzip.open(args.path, "rt", encoding="utf-8") as snapshot:
+        for line in snapshot:
+            record = json.loads(line)
+            table, row = record["table"], record["row"]
+            if table not in models or not _matches(row, art_forms, decades):
+                continue
+            batch = batches.setdefault(table, [])
+            batch.append(_from_json(models[table], row))
+            if len(batch) >= BATCH_SIZE:
+                await flush(table)
+
+    for table in list(batches):
+        await flush(table)
+
+    await close_db()
+    for table, count in counts.items():
+        print(f"  {table}: {count} rows")
+    print(f"Imported {sum(counts.values())} rows from {args.path} "
+          f"in {time.monotonic() - started:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export/import cache table snapshots.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("path", help="Snapshot file (.jsonl.gz)")
+    parser.add_argument("--tables", nargs="+", default=[],
+                        help=f"Only these tables (default: all of {', '.join(MODELS_BY_TABLE)})")
+    parser.add_argument("--art-form", action="append", default=[],
+                        help="Only this art form (repeatable)")
+    parser.add_argument("--decade", action="append", default=[],
+                        help="Only this decade (repeatable)")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        asyncio.run(export_snapshot(args))
+    else:
+        asyncio.run(import_snapshot(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Single-flight coalescing of concurrent work on the same key."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from supervisor import TaskSupervisor
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Run at most one in-flight call per key.
+
+    The first caller for a key (the leader) starts the work as a task.
+    Callers arriving while it is still running (followers) await the same
+    task instead of starting their own, so N concurrent calls cost one run.
+
+    The task is shielded from caller cancellation: if the leader's client
+    disconnects, followers still get the result.
+
+    If a supervisor is given, runs are owned by it and drained on shutdown;
+    background runs started with spawn() also count against its cap.
+    """
+
+    def __init__(self, name: str = "single-flight", supervisor: Optional[TaskSupervisor] = None):
+        self.name = name
+        self.supervisor = supervisor
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() for key, or join the run already in flight for key."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._start(key, fn)
+        else:
+            self.coalesced += 1
+            logger.info(f"{self.name}: coalesced request for {key} onto in-flight run")
+
+        return await asyncio.shield(task)
+
+    def spawn(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start fn() for key in the background without waiting for it.
+
+        Returns False (and starts nothing) if a run for key is already in
+        flight or the supervisor has no capacity.
+        """
+        if key in self._in_flight:
+            self.coalesced += 1
+            return False
+        if self.supervisor is None:
+            self._track(key, asyncio.create_task(fn()))
+            return True
+        task = self.supervisor.spawn(fn(), name=f"{self.name}:{key}")
+        if task is None:
+            return False
+        self._track(key, task)
+        return True
+
+    def _start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start a run for key and track it until it completes."""
+        if self.supervisor is None:
+            return self._track(key, asyncio.create_task(fn()))
+        # Callers are waiting on this run, so it is never rejected
+        return self._track(key, self.supervisor.spawn(fn(), name=f"{self.name}:{key}", force=True))
+
+    def _track(self, key: Hashable, task: asyncio.Task) -> asyncio.Task:
+        """Register task as the in-flight run for key."""
+        self._in_flight[key] = task
+        self.started += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a completed run so the next call starts fresh."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve (and log) the exception even if every caller went away
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"{self.name}: run for {key} failed: {task.exception()}")
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "in_flight": len(self._in_flight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,95 @@
+"""Supervised background tasks, drained on shutdown."""
+
+import asyncio
+import logging
+from typing import Coroutine, Optional
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TaskSupervisor:
+    """
+    Owns fire-and-forget tasks for the lifetime of the app.
+
+    Keeps a strong reference to every task (the event loop only keeps weak
+    ones, so an unreferenced task can be garbage-collected mid-flight), caps
+    how many run at once, and on shutdown waits a bounded grace period for
+    them to finish before cancelling the rest, so the database engine is not
+    disposed under running writes.
+    """
+
+    def __init__(self, max_tasks: int):
+        self.max_tasks = max_tasks
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+        self.started = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+
+    def spawn(
+        self, coro: Coroutine, name: Optional[str] = None, force: bool = False
+    ) -> Optional[asyncio.Task]:
+        """
+        Start coro as a supervised task.
+
+        Returns None (and closes coro) if the supervisor is at capacity or
+        shutting down. force skips the capacity check, for work that is
+        already bounded elsewhere (claimed jobs, request-scoped streams), and
+        always returns a task: once shutting down, it is cancelled at once.
+        """
+        if not force and (self._closed or len(self._tasks) >= self.max_tasks):
+            coro.close()
+            self.rejected += 1
+            reason = "shutting down" if self._closed else f"{self.max_tasks} tasks running"
+            logger.warning(f"Background task {name or ''} rejected: {reason}")
+            return None
+
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        self.started += 1
+        task.add_done_callback(self._finish)
+        if self._closed:
+            logger.warning(f"Background task {name or ''} cancelled: shutting down")
+            task.cancel()
+        return task
+
+    def _finish(self, task: asyncio.Task) -> None:
+        """Drop the reference and log failures nobody else will see."""
+        self._tasks.discard(task)
+        if task.cancelled():
+            self.cancelled += 1
+        elif task.exception() is not None:
+            self.failed += 1
+            logger.warning(f"Background task {task.get_name()} failed: {task.exception()}")
+
+    async def drain(self, grace: float) -> None:
+        """Stop accepting tasks, wait up to grace seconds, then cancel the rest."""
+        self._closed = True
+        if not self._tasks:
+            return
+
+        logger.info(f"Draining {len(self._tasks)} background tasks (up to {grace:g}s)...")
+        _, pending = await asyncio.wait(set(self._tasks), timeout=grace)
+        if pending:
+            logger.warning(f"Cancelling {len(pending)} background tasks still running after {grace:g}s")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "running": len(self._tasks),
+            "max": self.max_tasks,
+            "started": self.started,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+        }
+
+
+# Singleton instance
+task_supervisor = TaskSupervisor(get_settings().background_task_limit)
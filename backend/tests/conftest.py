@@ -0,0 +1,50 @@
+"""Shared fixtures: every test runs against the in-memory cache backend."""
+
+import os
+import sys
+from pathlib import Path
+
+# Before any app module reads the settings
+os.environ["CACHE_BACKEND"] = "memory"
+# The OpenAI client refuses to be built without a key; no test calls it
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+# Add the backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from cache import cache_layer
+from cache_backends import MemoryBackend
+from models import ArtData, ArtEntry
+
+
+@pytest.fixture(autouse=True)
+def memory_cache():
+    """A fresh, empty cache layer for each test."""
+    cache_layer.backend = MemoryBackend()
+    cache_layer.l1.clear()
+    cache_layer.negative.clear()
+    yield cache_layer
+
+
+@pytest.fixture
+def make_entry():
+    """Factory for complete entries (nothing left to backfill) unless fields say otherwise."""
+    return _make_entry
+
+
+def _make_entry(
+    decade: str = "1960", region: str = "Western Europe", art_form: str = "Literature", **fields
+) -> ArtData:
+    side = ArtEntry(
+        genre="Nouveau roman",
+        artists="Alain Robbe-Grillet",
+        exampleWork="Jealousy",
+        description="A novel without a narrator.",
+        blogUrl="https://example.com/blog",
+    )
+    return ArtData(
+        decade=decade, region=region, artForm=art_form,
+        popular=side, timeless=side, mediaSearched=True, blogsSearched=True, **fields,
+    )
@@ -0,0 +1,139 @@
+"""L1 tier (LRU by bytes, TTL), negative cache back-off and the cache layer around them."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import cache
+from art_service import art_service
+from cache import L1Cache, NegativeCache
+
+
+class Clock:
+    """Stand-in for the cache module's clocks that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=clock, time=clock))
+    return clock
+
+
+@pytest.fixture
+def response(make_entry):
+    """Factory for cached responses, one per region."""
+    return lambda region: cache.CachedResponse.build(make_entry(region=region))
+
+
+def test_l1_evicts_least_recently_used_over_budget(response):
+    a, b, c = response("A"), response("B"), response("C")
+    l1 = L1Cache(max_bytes=len(a.body) + len(b.body) + len(c.body) - 1, ttl=60)
+
+    l1.put(("1960", "A", "Literature"), a)
+    l1.put(("1960", "B", "Literature"), b)
+    assert l1.get(("1960", "A", "Literature")) is a  # A is now the most recently used
+    l1.put(("1960", "C", "Literature"), c)
+
+    assert l1.get(("1960", "B", "Literature")) is None
+    assert l1.get(("1960", "A", "Literature")) is a
+    assert l1.get(("1960", "C", "Literature")) is c
+    stats = l1.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == len(a.body) + len(c.body)
+
+
+def test_l1_skips_entries_larger_than_the_budget(response):
+    a = response("A")
+    l1 = L1Cache(max_bytes=len(a.body) - 1, ttl=60)
+
+    l1.put(("1960", "A", "Literature"), a)
+
+    assert l1.get(("1960", "A", "Literature")) is None
+    assert l1.stats()["bytes"] == 0
+
+
+def test_l1_entries_expire_after_ttl(clock, response):
+    l1 = L1Cache(max_bytes=1 << 20, ttl=60)
+    l1.put(("1960", "A", "Literature"), response("A"))
+
+    clock.now += 59
+    assert l1.get(("1960", "A", "Literature")) is not None
+    clock.now += 2
+    assert l1.get(("1960", "A", "Literature")) is None
+    assert l1.stats() == {
+        "entries": 0, "bytes": 0, "max_bytes": 1 << 20, "hits": 1, "misses": 1, "evictions": 0,
+    }
+
+
+def test_negative_cache_backs_off_exponentially_up_to_the_cap(clock):
+    negative = NegativeCache(base_ttl=60, max_ttl=200)
+    key = ("1960", "Atlantis", "Music")
+
+    ttls = []
+    for _ in range(4):
+        entry = negative.record(key, "insufficient_providers")
+        ttls.append(entry["expires_at"] - clock.now)
+    assert ttls == [60, 120, 200, 200]
+    assert entry["failures"] == 4
+
+    clock.now += 199
+    assert negative.get(key) is not None
+    clock.now += 2
+    assert negative.get(key) is None
+
+
+def test_negative_cache_forgets_a_key_on_success(clock):
+    negative = NegativeCache(base_ttl=60, max_ttl=3600)
+    key = ("1960", "Atlantis", "Music")
+    negative.record(key, "insufficient_providers")
+
+    assert negative.discard(key)
+    assert negative.record(key, "insufficient_providers")["failures"] == 1
+
+
+async def test_get_art_does_not_retry_a_backing_off_key(memory_cache, monkeypatch):
+    async def generate(*args, **kwargs):
+        raise AssertionError("negative-cached key was regenerated")
+
+    monkeypatch.setattr(art_service, "_generate", generate)
+    memory_cache.record_failure("1960", "Atlantis", "Music", "insufficient_providers")
+
+    assert await art_service.get_art("1960", "Atlantis", "Music") is None
+
+
+async def test_set_fills_l1_only_after_the_backend_write(memory_cache, make_entry, monkeypatch):
+    data = make_entry()
+
+    async def failing_set(entry):
+        raise ConnectionError("backend down")
+
+    monkeypatch.setattr(memory_cache.backend, "set", failing_set)
+    assert not await memory_cache.set(data)
+    assert memory_cache.l1.get(("1960", "Western Europe", "Literature")) is None
+
+    monkeypatch.undo()
+    assert await memory_cache.set(data)
+    assert await memory_cache.get("1960", "Western Europe", "Literature") == data
+
+
+async def test_l1_hits_return_the_parsed_entry(memory_cache, make_entry):
+    await memory_cache.set(make_entry())
+
+    first = await memory_cache.get("1960", "Western Europe", "Literature")
+    second = await memory_cache.get("1960", "Western Europe", "Literature")
+
+    assert first is second
+
+
+async def test_delete_invalidates_l1(memory_cache, make_entry):
+    await memory_cache.set(make_entry())
+
+    assert await memory_cache.delete("1960", "Western Europe", "Literature")
+    assert await memory_cache.get("1960", "Western Europe", "Literature") is None
@@ -0,0 +1,89 @@
+"""ETag / If-None-Match and Cache-Control on /api/art."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from art_service import art_service
+from config import get_settings
+from main import app
+
+PARAMS = {"decade": "1960", "region": "Western Europe", "artForm": "Literature"}
+
+
+@pytest.fixture
+def client():
+    # No lifespan: the memory cache backend needs no database or job workers
+    return TestClient(app)
+
+
+@pytest.fixture
+async def cached(memory_cache, make_entry):
+    await memory_cache.set(make_entry())
+
+
+async def test_hit_carries_etag_and_long_max_age(client, cached):
+    response = client.get("/api/art", params=PARAMS)
+
+    assert response.status_code == 200
+    assert response.json()["found"] is True
+    assert response.headers["etag"].startswith('"')
+    settings = get_settings()
+    assert response.headers["cache-control"] == (
+        f"public, max-age={settings.art_cache_max_age}, "
+        f"stale-while-revalidate={settings.art_cache_stale_while_revalidate}"
+    )
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+async def test_matching_if_none_match_gets_empty_304(client, cached, if_none_match):
+    etag = client.get("/api/art", params=PARAMS).headers["etag"]
+
+    response = client.get(
+        "/api/art", params=PARAMS, headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_stale_etag_gets_the_body(client, cached):
+    response = client.get("/api/art", params=PARAMS, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["decade"] == "1960"
+
+
+async def test_etag_changes_with_the_entry(client, cached, memory_cache):
+    before = client.get("/api/art", params=PARAMS).headers["etag"]
+    await memory_cache.update_blog_urls(
+        "1960", "Western Europe", "Literature", popular_blog_url="https://example.com/new"
+    )
+
+    response = client.get("/api/art", params=PARAMS, headers={"If-None-Match": before})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != before
+
+
+async def test_entry_awaiting_backfill_gets_short_max_age(client, memory_cache, make_entry, monkeypatch):
+    monkeypatch.setattr(art_service, "_schedule_media_backfill", lambda *args: None)
+    await memory_cache.set(make_entry(skipped=["popular_image"]))
+
+    response = client.get("/api/art", params=PARAMS)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == (
+        f"public, max-age={get_settings().art_cache_pending_max_age}"
+    )
+
+
+async def test_not_found_is_not_stored(client, memory_cache):
+    memory_cache.record_failure("1960", "Western Europe", "Literature", "insufficient_providers")
+
+    response = client.get("/api/art", params=PARAMS)
+
+    assert response.status_code == 200
+    assert response.json() == {"data": None, "found": False}
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
@@ -0,0 +1,78 @@
+"""Provider quorum: return once enough providers answered, cancel the rest."""
+
+import asyncio
+
+import pytest
+
+import llm_providers
+from config import get_settings
+from llm_providers import FactCheckResponse, query_all_providers
+
+
+def fake_provider(name: str, delay: float, started: list, cancelled: list):
+    """A provider class answering after delay seconds, recording starts and cancellations."""
+
+    class FakeProvider:
+        def __init__(self, timeout: float):
+            self.name = name
+
+        async def _answer(self, query_type: str) -> FactCheckResponse:
+            started.append((name, query_type))
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append((name, query_type))
+                raise
+            return FactCheckResponse(name, query_type, "Jazz", "Artist", "Work", "reason", True)
+
+        async def query_popular(self, decade, region, art_form):
+            return await self._answer("popular")
+
+        async def query_timeless(self, decade, region, art_form):
+            return await self._answer("timeless")
+
+    return FakeProvider
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """Two fast providers and one that never answers in time."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "provider_quorum", 2)
+    monkeypatch.setattr(settings, "provider_quorum_deadline", 5.0)
+    monkeypatch.setattr(settings, "provider_cancel_stragglers", True)
+    monkeypatch.setattr(settings, "provider_hedging", False)
+    started, cancelled = [], []
+    monkeypatch.setattr(llm_providers, "OpenAIProvider", fake_provider("openai", 0.01, started, cancelled))
+    monkeypatch.setattr(llm_providers, "PerplexityProvider", fake_provider("perplexity", 0.02, started, cancelled))
+    monkeypatch.setattr(llm_providers, "XAIProvider", fake_provider("xai", 60.0, started, cancelled))
+    return started, cancelled
+
+
+async def test_returns_at_quorum_and_cancels_stragglers(providers):
+    started, cancelled = providers
+
+    popular, timeless = await asyncio.wait_for(
+        query_all_providers("1960", "Western Europe", "Music"), timeout=2.0
+    )
+    await asyncio.sleep(0)
+
+    for responses in (popular, timeless):
+        assert [r.provider for r in responses] == ["openai", "perplexity", "xai"]
+        assert [r.success for r in responses] == [True, True, False]
+        assert responses[2].timed_out
+    assert sorted(cancelled) == [("xai", "popular"), ("xai", "timeless")]
+
+
+async def test_cancelled_caller_cancels_every_provider_call(providers):
+    started, cancelled = providers
+    caller = asyncio.create_task(query_all_providers("1960", "Western Europe", "Music"))
+    while len(started) < 6:
+        await asyncio.sleep(0)
+
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0)
+
+    assert sorted(cancelled) == sorted(started)
@@ -0,0 +1,84 @@
+"""Coalescing of concurrent calls for the same key."""
+
+import asyncio
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_run():
+    flight = SingleFlight()
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert runs == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 9}
+
+
+async def test_different_keys_run_separately():
+    flight = SingleFlight()
+
+    async def work(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(flight.do("a", lambda: work(1)), flight.do("b", lambda: work(2)))
+
+    assert results == [1, 2]
+    assert flight.stats()["started"] == 2
+
+
+async def test_next_call_after_completion_starts_fresh():
+    flight = SingleFlight()
+
+    async def work():
+        return "result"
+
+    await flight.do("key", work)
+    await flight.do("key", work)
+
+    assert flight.stats() == {"in_flight": 0, "started": 2, "coalesced": 0}
+
+
+async def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider outage")
+
+    results = await asyncio.gather(
+        flight.do("key", work), flight.do("key", work), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_cancelled_leader_does_not_cancel_the_run():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "result"
+
+    leader = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await leader